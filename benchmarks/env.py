@@ -0,0 +1,47 @@
+# Benchmark for environment overhead of rasterio.open
+
+import timeit
+
+n = 1000
+
+s = """
+with rasterio.open('tests/data/RGB.byte.tif') as src:
+    pass
+"""
+
+# Rasterio, an environment for each call
+t = timeit.timeit(s, setup="import rasterio", number=n)
+print("Rasterio, no env:")
+print("%f usec\n" % (1000 * t / n))
+
+# Rasterio, within an Env
+t = timeit.timeit(
+    s,
+    setup="import rasterio; env = rasterio.Env(); env.__enter__()",
+    number=n,
+)
+print("Rasterio, within Env:")
+print("%f usec\n" % (1000 * t / n))
+
+# Rasterio, persistent environment
+t = timeit.timeit(
+    s,
+    setup="import rasterio, rasterio.env; rasterio.env.set_persistent_env()",
+    number=n,
+)
+print("Rasterio, persistent env:")
+print("%f usec\n" % (1000 * t / n))
+
+# Nested Env entry alone
+s = """
+with rasterio.Env():
+    pass
+"""
+
+t = timeit.timeit(
+    s,
+    setup="import rasterio, rasterio.env; rasterio.env.set_persistent_env()",
+    number=n,
+)
+print("Nested Env, persistent env:")
+print("%f usec\n" % (1000 * t / n))
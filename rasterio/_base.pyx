@@ -635,6 +635,23 @@ cdef class DatasetBase:
         cdef GDALRasterBandH band = NULL
         return tuple(GDALGetMaskFlags(self.band(j)) for j in self.indexes)
 
+    def _window_is_empty(self, bidx, window):
+        """Whether the format reports a band's window as empty.
+
+        Sparse GeoTIFF tiles and strips, for example, are empty. False
+        is returned when the format can't tell.
+        """
+        cdef GDALRasterBandH band = self.band(bidx)
+        cdef int xoff, yoff, xsize, ysize
+        cdef int status
+
+        window = windows.evaluate(window, self.height, self.width)
+        xoff, yoff, xsize, ysize = (int(val) for val in window.flatten())
+        with nogil:
+            status = GDALGetDataCoverageStatus(
+                band, xoff, yoff, xsize, ysize, 0, NULL)
+        return status == GDAL_DATA_COVERAGE_STATUS_EMPTY
+
     @property
     def mask_flag_enums(self):
         """Sets of flags describing the sources of band masks.
@@ -952,6 +969,54 @@ cdef class DatasetBase:
                 yield (j, i), windows.Window(
                     col_off=col, row_off=row, width=width, height=height)
 
+    def block_grid(self, bidx=0, window=None, bounds=None):
+        """Arrays of a band's blocks and their windows
+
+        This is the vectorized equivalent of `block_windows()`. Blocks
+        are ordered in the same way, "left to right" and "top to
+        bottom", but no Python objects are created for them, which
+        makes it practical to schedule work over the millions of blocks
+        of huge tiled rasters.
+
+        Blocks may be limited to those that intersect a window or
+        bounds. Only the blocks of the result are computed.
+
+        Parameters
+        ----------
+        bidx : int, optional
+            The band index (using 1-based indexing) from which to extract
+            windows. A value less than 1 uses the first band if all bands have
+            homogeneous windows and raises an exception otherwise.
+        window : Window, optional
+            Only blocks that intersect this window are returned.
+        bounds : tuple, optional
+            Only blocks that intersect these (left, bottom, right, top)
+            bounds are returned.
+
+        Returns
+        -------
+        blocks : numpy.ndarray
+            An int64 array of shape (n, 2) of block (row, col) indexes.
+        windows : WindowArray
+            The windows of the blocks.
+        """
+        block_shapes = self.block_shapes
+        if bidx < 1:
+            if len(set(block_shapes)) > 1:
+                raise ValueError(
+                    "A band index must be provided when band block shapes"
+                    "are inhomogeneous")
+            bidx = 1
+        if window is not None and bounds is not None:
+            raise ValueError("window and bounds may not be combined")
+
+        if bounds is not None:
+            window = windows.from_bounds(*bounds, transform=self.transform)
+        if window is not None:
+            window = windows.evaluate(window, self.height, self.width)
+        return windows._block_grid(
+            self.height, self.width, block_shapes[bidx-1], window=window)
+
     @property
     def bounds(self):
         """Returns the lower left and upper right bounds of the dataset
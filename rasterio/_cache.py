@@ -0,0 +1,65 @@
+"""A bounded, thread-safe, least recently used cache."""
+
+from collections import OrderedDict, namedtuple
+import threading
+
+_CacheInfo = namedtuple("_CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class _LRUCache:
+    """A bounded, thread-safe, least recently used cache.
+
+    Items are made by a factory when they are missing. Factories are
+    called without holding the cache's lock, so they may be slow. If
+    two threads make the same item at once, the first one stored is
+    kept. A cache with a maxsize of 0 is disabled and calls the factory
+    every time.
+    """
+
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, factory):
+        """Get the item of a key, calling factory() to make it if needed."""
+        if not self.maxsize:
+            return factory()
+
+        with self._lock:
+            obj = self._items.get(key)
+            if obj is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return obj
+            self.misses += 1
+
+        obj = factory()
+
+        with self._lock:
+            obj = self._items.setdefault(key, obj)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return obj
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._items) > maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        """Remove all items, reset the statistics, and return the items."""
+        with self._lock:
+            items = list(self._items.values())
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+        return items
+
+    def info(self):
+        with self._lock:
+            return _CacheInfo(self.hits, self.misses, self.maxsize, len(self._items))
@@ -39,3 +39,4 @@ cdef class ShapeIterator:
 
     cdef OGRLayerH layer
     cdef int fieldtype
+    cdef bint wkb
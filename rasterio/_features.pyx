@@ -1,13 +1,21 @@
 """Feature extraction"""
 
 import logging
+import sys
 import warnings
 from contextlib import ExitStack
 
 import numpy as np
 
+cimport cython
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
+from libc.math cimport INFINITY, fmax, fmin
+from libc.stdint cimport uint32_t
+from libc.string cimport memcpy
+
 from rasterio import dtypes
-from rasterio._err cimport exc_wrap_int, exc_wrap_pointer
+from rasterio._err cimport exc_wrap_int, exc_wrap_pointer, StackChecker
+from rasterio._err import stack_errors
 from rasterio._io cimport DatasetReaderBase, DatasetWriterBase, MemoryDataset, io_auto
 from rasterio.dtypes import (
     _getnpdtype,
@@ -31,7 +39,7 @@ from rasterio.errors import InvalidShapeError, ShapeSkipWarning
 log = logging.getLogger(__name__)
 
 
-def _shapes(image, mask, connectivity, transform):
+def _shapes(image, mask, connectivity, transform, format="geojson"):
     """
     Return a generator of (polygon, value) for each each set of adjacent pixels
     of the same value.
@@ -49,13 +57,17 @@ def _shapes(image, mask, connectivity, transform):
     transform : Affine
         If not provided, feature coordinates will be generated based on pixel
         coordinates
+    format : str
+        "geojson", "wkb", or "ragged".
 
     Returns
     -------
     Generator of (polygon, value)
         Yields a pair of (polygon, value) for each feature found in the image.
-        Polygons are GeoJSON-like dicts and the values are the associated value
-        from the image, in the data type of the image.
+        Polygons are GeoJSON-like dicts, or WKB bytes if format is "wkb",
+        and the values are the associated value from the image, in the data
+        type of the image. If format is "ragged", a single (coords,
+        offsets, values) tuple of arrays is yielded instead.
         Note: due to floating point precision issues, values returned from a
         floating point image may not exactly match the original values.
 
@@ -73,6 +85,7 @@ def _shapes(image, mask, connectivity, transform):
     cdef MemoryDataset mem_ds = None
     cdef MemoryDataset mask_ds = None
     cdef ShapeIterator shape_iter = None
+    cdef StackChecker checker
     cdef int fieldtp
     cdef bint is_float = _getnpdtype(image.dtype).kind == "f"
     cdef dict oft_dtypes = {
@@ -108,6 +121,9 @@ def _shapes(image, mask, connectivity, transform):
     if connectivity not in (4, 8):
         raise ValueError("Connectivity Option must be 4 or 8")
 
+    if format not in ("geojson", "wkb", "ragged"):
+        raise ValueError("format must be one of: geojson, wkb, ragged")
+
     with ExitStack() as exit_stack:
         if dtypes.is_ndarray(image):
             mem_ds = exit_stack.enter_context(MemoryDataset(image, transform=transform))
@@ -160,10 +176,15 @@ def _shapes(image, mask, connectivity, transform):
             if connectivity == 8:
                 options = CSLSetNameValue(options, "8CONNECTED", "8")
 
-            if is_float:
-                GDALFPolygonize(band, maskband, layer, 0, options, NULL, NULL)
-            else:
-                GDALPolygonize(band, maskband, layer, 0, options, NULL, NULL)
+            # Polygonization is done without the GIL so that other
+            # threads may run concurrently.
+            with stack_errors() as checker:
+                with nogil:
+                    if is_float:
+                        retval = GDALFPolygonize(band, maskband, layer, 0, options, NULL, NULL)
+                    else:
+                        retval = GDALPolygonize(band, maskband, layer, 0, options, NULL, NULL)
+                checker.exc_wrap_int(retval)
         finally:
             if options:
                 CSLDestroy(options)
@@ -173,8 +194,12 @@ def _shapes(image, mask, connectivity, transform):
         shape_iter = ShapeIterator()
         shape_iter.layer = layer
         shape_iter.fieldtype = fieldtp
-        for s, v in shape_iter:
-            yield s, v
+        shape_iter.wkb = format == "wkb"
+        if format == "ragged":
+            yield shape_iter.to_ragged_array()
+        else:
+            for s, v in shape_iter:
+                yield s, v
 
     finally:
         if fs != NULL:
@@ -211,6 +236,9 @@ def _sieve(image, size, out, mask, connectivity):
     cdef GDALRasterBandH in_band = NULL
     cdef GDALRasterBandH out_band = NULL
     cdef GDALRasterBandH mask_band = NULL
+    cdef int c_size
+    cdef int c_connectivity
+    cdef StackChecker checker
 
     valid_dtypes = (int16, int32, uint8, uint16)
 
@@ -299,10 +327,18 @@ def _sieve(image, size, out, mask, connectivity):
                 mask_reader = mask.ds
                 mask_band = (<DatasetReaderBase?>mask_reader).band(mask.bidx)
 
+        c_size = size
+        c_connectivity = connectivity
+
         for i, j in zip(src_bidx, dst_bidx):
             in_band = (<DatasetReaderBase?>src_dataset).band(i)
             out_band = (<DatasetReaderBase?>dst_dataset).band(j)
-            GDALSieveFilter(in_band, mask_band, out_band, size, connectivity, NULL, NULL, NULL)
+            with stack_errors() as checker:
+                with nogil:
+                    retval = GDALSieveFilter(
+                        in_band, mask_band, out_band, c_size, c_connectivity,
+                        NULL, NULL, NULL)
+                checker.exc_wrap_int(retval)
             io_auto(norm_out[i - 1], out_band, False)
 
     if return2d:
@@ -311,6 +347,129 @@ def _sieve(image, size, out, mask, connectivity):
     return norm_out
 
 
+cdef inline int _find_root(int[::1] parent, int x) noexcept nogil:
+    """Find the root of a label's set, halving the path to it."""
+    while parent[x] != x:
+        parent[x] = parent[parent[x]]
+        x = parent[x]
+    return x
+
+
+cdef inline int _join_roots(int[::1] parent, int a, int b) noexcept nogil:
+    """Join the sets of two labels and return the root.
+
+    The label a may be 0, in which case the root of b is returned.
+    """
+    b = _find_root(parent, b)
+    if a == 0:
+        return b
+    a = _find_root(parent, a)
+    if a < b:
+        parent[b] = a
+        return a
+    else:
+        parent[a] = b
+        return b
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _label_regions(image, mask, int connectivity):
+    """Label the connected regions of pixels of equal value.
+
+    Regions are found in two passes over the image using a union-find
+    structure of provisional labels. The labels of an image are always
+    the same, which lets the regions of a tile be labeled again instead
+    of stored.
+
+    Parameters
+    ----------
+    image : numpy.ndarray
+        2-D array of integers.
+    mask : numpy.ndarray or None
+        Pixels where the mask is False or 0 are not labeled.
+    connectivity : int
+        Use 4 or 8 pixel connectivity for grouping pixels into regions.
+
+    Returns
+    -------
+    labels : numpy.ndarray
+        2-D int32 array of labels, numbered from 1 in the order of the
+        first pixel of each region. Masked pixels are labeled 0.
+    count : int
+        The number of regions.
+
+    """
+    cdef long long[:, ::1] values = np.ascontiguousarray(image, dtype="int64")
+    cdef unsigned char[:, ::1] valid
+    cdef int[:, ::1] labels
+    cdef int[::1] parent
+    cdef int[::1] relabel
+    cdef Py_ssize_t rows = values.shape[0]
+    cdef Py_ssize_t cols = values.shape[1]
+    cdef Py_ssize_t i, j
+    cdef int label, root
+    cdef int count = 0
+    cdef long long value
+    cdef bint diagonal = connectivity == 8
+
+    if connectivity not in (4, 8):
+        raise ValueError("connectivity must be 4 or 8")
+
+    if mask is None:
+        valid_arr = np.ones((rows, cols), dtype="uint8")
+    else:
+        valid_arr = np.ascontiguousarray(mask, dtype="bool").view("uint8")
+        if valid_arr.shape != (rows, cols):
+            raise ValueError("Mask must have same shape as image")
+
+    valid = valid_arr
+    labels_arr = np.zeros((rows, cols), dtype="int32")
+    labels = labels_arr
+    parent_arr = np.zeros(rows * cols + 1, dtype="int32")
+    parent = parent_arr
+
+    with nogil:
+        for i in range(rows):
+            for j in range(cols):
+                if not valid[i, j]:
+                    continue
+                value = values[i, j]
+                label = 0
+                if j > 0 and labels[i, j - 1] and values[i, j - 1] == value:
+                    label = _join_roots(parent, label, labels[i, j - 1])
+                if i > 0:
+                    if labels[i - 1, j] and values[i - 1, j] == value:
+                        label = _join_roots(parent, label, labels[i - 1, j])
+                    if diagonal:
+                        if j > 0 and labels[i - 1, j - 1] and values[i - 1, j - 1] == value:
+                            label = _join_roots(parent, label, labels[i - 1, j - 1])
+                        if j < cols - 1 and labels[i - 1, j + 1] and values[i - 1, j + 1] == value:
+                            label = _join_roots(parent, label, labels[i - 1, j + 1])
+                if label == 0:
+                    count += 1
+                    parent[count] = count
+                    label = count
+                labels[i, j] = label
+
+    relabel_arr = np.zeros(count + 1, dtype="int32")
+    relabel = relabel_arr
+    count = 0
+
+    with nogil:
+        for i in range(rows):
+            for j in range(cols):
+                label = labels[i, j]
+                if label:
+                    root = _find_root(parent, label)
+                    if relabel[root] == 0:
+                        count += 1
+                        relabel[root] = count
+                    labels[i, j] = relabel[root]
+
+    return labels_arr, count
+
+
 def _rasterize(shapes, image, transform, all_touched, merge_alg, skip_invalid=True):
     """Burns input geometries into `image`.
 
@@ -319,7 +478,7 @@ def _rasterize(shapes, image, transform, all_touched, merge_alg, skip_invalid=Tr
     Parameters
     ----------
     shapes : iterable of (geometry, value) pairs
-        `geometry` is a GeoJSON-like object.
+        `geometry` is a GeoJSON-like object or WKB bytes.
     image : numpy.ndarray or open dataset object
         Array in which to store results.
     transform : Affine transformation object, optional
@@ -376,6 +535,8 @@ def _rasterize(shapes, image, transform, all_touched, merge_alg, skip_invalid=Tr
     cdef double *pixel_values = NULL
     cdef MemoryDataset mem = None
     cdef int *band_ids = NULL
+    cdef GDALDatasetH hds = NULL
+    cdef StackChecker checker
 
     try:
         if all_touched:
@@ -399,7 +560,10 @@ def _rasterize(shapes, image, transform, all_touched, merge_alg, skip_invalid=Tr
 
         for index, (geometry, value) in enumerate(all_shapes):
             try:
-                geoms[index] = OGRGeomBuilder().build(geometry)
+                if isinstance(geometry, (bytes, bytearray, memoryview)):
+                    geoms[index] = _ogr_geom_from_wkb(geometry)
+                else:
+                    geoms[index] = OGRGeomBuilder().build(geometry)
                 pixel_values[index] = <double>value
             except Exception as error:
                 if skip_invalid:
@@ -411,24 +575,32 @@ def _rasterize(shapes, image, transform, all_touched, merge_alg, skip_invalid=Tr
                     log.error("Invalid shape will not be rasterized: geometry=%r, index=%r, value=%r, error=%r", geometry, index, value, error)
                     raise InvalidShapeError("Invalid shape will not be rasterized") from error
 
+        # Geometries are burned in without the GIL so that other
+        # threads may run concurrently.
         if isinstance(image, DatasetWriterBase):
             band_ids = <int *>CPLMalloc(<int>image.count*sizeof(int))
             for i in range(<int>image.count):
                 band_ids[i] = i + 1
-            exc_wrap_int(
-                GDALRasterizeGeometries(
-                    <GDALDatasetH>((<DatasetWriterBase>image)._hds), 1, band_ids, num_geoms, geoms, NULL,
-                    NULL, pixel_values, options, NULL, NULL))
+            hds = <GDALDatasetH>((<DatasetWriterBase>image)._hds)
+            with stack_errors() as checker:
+                with nogil:
+                    retval = GDALRasterizeGeometries(
+                        hds, 1, band_ids, num_geoms, geoms, NULL,
+                        NULL, pixel_values, options, NULL, NULL)
+                checker.exc_wrap_int(retval)
         else:
             # TODO: is a vsimem file more memory efficient?
             with MemoryDataset(image, transform=transform) as mem:
                 band_ids = <int *>CPLMalloc(<int>mem.count*sizeof(int))
                 for i in range(<int>mem.count):
                     band_ids[i] = i + 1
-                exc_wrap_int(
-                    GDALRasterizeGeometries(
-                        mem.handle(), 1, band_ids, num_geoms, geoms, NULL,
-                        NULL, pixel_values, options, NULL, NULL))
+                hds = mem.handle()
+                with stack_errors() as checker:
+                    with nogil:
+                        retval = GDALRasterizeGeometries(
+                            hds, 1, band_ids, num_geoms, geoms, NULL,
+                            NULL, pixel_values, options, NULL, NULL)
+                    checker.exc_wrap_int(retval)
 
     finally:
         if geoms != NULL:
@@ -498,6 +670,137 @@ def _bounds(geometry, north_up=True, transform=None):
         return min(xmins), max(ymaxs), max(xmaxs), min(ymins)
 
 
+cdef inline void _extend_bounds(double *bounds, double *t, double x, double y) noexcept nogil:
+    """Extend bounds by a point transformed by affine coefficients."""
+    cdef double u = t[0] * x + t[1] * y + t[2]
+    cdef double v = t[3] * x + t[4] * y + t[5]
+    bounds[0] = fmin(bounds[0], u)
+    bounds[1] = fmin(bounds[1], v)
+    bounds[2] = fmax(bounds[2], u)
+    bounds[3] = fmax(bounds[3], v)
+
+
+cdef void _extend_transformed_bounds(OGRGeometryH geom, double *t, double *bounds) noexcept:
+    """Extend bounds by the transformed coordinates of a geometry."""
+    cdef int i
+    cdef int count = OGR_G_GetGeometryCount(geom)
+
+    if count:
+        for i in range(count):
+            _extend_transformed_bounds(OGR_G_GetGeometryRef(geom, i), t, bounds)
+    else:
+        for i in range(OGR_G_GetPointCount(geom)):
+            _extend_bounds(bounds, t, OGR_G_GetX(geom, i), OGR_G_GetY(geom, i))
+
+
+cdef int _ogr_geom_bounds(OGRGeometryH geom, object transform, double *bounds) except -1:
+    """Get the xmin, ymin, xmax, ymax of a geometry.
+
+    The envelope is used when there is no transform or the transform is
+    rectilinear. Otherwise the coordinates are transformed one by one.
+    Empty geometries have no bounds and raise ValueError.
+    """
+    cdef OGREnvelope envelope
+    cdef double t[6]
+
+    if OGR_G_IsEmpty(geom):
+        raise ValueError("Geometry has no coordinates")
+
+    if transform is not None:
+        t[0], t[1], t[2], t[3], t[4], t[5] = transform[:6]
+
+    if transform is None or transform.is_rectilinear:
+        OGR_G_GetEnvelope(geom, &envelope)
+        if transform is None:
+            bounds[0] = envelope.MinX
+            bounds[1] = envelope.MinY
+            bounds[2] = envelope.MaxX
+            bounds[3] = envelope.MaxY
+            return 0
+
+        # The transformed envelope is the envelope of the transformed
+        # geometry. All four corners are transformed because
+        # transforms rotated by 90 degrees swap the axes.
+        bounds[0] = bounds[1] = INFINITY
+        bounds[2] = bounds[3] = -INFINITY
+        _extend_bounds(bounds, t, envelope.MinX, envelope.MinY)
+        _extend_bounds(bounds, t, envelope.MinX, envelope.MaxY)
+        _extend_bounds(bounds, t, envelope.MaxX, envelope.MinY)
+        _extend_bounds(bounds, t, envelope.MaxX, envelope.MaxY)
+        return 0
+
+    bounds[0] = bounds[1] = INFINITY
+    bounds[2] = bounds[3] = -INFINITY
+    _extend_transformed_bounds(geom, t, bounds)
+    if bounds[0] > bounds[2]:
+        raise ValueError("Geometry has no coordinates")
+    return 0
+
+
+def _wkb_bounds(wkb, north_up=True, transform=None):
+    """Bounding box of a WKB geometry.
+
+    left, bottom, right, top
+    *not* xmin, ymin, xmax, ymax
+
+    If not north_up, y will be switched to guarantee the above. If a
+    transform is given, the geometry's coordinates are transformed
+    before the bounding box is calculated.
+    """
+    cdef OGRGeometryH geom = _ogr_geom_from_wkb(wkb)
+    cdef double bounds[4]
+
+    try:
+        _ogr_geom_bounds(geom, transform, bounds)
+    finally:
+        _deleteOgrGeom(geom)
+
+    if north_up:
+        return bounds[0], bounds[1], bounds[2], bounds[3]
+    else:
+        return bounds[0], bounds[3], bounds[2], bounds[1]
+
+
+def _wkb_bounds_array(wkbs, transform=None):
+    """Bounding boxes of a sequence of WKB geometries.
+
+    Returns an (N, 4) array of xmin, ymin, xmax, ymax. The row of a
+    geometry that can not be read is NaN. If a transform is given, the
+    geometries' coordinates are transformed before the bounding boxes
+    are calculated.
+    """
+    cdef Py_ssize_t i
+    cdef OGRGeometryH geom = NULL
+    cdef double[:, ::1] view
+
+    result = np.full((len(wkbs), 4), np.nan)
+    view = result
+
+    for i, wkb in enumerate(wkbs):
+        try:
+            geom = _ogr_geom_from_wkb(wkb)
+        except Exception:
+            continue
+        try:
+            _ogr_geom_bounds(geom, transform, &view[i, 0])
+        except ValueError:
+            view[i, :] = np.nan
+        finally:
+            _deleteOgrGeom(geom)
+
+    return result
+
+
+def _wkb_to_geojson(wkb):
+    """Convert a WKB geometry to a GeoJSON-like geometry."""
+    cdef OGRGeometryH geom = _ogr_geom_from_wkb(wkb)
+
+    try:
+        return GeomBuilder().build(geom)
+    finally:
+        _deleteOgrGeom(geom)
+
+
 # Mapping of OGR integer geometry types to GeoJSON type names.
 GEOMETRY_TYPES = {
     0: 'Unknown',
@@ -616,6 +919,21 @@ cdef class GeomBuilder:
             raise ValueError(f"Unsupported geometry type {self.geomtypename}")
 
 
+cdef OGRGeometryH _ogr_geom_from_wkb(object wkb) except NULL:
+    """Builds an OGR geometry from WKB bytes."""
+    cdef const unsigned char[::1] buf = wkb
+    cdef OGRGeometryH geom = NULL
+
+    if buf.shape[0] == 0:
+        raise ValueError("Input is not a valid WKB geometry")
+
+    if OGR_G_CreateFromWkbEx(&buf[0], NULL, &geom, buf.shape[0]) != 0 or geom == NULL:
+        _deleteOgrGeom(geom)
+        raise ValueError("Input is not a valid WKB geometry")
+
+    return geom
+
+
 cdef class OGRGeomBuilder:
     """
     Builds an OGR geometry from GeoJSON geometry.
@@ -779,11 +1097,241 @@ cdef class ShapeIterator:
             else:
                 image_value = OGR_F_GetFieldAsDouble(feat, 0)
             geom = OGR_F_GetGeometryRef(feat)
-            if geom != NULL:
-                shape = GeomBuilder().build(geom)
-            else:
+            if geom == NULL:
                 shape = None
+            elif self.wkb:
+                shape = _ogr_geom_to_wkb(geom)
+            else:
+                shape = GeomBuilder().build(geom)
             return shape, image_value
 
         finally:
             _deleteOgrFeature(feat)
+
+    def to_ragged_array(self):
+        """Get the polygons of the layer as coordinate and offset arrays.
+
+        The layer is read twice, first to count rings and points, then
+        to copy coordinates into preallocated arrays.
+
+        Returns
+        -------
+        coords : numpy.ndarray
+            An (N, 2) array of float64 coordinates.
+        offsets : tuple of numpy.ndarray
+            The coordinate offsets of rings and the ring offsets of
+            polygons, as with shapely.to_ragged_array().
+        values : numpy.ndarray
+            The image value of each polygon.
+        """
+        cdef OGRFeatureH feat = NULL
+        cdef OGRGeometryH geom = NULL
+        cdef OGRGeometryH ring = NULL
+        cdef Py_ssize_t num_polygons = 0
+        cdef Py_ssize_t num_rings = 0
+        cdef Py_ssize_t num_points = 0
+        cdef Py_ssize_t i = 0
+        cdef Py_ssize_t j = 0
+        cdef Py_ssize_t k = 0
+        cdef int r, p, nrings, npoints
+        cdef double[:, ::1] coords
+        cdef long long[::1] ring_offsets
+        cdef long long[::1] geom_offsets
+
+        OGR_L_ResetReading(self.layer)
+        while True:
+            feat = OGR_L_GetNextFeature(self.layer)
+            if feat == NULL:
+                break
+            geom = OGR_F_GetGeometryRef(feat)
+            if geom != NULL:
+                nrings = OGR_G_GetGeometryCount(geom)
+                num_rings += nrings
+                for r in range(nrings):
+                    num_points += OGR_G_GetPointCount(OGR_G_GetGeometryRef(geom, r))
+            num_polygons += 1
+            _deleteOgrFeature(feat)
+
+        coords_arr = np.empty((num_points, 2), dtype="float64")
+        ring_offsets_arr = np.empty(num_rings + 1, dtype="int64")
+        geom_offsets_arr = np.empty(num_polygons + 1, dtype="int64")
+        values = np.empty(num_polygons, dtype="int64" if self.fieldtype == 0 else "float64")
+        coords = coords_arr
+        ring_offsets = ring_offsets_arr
+        geom_offsets = geom_offsets_arr
+        ring_offsets[0] = 0
+        geom_offsets[0] = 0
+
+        OGR_L_ResetReading(self.layer)
+        while i < num_polygons:
+            feat = OGR_L_GetNextFeature(self.layer)
+            if feat == NULL:
+                break
+            try:
+                if self.fieldtype == 0:
+                    values[i] = OGR_F_GetFieldAsInteger(feat, 0)
+                else:
+                    values[i] = OGR_F_GetFieldAsDouble(feat, 0)
+                geom = OGR_F_GetGeometryRef(feat)
+                if geom != NULL:
+                    nrings = OGR_G_GetGeometryCount(geom)
+                    for r in range(nrings):
+                        ring = OGR_G_GetGeometryRef(geom, r)
+                        npoints = OGR_G_GetPointCount(ring)
+                        for p in range(npoints):
+                            coords[k, 0] = OGR_G_GetX(ring, p)
+                            coords[k, 1] = OGR_G_GetY(ring, p)
+                            k += 1
+                        j += 1
+                        ring_offsets[j] = k
+                i += 1
+                geom_offsets[i] = j
+            finally:
+                _deleteOgrFeature(feat)
+
+        return coords_arr, (ring_offsets_arr, geom_offsets_arr), values
+
+
+cdef bytes _ogr_geom_to_wkb(OGRGeometryH geom):
+    """Export an OGR geometry as little-endian WKB bytes."""
+    cdef int size = OGR_G_WkbSize(geom)
+    cdef unsigned char *buf = <unsigned char *>CPLMalloc(size)
+
+    try:
+        OGR_G_ExportToWkb(geom, 1, <char *>buf)
+        return buf[:size]
+    finally:
+        CPLFree(buf)
+
+
+def _geojson_to_wkb(geometry):
+    """Convert a GeoJSON-like geometry to WKB bytes."""
+    cdef OGRGeometryH geom = OGRGeomBuilder().build(geometry)
+
+    try:
+        return _ogr_geom_to_wkb(geom)
+    finally:
+        _deleteOgrGeom(geom)
+
+
+cdef inline unsigned char *_put_uint32(unsigned char *buf, uint32_t value) noexcept nogil:
+    """Write a WKB integer in the native byte order."""
+    memcpy(buf, &value, 4)
+    return buf + 4
+
+
+cdef class _RaggedWKBWriter:
+    """Writes WKB geometries from GeoArrow coordinate and offset arrays.
+
+    The offset arrays of the "separated" encoding are, from the
+    innermost: offsets of coordinates, offsets of rings or line
+    strings, and offsets of polygons. Geometries are written in the
+    native byte order, and the offsets must have been checked.
+    """
+
+    cdef int code
+    cdef int ndim
+    cdef uint32_t zflag
+    cdef unsigned char order
+    cdef double[:, ::1] coords
+    cdef long long[::1] coord_offsets
+    cdef long long[::1] part_offsets
+    cdef long long[::1] polygon_offsets
+
+    def __init__(self, code, coords, offsets):
+        empty = np.zeros(1, dtype="int64")
+        offsets = list(offsets) + [empty] * (3 - len(offsets))
+        self.code = code
+        self.coords = np.ascontiguousarray(coords, dtype="float64")
+        self.ndim = self.coords.shape[1]
+        self.zflag = 1000 if self.ndim == 3 else 0
+        self.order = 1 if sys.byteorder == "little" else 0
+        self.coord_offsets = np.ascontiguousarray(offsets[0], dtype="int64")
+        self.part_offsets = np.ascontiguousarray(offsets[1], dtype="int64")
+        self.polygon_offsets = np.ascontiguousarray(offsets[2], dtype="int64")
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef Py_ssize_t _parts(self, int code, Py_ssize_t i, Py_ssize_t *stop) noexcept nogil:
+        """Get the range of a geometry's coordinates, rings, or parts."""
+        if code == 2 or code == 4:
+            stop[0] = self.coord_offsets[i + 1]
+            return self.coord_offsets[i]
+        elif code == 3 or code == 5:
+            stop[0] = self.part_offsets[i + 1]
+            return self.part_offsets[i]
+        else:
+            stop[0] = self.polygon_offsets[i + 1]
+            return self.polygon_offsets[i]
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef Py_ssize_t _size(self, int code, Py_ssize_t i) noexcept nogil:
+        """Get the size in bytes of a geometry's WKB."""
+        cdef Py_ssize_t j, start, stop
+        cdef Py_ssize_t point_size = 8 * self.ndim
+        cdef Py_ssize_t size = 9
+
+        if code == 1:
+            return 5 + point_size
+
+        start = self._parts(code, i, &stop)
+        if code == 2:
+            size += (stop - start) * point_size
+        elif code == 3:
+            for j in range(start, stop):
+                size += 4 + (self.coord_offsets[j + 1] - self.coord_offsets[j]) * point_size
+        else:
+            for j in range(start, stop):
+                size += self._size(code - 3, j)
+        return size
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef unsigned char *_write(self, int code, Py_ssize_t i, unsigned char *buf) noexcept nogil:
+        """Write a geometry's WKB and return the end of it."""
+        cdef Py_ssize_t j, k, start, stop
+        cdef Py_ssize_t point_size = 8 * self.ndim
+
+        buf[0] = self.order
+        buf = _put_uint32(buf + 1, code + self.zflag)
+
+        if code == 1:
+            memcpy(buf, &self.coords[i, 0], point_size)
+            return buf + point_size
+
+        start = self._parts(code, i, &stop)
+        buf = _put_uint32(buf, stop - start)
+        if code == 2:
+            if stop > start:
+                memcpy(buf, &self.coords[start, 0], (stop - start) * point_size)
+            buf += (stop - start) * point_size
+        elif code == 3:
+            for j in range(start, stop):
+                k = self.coord_offsets[j]
+                buf = _put_uint32(buf, self.coord_offsets[j + 1] - k)
+                if self.coord_offsets[j + 1] > k:
+                    memcpy(buf, &self.coords[k, 0], (self.coord_offsets[j + 1] - k) * point_size)
+                buf += (self.coord_offsets[j + 1] - k) * point_size
+        else:
+            for j in range(start, stop):
+                buf = self._write(code - 3, j, buf)
+        return buf
+
+    def build(self, Py_ssize_t start, Py_ssize_t stop):
+        """Make the WKB of geometries start to stop.
+
+        Returns
+        -------
+        list of bytes
+        """
+        cdef Py_ssize_t i
+        cdef bytes wkb
+        result = []
+
+        for i in range(start, stop):
+            wkb = PyBytes_FromStringAndSize(NULL, self._size(self.code, i))
+            self._write(self.code, i, <unsigned char *>PyBytes_AS_STRING(wkb))
+            result.append(wkb)
+
+        return result
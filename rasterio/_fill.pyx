@@ -8,7 +8,8 @@ include "gdal.pxi"
 from contextlib import ExitStack
 
 import numpy as np
-from rasterio._err cimport exc_wrap_int
+from rasterio._err cimport StackChecker
+from rasterio._err import stack_errors
 from rasterio._io cimport MemoryDataset
 
 
@@ -24,6 +25,8 @@ def _fillnodata(
     cdef char **alg_options = NULL
     cdef MemoryDataset image_dataset = None
     cdef MemoryDataset mask_dataset = None
+    cdef StackChecker checker
+    cdef int retval
 
     with ExitStack() as exit_stack:
         # copy numpy ndarray into an in-memory dataset.
@@ -44,18 +47,21 @@ def _fillnodata(
             if CSLFindName(alg_options, "TEMP_FILE_DRIVER") < 0:
                 alg_options = CSLSetNameValue(alg_options, "TEMP_FILE_DRIVER", "MEM")
 
-            exc_wrap_int(
-                GDALFillNodata(
-                    image_band,
-                    mask_band,
-                    max_search_distance,
-                    0,
-                    smoothing_iterations,
-                    alg_options,
-                    NULL,
-                    NULL
-                )
-            )
+            # Filling is done without the GIL so that other threads may
+            # run concurrently.
+            with stack_errors() as checker:
+                with nogil:
+                    retval = GDALFillNodata(
+                        image_band,
+                        mask_band,
+                        max_search_distance,
+                        0,
+                        smoothing_iterations,
+                        alg_options,
+                        NULL,
+                        NULL
+                    )
+                checker.exc_wrap_int(retval)
             return np.asarray(image_dataset)
         finally:
             if image_dataset is not None:
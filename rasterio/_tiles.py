@@ -0,0 +1,99 @@
+"""Planning and processing of tiles of rasters."""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import logging
+import math
+
+from rasterio.windows import subdivide
+
+log = logging.getLogger(__name__)
+
+
+def _chunk_plan(window, max_pixels, block_shape=None):
+    """Divide an output window into chunks for processing.
+
+    When the block shape of the destination dataset is known, chunks
+    are whole multiples of its blocks so that no block is written by
+    more than one chunk. Chunks span full rows of blocks when that fits
+    within the limit, as is the case for most striped datasets.
+
+    Parameters
+    ----------
+    window : Window
+        The full output window, with zero offsets.
+    max_pixels : float
+        Maximum number of pixels in a chunk. A chunk will always
+        contain at least one block.
+    block_shape : tuple, optional
+        The (height, width) of the destination's blocks.
+
+    Returns
+    -------
+    list of Windows
+    """
+    if window.width * window.height < max_pixels:
+        chunks = [window]
+    elif block_shape is None:
+        n = max(1, math.floor(math.sqrt(max_pixels)))
+        chunks = subdivide(window, n, n)
+    else:
+        block_height, block_width = block_shape
+        blocks_per_row = math.ceil(window.width / block_width)
+        max_blocks = max(1, math.floor(max_pixels / (block_height * block_width)))
+
+        if max_blocks >= blocks_per_row:
+            height = (max_blocks // blocks_per_row) * block_height
+            width = window.width
+        else:
+            n = math.sqrt(max_pixels)
+            nrows = max(1, math.floor(n / block_height))
+            ncols = max(1, min(math.floor(n / block_width), max_blocks // nrows))
+            height = nrows * block_height
+            width = ncols * block_width
+
+        chunks = subdivide(window, height, width)
+
+    log.debug(
+        "Chunk plan: %d chunks of up to %dx%d pixels aligned to %r blocks",
+        len(chunks),
+        max(chunk.height for chunk in chunks),
+        max(chunk.width for chunk in chunks),
+        block_shape,
+    )
+    return chunks
+
+
+def _imap_tiles(func, items, num_threads):
+    """Apply a function to items in a pool of threads.
+
+    Items are taken from their iterable by the calling thread, no more
+    than two per thread ahead of the results, so that tiles can be read
+    and written by the calling thread only while memory stays bounded.
+
+    Parameters
+    ----------
+    func : callable
+        Function of one item.
+    items : iterable
+        The items.
+    num_threads : int
+        Number of threads.
+
+    Yields
+    ------
+    object
+        The result of each item, in the order they are completed.
+    """
+    with ThreadPoolExecutor(max_workers=num_threads) as pool:
+        items = iter(items)
+        pending = set()
+        while True:
+            for item in items:
+                pending.add(pool.submit(func, item))
+                if len(pending) >= 2 * num_threads:
+                    break
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -6,6 +6,7 @@ include "gdal.pxi"
 
 from contextlib import ExitStack
 import logging
+import threading
 import warnings
 
 import numpy as np
@@ -16,6 +17,71 @@ from rasterio.errors import NotGeoreferencedWarning, TransformWarning
 
 log = logging.getLogger(__name__)
 
+ctypedef int (*transform_func)(
+    void *, int, int, double *, double *, double *, int *) noexcept nogil
+
+
+cdef _transform_points(
+    transform_func func, void *transformer, int bDstToSrc, bint by_rows,
+    xs, ys, zs, str model
+):
+    """Transform coordinates with a GDAL transformer function.
+
+    The GIL is released during the transformation. If by_rows is True,
+    runs of points of equal y and z are transformed one run at a time,
+    which lets GDAL's approximate transformer interpolate along them.
+
+    Returns
+    -------
+    tuple of ndarray
+    """
+    cdef Py_ssize_t n, start, stop
+    cdef double[::1] x, y, z
+    cdef int[::1] success
+    cdef int err = 0
+    cdef int failure = GDALError.failure
+    cdef bint failed = False
+
+    res_xs, res_ys, res_zs = (
+        np.array(arr, dtype="float64").reshape(-1)
+        for arr in np.broadcast_arrays(xs, ys, zs)
+    )
+    n = res_xs.size
+    pan_success = np.ones(n, dtype=np.intc)
+    x = res_xs
+    y = res_ys
+    z = res_zs
+    success = pan_success
+
+    with nogil:
+        start = 0
+        while start < n:
+            stop = start + 1
+            if by_rows:
+                while stop < n and y[stop] == y[start] and z[stop] == z[start]:
+                    stop += 1
+            else:
+                stop = n
+            err = func(
+                transformer, bDstToSrc, <int>(stop - start),
+                &x[start], &y[start], &z[start], &success[start])
+            if err == failure:
+                failed = True
+            start = stop
+
+    if failed:
+        warnings.warn(
+            "Could not transform points using {}.".format(model),
+            TransformWarning)
+    # GDAL transformers may return a success overall despite
+    # individual points failing. Warn once.
+    if not pan_success.all():
+        warnings.warn(
+            "One or more points could not be transformed using {}.".format(model),
+            TransformWarning)
+
+    return (res_xs, res_ys)
+
 
 def _transform_from_gcps(gcps):
     cdef double gt[6]
@@ -51,14 +117,19 @@ cdef class RPCTransformerBase:
     Rational Polynomial Coefficients (RPC) transformer base class
     """
     cdef void *_transformer
+    cdef void *_approx
+    cdef object _lock
 
     def __cinit__(self):
         self._transformer = NULL
+        self._approx = NULL
+        self._lock = threading.Lock()
 
     def __dealloc__(self):
-        self.close()
+        # No other thread can be using the transformer.
+        self._destroy()
 
-    def __init__(self, rpcs, **kwargs):
+    def __init__(self, rpcs, max_error=None, **kwargs):
         """
         Construct a new RPC transformer
 
@@ -71,6 +142,10 @@ cdef class RPCTransformerBase:
         rpcs : rasterio.rpc.RPC or dict
             RPCs for a dataset. If passing a dict, should be in the form expected
             by rasterio.rpc.RPC.from_gdal.
+        max_error : float, optional
+            If set, use GDAL's approximate transformer, which interpolates
+            along rows of points of equal y, with this maximum error in
+            units of the output coordinates.
         kwargs : dict
             GDALCreateRPCTransformer options. See
             https://gdal.org/api/gdal_alg.html#_CPPv426GDALCreateRPCTransformerV2PK13GDALRPCInfoV2idPPc.
@@ -121,6 +196,10 @@ cdef class RPCTransformerBase:
         try:
             GDALExtractRPCInfo(papszMD, &rpcinfo)
             self._transformer = exc_wrap_pointer(GDALCreateRPCTransformer(&rpcinfo, bReversed, dfPixErrThreshold, options))
+            if max_error is not None:
+                self._approx = exc_wrap_pointer(
+                    GDALCreateApproxTransformer(
+                        GDALRPCTransform, self._transformer, max_error))
         finally:
             CSLDestroy(options)
             CSLDestroy(papszMD)
@@ -157,67 +236,33 @@ cdef class RPCTransformerBase:
         When RPC_DEM option is used, height (zs) values in _transform are ignored by GDAL and instead sampled from a DEM
 
         """
-        if self._transformer == NULL:
-            raise ValueError("Unexpected NULL transformer")
-
-        cdef Py_ssize_t i
-        cdef int n
-        cdef double *x = NULL
-        cdef double *y = NULL
-        cdef double *z = NULL
-        cdef int bDstToSrc = transform_direction
-        cdef int src_count
-        cdef int *panSuccess = NULL
-
-        cdef double[:] rxview, ryview, rzview
-        cdef tuple xyz
-
-        bi = np.broadcast(xs, ys, zs)
-        n = bi.size
-        x = <double *>CPLMalloc(n * sizeof(double))
-        y = <double *>CPLMalloc(n * sizeof(double))
-        z = <double *>CPLMalloc(n * sizeof(double))
-        panSuccess = <int *>CPLMalloc(n * sizeof(int))
-
-        for i, xyz in enumerate(bi):
-            x[i] = <double>xyz[0]
-            y[i] = <double>xyz[1]
-            z[i] = <double>xyz[2]
-
-        try:
-            err = GDALRPCTransform(self._transformer, bDstToSrc, n, x, y, z, panSuccess)
-            if err == GDALError.failure:
-                warnings.warn(
-                "Could not transform points using RPCs.",
-                TransformWarning)
-            res_xs = np.zeros(n)
-            res_ys = np.zeros(n)
-            #res_zs = np.zeros(n)
-            rxview = res_xs
-            ryview = res_ys
-            checked = False
-            for i in range(n):
-                # GDALRPCTransformer may return a success overall despite individual points failing. Warn once.
-                if not checked and not panSuccess[i]:
-                    warnings.warn(
-                    "One or more points could not be transformed using RPCs.",
-                    TransformWarning)
-                    checked = True
-                rxview[i] = x[i]
-                ryview[i] = y[i]
-                #res_zs[i] = z[i]
-        finally:
-            CPLFree(x)
-            CPLFree(y)
-            CPLFree(z)
-            CPLFree(panSuccess)
-
-        return (res_xs, res_ys)
+        # The GIL is released while transforming. GDAL's transformers,
+        # and the DEM cache of RPC transformers, must not be used by
+        # two threads at once, nor destroyed while in use.
+        with self._lock:
+            if self._transformer == NULL:
+                raise ValueError("Unexpected NULL transformer")
+
+            if self._approx != NULL:
+                return _transform_points(
+                    GDALApproxTransform, self._approx, transform_direction, True,
+                    xs, ys, zs, "RPCs")
+            else:
+                return _transform_points(
+                    GDALRPCTransform, self._transformer, transform_direction, False,
+                    xs, ys, zs, "RPCs")
 
     def close(self):
         """
         Destroy transformer
         """
+        with self._lock:
+            self._destroy()
+
+    cdef void _destroy(self) noexcept:
+        if self._approx != NULL:
+            GDALDestroyApproxTransformer(self._approx)
+            self._approx = NULL
         if self._transformer == NULL:
             return
 
@@ -234,15 +279,20 @@ cdef class RPCTransformerBase:
 
 cdef class GCPTransformerBase:
     cdef void *_transformer
+    cdef void *_approx
     cdef bint _tps
+    cdef object _lock
 
     def __cinit__(self):
         self._transformer = NULL
+        self._approx = NULL
+        self._lock = threading.Lock()
 
     def __dealloc__(self):
-        self.close()
+        # No other thread can be using the transformer.
+        self._destroy()
 
-    def __init__(self, gcps, tps=False):
+    def __init__(self, gcps, tps=False, max_error=None):
         """
         Construct a new GCP transformer
 
@@ -257,12 +307,17 @@ cdef class GCPTransformerBase:
             Ground Control Points for a dataset.
         tps : bool
             If True, use GDALs thin plate spline transformer instead of polynomials.
+        max_error : float, optional
+            If set, use GDAL's approximate transformer, which interpolates
+            along rows of points of equal y, with this maximum error in
+            units of the output coordinates.
         """
         super().__init__()
         cdef int bReversed = 1
         cdef int nReqOrder = 0  # let GDAL determine polynomial order
         cdef GDAL_GCP *gcplist = <GDAL_GCP *>CPLMalloc(len(gcps) * sizeof(GDAL_GCP))
         cdef int nGCPCount = len(gcps)
+        cdef GDALTransformerFunc pfnRawTransformer = NULL
         self._tps = tps
 
         try:
@@ -280,6 +335,14 @@ cdef class GCPTransformerBase:
                 self._transformer = exc_wrap_pointer(GDALCreateTPSTransformer(nGCPCount, gcplist, bReversed))
             else:
                 self._transformer = exc_wrap_pointer(GDALCreateGCPTransformer(nGCPCount, gcplist, nReqOrder, bReversed))
+            if max_error is not None:
+                if self._tps:
+                    pfnRawTransformer = GDALTPSTransform
+                else:
+                    pfnRawTransformer = GDALGCPTransform
+                self._approx = exc_wrap_pointer(
+                    GDALCreateApproxTransformer(
+                        pfnRawTransformer, self._transformer, max_error))
         finally:
             CPLFree(gcplist)
 
@@ -310,70 +373,37 @@ cdef class GCPTransformerBase:
         -------
         tuple of ndarray
         """
-        if self._transformer == NULL:
-            raise ValueError("Unexpected NULL transformer")
-
-        cdef Py_ssize_t i
-        cdef int n
-        cdef double *x = NULL
-        cdef double *y = NULL
-        cdef double *z = NULL
-        cdef int bDstToSrc = transform_direction
-        cdef int src_count
-        cdef int *panSuccess = NULL
-
-        cdef double[:] rxview, ryview, rzview
-        cdef tuple xyz
-
-        bi = np.broadcast(xs, ys, zs)
-        n = bi.size
-        x = <double *>CPLMalloc(n * sizeof(double))
-        y = <double *>CPLMalloc(n * sizeof(double))
-        z = <double *>CPLMalloc(n * sizeof(double))
-        panSuccess = <int *>CPLMalloc(n * sizeof(int))
-
-        for i, xyz in enumerate(bi):
-            x[i] = <double>xyz[0]
-            y[i] = <double>xyz[1]
-            z[i] = <double>xyz[2]
-
-        try:
-            if self._tps:
-                err = GDALTPSTransform(self._transformer, bDstToSrc, n, x, y, z, panSuccess)
+        # The GIL is released while transforming. GDAL's transformers
+        # must not be used by two threads at once, nor destroyed while
+        # in use.
+        with self._lock:
+            if self._transformer == NULL:
+                raise ValueError("Unexpected NULL transformer")
+
+            if self._approx != NULL:
+                return _transform_points(
+                    GDALApproxTransform, self._approx, transform_direction, True,
+                    xs, ys, zs, "GCPs")
+            elif self._tps:
+                return _transform_points(
+                    GDALTPSTransform, self._transformer, transform_direction, False,
+                    xs, ys, zs, "GCPs")
             else:
-                err = GDALGCPTransform(self._transformer, bDstToSrc, n, x, y, z, panSuccess)
-            if err == GDALError.failure:
-                warnings.warn(
-                "Could not transform points using GCPs.",
-                TransformWarning)
-            res_xs = np.zeros(n)
-            res_ys = np.zeros(n)
-            #res_zs = np.zeros(n)
-            rxview = res_xs
-            ryview = res_ys
-            checked = False
-            for i in range(n):
-                # GDALGCPTransformer or GDALTPSTransformer may return a success overall despite individual points failing. Warn once.
-                if not checked and not panSuccess[i]:
-                    warnings.warn(
-                    "One or more points could not be transformed using GCPs.",
-                    TransformWarning)
-                    checked = True
-                rxview[i] = x[i]
-                ryview[i] = y[i]
-                #res_zs[i] = z[i]
-        finally:
-            CPLFree(x)
-            CPLFree(y)
-            CPLFree(z)
-            CPLFree(panSuccess)
-
-        return (res_xs, res_ys)
+                return _transform_points(
+                    GDALGCPTransform, self._transformer, transform_direction, False,
+                    xs, ys, zs, "GCPs")
 
     def close(self):
         """
         Destroy transformer
         """
+        with self._lock:
+            self._destroy()
+
+    cdef void _destroy(self) noexcept:
+        if self._approx != NULL:
+            GDALDestroyApproxTransformer(self._approx)
+            self._approx = NULL
         if self._transformer == NULL:
             return
         if self._tps:
@@ -32,6 +32,21 @@ _OPENER_REGISTRY.set({})
 _OPEN_FILE_EXIT_STACKS = ContextVar("open_file_exit_stacks")
 _OPEN_FILE_EXIT_STACKS.set({})
 
+# Read buffering state of registered openers, keyed like the registry.
+# Files opened for reading only are wrapped in a _BufferedReader that
+# coalesces GDAL's small reads into readahead-sized reads of the Python
+# file object. The first bytes of each such file are kept for the life
+# of the registration so that GDAL's repeated parsing of a dataset's
+# header, from several file handles, costs a single read.
+_OPENER_READ_CACHES = {}
+
+# Default sizes, in bytes, of the readahead buffer of each file handle
+# and of the header cache of each file. They may be changed with the
+# RASTERIO_OPENER_READAHEAD and RASTERIO_OPENER_HEADER_CACHE config
+# options. Zero disables buffering or caching.
+DEFAULT_OPENER_READAHEAD = 65536
+DEFAULT_OPENER_HEADER_CACHE = 16384
+
 
 # When an opener is registered for a path, this structure captures the
 # path and unique registration instance. VSI stat, read_dir, and open
@@ -244,6 +259,15 @@ cdef void* pyopener_open(
         errmsg = "OpenFile didn't resolve".encode("utf-8")
         return NULL
     else:
+        read_cache = _OPENER_READ_CACHES.get(key)
+        if read_cache is not None:
+            try:
+                file_obj = read_cache.wrap(urlpath, mode, file_obj)
+            except Exception as err:
+                stack.close()
+                errmsg = f"Opener failed to read file: {repr(err)}".encode("utf-8")
+                CPLError(CE_Failure, <CPLErrorNum>4, <const char *>"%s", <const char *>errmsg)
+                return NULL
         exit_stacks = _OPEN_FILE_EXIT_STACKS.get({})
         exit_stacks[file_obj] = stack
         _OPEN_FILE_EXIT_STACKS.set(exit_stacks)
@@ -374,6 +398,10 @@ def _opener_registration(urlpath, obj):
     cdef bytes prefix_bytes = f"/{namespace}/".encode("utf-8")
 
     opener = to_pyopener(obj)
+    read_cache = _OpenerReadCache(
+        _get_size_option("RASTERIO_OPENER_READAHEAD", DEFAULT_OPENER_READAHEAD),
+        _get_size_option("RASTERIO_OPENER_HEADER_CACHE", DEFAULT_OPENER_HEADER_CACHE),
+    )
 
     # Before returning we do a quick check that the opener will
     # plausibly function.
@@ -393,12 +421,14 @@ def _opener_registration(urlpath, obj):
         if registry[key] != opener:
             raise OpenerRegistrationError(f"Opener already registered for urlpath.")
         else:
+            _OPENER_READ_CACHES[key] = read_cache
             try:
                 yield f"/{namespace}/{urlpath}"
             finally:
                 registry = _OPENER_REGISTRY.get()
                 _ = registry.pop(key, None)
                 _OPENER_REGISTRY.set(registry)
+                _ = _OPENER_READ_CACHES.pop(key, None)
 
     else:
         # Install handler.
@@ -432,6 +462,7 @@ def _opener_registration(urlpath, obj):
 
         registry[key] = opener
         _OPENER_REGISTRY.set(registry)
+        _OPENER_READ_CACHES[key] = read_cache
 
         try:
             yield f"/{namespace}/{urlpath}"
@@ -439,11 +470,135 @@ def _opener_registration(urlpath, obj):
             registry = _OPENER_REGISTRY.get()
             _ = registry.pop(key, None)
             _OPENER_REGISTRY.set(registry)
+            _ = _OPENER_READ_CACHES.pop(key, None)
 
             IF (CTE_GDAL_MAJOR_VERSION, CTE_GDAL_MINOR_VERSION) >= (3, 9):
                 retval = VSIRemovePluginHandler(prefix_bytes)
 
 
+def _get_size_option(name, default):
+    """Get a non-negative size in bytes from a GDAL config option."""
+    cdef const char *val = NULL
+    name_b = name.encode("utf-8")
+    val = CPLGetConfigOption(<const char *>name_b, NULL)
+    if val == NULL:
+        return default
+    try:
+        size = int(val.decode("utf-8"))
+    except ValueError:
+        size = -1
+    if size < 0:
+        raise OpenerRegistrationError(
+            f"{name} must be a non-negative integer: {val.decode('utf-8')!r}"
+        )
+    return size
+
+
+class _OpenerReadCache:
+    """Read buffering options and header cache of a registered opener."""
+
+    def __init__(self, readahead, header_size):
+        self.readahead = readahead
+        self.header_size = header_size
+        # Maps urlpaths to their first header_size bytes, or to None
+        # for files that have been opened for writing.
+        self.headers = {}
+
+    def wrap(self, urlpath, mode, file_obj):
+        """Wrap a file object opened for reading only in a buffer."""
+        if not mode.startswith("r") or "+" in mode:
+            # Writes would make cached headers stale.
+            self.headers[urlpath] = None
+            return file_obj
+
+        if not self.readahead and not self.header_size:
+            return file_obj
+
+        header = None
+        if self.header_size:
+            if urlpath in self.headers:
+                header = self.headers[urlpath]
+            else:
+                file_obj.seek(0)
+                header = file_obj.read(self.header_size)
+                file_obj.seek(0)
+                self.headers[urlpath] = header
+
+        return _BufferedReader(file_obj, self.readahead, header)
+
+
+class _BufferedReader:
+    """Serves small reads of a Python file object from a buffer.
+
+    Reads shorter than the readahead size fill a buffer of that size
+    starting at the current position, and later reads within the buffer
+    or within the header do not call the file object at all. Seeks are
+    deferred until the file object must be read.
+
+    Other attributes, such as get_byte_ranges, are those of the wrapped
+    file object.
+
+    """
+
+    __slots__ = ("_raw", "_readahead", "_header", "_buf", "_buf_start", "_pos", "_raw_pos")
+
+    def __init__(self, file_obj, readahead, header=None):
+        self._raw = file_obj
+        self._readahead = readahead
+        self._header = header or b""
+        self._buf = b""
+        self._buf_start = 0
+        self._pos = file_obj.tell()
+        self._raw_pos = self._pos
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_SET:
+            self._pos = offset
+        elif whence == os.SEEK_CUR:
+            self._pos += offset
+        else:
+            self._raw.seek(offset, whence)
+            self._raw_pos = self._pos = self._raw.tell()
+        return self._pos
+
+    def _read_raw(self, size):
+        if self._raw_pos != self._pos:
+            self._raw.seek(self._pos)
+        data = self._raw.read(size)
+        self._raw_pos = self._pos + len(data)
+        return data
+
+    def read(self, size=-1):
+        cdef Py_ssize_t pos = self._pos
+        cdef Py_ssize_t offset
+
+        if size is None or size < 0:
+            data = self._read_raw(-1)
+
+        elif pos + size <= len(self._header):
+            data = self._header[pos:pos + size]
+
+        else:
+            offset = pos - self._buf_start
+            if 0 <= offset and offset + size <= len(self._buf):
+                data = self._buf[offset:offset + size]
+            elif size >= self._readahead:
+                data = self._read_raw(size)
+            else:
+                self._buf = self._read_raw(self._readahead)
+                self._buf_start = pos
+                data = self._buf[:size]
+
+        self._pos = pos + len(data)
+        return data
+
+
 class FileContainer(ABC):
     """An object that can report on and open Python files."""
     @abstractmethod
@@ -8,3 +8,6 @@ cdef class CRS:
     cdef public object _epsg
     cdef public object _wkt
     cdef object _geodetic_crs
+    cdef object _canonical_wkt
+    cdef dict _matches_cache
+    cdef dict _equals_cache
@@ -19,17 +19,17 @@ not call PROJ functions directly, but invokes them via calls to GDAL's
 
 """
 
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 from itertools import groupby
 import json
 import logging
 from operator import itemgetter
-import pickle
 import typing
 import warnings
 import re
 
 import rasterio._env
+from rasterio._cache import _LRUCache
 from rasterio._err import CPLE_BaseError, CPLE_NotSupportedError
 from rasterio.errors import CRSError, RasterioDeprecationWarning
 from rasterio.enums import WktVersion
@@ -59,6 +59,73 @@ def auth_preference(item):
         return 100
 
 
+CRSCacheInfo = namedtuple("CRSCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class _CRSCache(_LRUCache):
+    """A least recently used cache of CRS.
+
+    It holds CRS, cached by the constructor and input that made them,
+    or the results of comparisons of CRS, cached by their canonical WKT.
+    """
+
+    def info(self):
+        return CRSCacheInfo(*super().info())
+
+
+_crs_cache = _CRSCache()
+_equals_cache = _CRSCache(maxsize=1024)
+_matches_cache = _CRSCache(maxsize=1024)
+
+
+def set_cache_size(maxsize):
+    """Set the size of the CRS intern cache.
+
+    When the cache is enabled, the from_epsg, from_wkt, from_proj4,
+    from_string, and from_user_input constructors return the same CRS
+    object for identical inputs, instead of parsing the input again.
+    This includes the CRS of opened datasets. Interned CRS are shared
+    and must not be modified.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of interned CRS. The least recently used CRS
+        are evicted first. 0, the default, disables the cache.
+
+    Returns
+    -------
+    None
+
+    """
+    if maxsize < 0:
+        raise ValueError("The cache size must be positive or zero")
+    _crs_cache.resize(maxsize)
+
+
+def cache_info():
+    """Statistics of the CRS intern cache.
+
+    Returns
+    -------
+    CRSCacheInfo
+        A named tuple of hits, misses, maxsize, and currsize.
+
+    """
+    return _crs_cache.info()
+
+
+def clear_cache():
+    """Remove all CRS from the intern cache and reset its statistics.
+
+    Returns
+    -------
+    None
+
+    """
+    _crs_cache.clear()
+
+
 cdef _safe_osr_release(OGRSpatialReferenceH srs):
     """Wrapper to handle OSR release when NULL."""
     if srs != NULL:
@@ -512,14 +579,32 @@ cdef class CRS:
     def _matches(self, confidence_threshold=70):
         """Find matches in authority files.
 
+        Matches are cached by CRS and by canonical WKT, so that the
+        PROJ database is searched once per distinct CRS.
+
         Returns
         -------
-        dict : {name: [codes]}
-            A dictionary in which capitalized authority names are the
-            keys and lists of codes ordered by match confidence,
-            descending, are the values.
+        list of tuple
+            (confidence, name, code) tuples ordered by match
+            confidence, descending.
 
         """
+        if self._matches_cache is None:
+            self._matches_cache = {}
+        results = self._matches_cache.get(confidence_threshold)
+        if results is None:
+            key = self._get_canonical_wkt()
+            if key:
+                results = _matches_cache.get(
+                    (key, confidence_threshold),
+                    lambda: self._find_matches(confidence_threshold))
+            else:
+                results = self._find_matches(confidence_threshold)
+            self._matches_cache[confidence_threshold] = results
+        return list(results)
+
+    def _find_matches(self, confidence_threshold):
+        """Search authority files for matches of the CRS."""
         cdef OGRSpatialReferenceH osr = NULL
         cdef OGRSpatialReferenceH *matches = NULL
         cdef int *confidences = NULL
@@ -546,7 +631,7 @@ cdef class CRS:
                     name = c_name.decode('utf-8')
                     results.append((confidence, name, code))
 
-            return results
+            return tuple(results)
 
         finally:
             _safe_osr_release(osr)
@@ -567,22 +652,58 @@ cdef class CRS:
         Returns
         -------
         bool
+
+        Notes
+        -----
+        Results are cached by CRS and by canonical WKT.
         """
         cdef CRS crs_o
+
+        try:
+            crs_o = CRS.from_user_input(other)
+        except CRSError:
+            return False
+
+        if crs_o is self:
+            return True
+
+        ignore_axis_order = bool(ignore_axis_order)
+        key_self = self._get_canonical_wkt()
+        key_other = crs_o._get_canonical_wkt()
+        if not key_self or not key_other:
+            return self._is_same(crs_o, ignore_axis_order)
+
+        if self._equals_cache is None:
+            self._equals_cache = {}
+        result = self._equals_cache.get((key_other, ignore_axis_order))
+        if result is None:
+            result = _equals_cache.get(
+                (min(key_self, key_other), max(key_self, key_other), ignore_axis_order),
+                lambda: self._is_same(crs_o, ignore_axis_order))
+            self._equals_cache[(key_other, ignore_axis_order)] = result
+        return result
+
+    def _is_same(self, CRS other, ignore_axis_order):
+        """Compare with another CRS using OSRIsSameEx."""
         cdef const char* options[2]
-        
+
         if ignore_axis_order:
             options[0] = b"IGNORE_DATA_AXIS_TO_SRS_AXIS_MAPPING=YES"
         else:
             options[0] = b"IGNORE_DATA_AXIS_TO_SRS_AXIS_MAPPING=NO"
         options[1] = NULL
 
-        try:
-            crs_o = CRS.from_user_input(other)
-            return bool(OSRIsSameEx(self._osr, crs_o._osr, options) == 1)
-        except CRSError:
-            return False
-        
+        return bool(OSRIsSameEx(self._osr, other._osr, options) == 1)
+
+    def _get_canonical_wkt(self):
+        """The WKT2 representation used as the key of cached results."""
+        if self._canonical_wkt is None:
+            try:
+                self._canonical_wkt = self.to_wkt(version=WktVersion.WKT2)
+            except CRSError:
+                self._canonical_wkt = ""
+        return self._canonical_wkt
+
 
     def to_string(self):
         """Convert to a PROJ4 or WKT string.
@@ -634,8 +755,6 @@ cdef class CRS:
         CRSError
 
         """
-        cdef CRS obj = CRS.__new__(CRS)
-
         try:
             code = int(code)
         except OverflowError as err:
@@ -646,6 +765,12 @@ cdef class CRS:
         if code <= 0:
             raise CRSError("EPSG codes are positive integers")
 
+        return _crs_cache.get(("epsg", code), lambda: CRS._from_epsg(code))
+
+    @staticmethod
+    def _from_epsg(code):
+        cdef CRS obj = CRS.__new__(CRS)
+
         try:
             exc_wrap_ogrerr(exc_wrap_int(OSRImportFromEPSG(obj._osr, <int>code)))
         except OverflowError as err:
@@ -675,6 +800,10 @@ cdef class CRS:
         CRSError
 
         """
+        return _crs_cache.get(("proj4", proj), lambda: CRS._from_proj4(proj))
+
+    @staticmethod
+    def _from_proj4(proj):
         cdef CRS obj = CRS.__new__(CRS)
 
         # Filter out nonsensical items that might have crept in.
@@ -794,11 +923,15 @@ cdef class CRS:
         CRSError
 
         """
-        cdef char *wkt_c = NULL
-
         if not isinstance(wkt, str):
             raise ValueError("A string is expected")
 
+        return _crs_cache.get(("wkt", wkt), lambda: CRS._from_wkt(wkt))
+
+    @staticmethod
+    def _from_wkt(wkt):
+        cdef char *wkt_c = NULL
+
         wkt_b= wkt.encode('utf-8')
         wkt_c = wkt_b
 
@@ -892,9 +1025,6 @@ cdef class CRS:
         ------
         CRSError
         """
-        cdef const char *text_c = NULL
-        cdef CRS obj
-
         try:
             value = value.strip()
         except AttributeError:
@@ -926,16 +1056,23 @@ cdef class CRS:
         elif "=" in value:
             return CRS.from_proj4(value)
         else:
-            text_b = value.encode('utf-8')
-            text_c = text_b
-            obj = CRS.__new__(CRS)
-            try:
-                errcode = exc_wrap_ogrerr(OSRSetFromUserInput(obj._osr, text_c))
-            except CPLE_BaseError as exc:
-                raise CRSError("The WKT could not be parsed. {}".format(exc))
-            else:
-                osr_set_traditional_axis_mapping_strategy(obj._osr)
-                return obj
+            return _crs_cache.get(("string", value), lambda: CRS._from_string(value))
+
+    @staticmethod
+    def _from_string(value):
+        cdef const char *text_c = NULL
+        cdef CRS obj
+
+        text_b = value.encode('utf-8')
+        text_c = text_b
+        obj = CRS.__new__(CRS)
+        try:
+            errcode = exc_wrap_ogrerr(OSRSetFromUserInput(obj._osr, text_c))
+        except CPLE_BaseError as exc:
+            raise CRSError("The WKT could not be parsed. {}".format(exc))
+        else:
+            osr_set_traditional_axis_mapping_strategy(obj._osr)
+            return obj
 
     def __cinit__(self):
         self._osr = OSRNewSpatialReference(NULL)
@@ -966,22 +1103,34 @@ cdef class CRS:
 
     __nonzero__ = __bool__
 
-    def __getstate__(self):
-        return self.to_wkt()
+    def __reduce__(self):
+        # CRS made from EPSG codes are pickled as codes and others as
+        # PROJ JSON, which, unlike WKT1, is lossless.
+        if self._epsg is not None:
+            return (_crs_from_pickle, ("EPSG", self._epsg))
+        projjson = self._projjson()
+        if projjson:
+            return (_crs_from_pickle, ("PROJJSON", projjson))
+        else:
+            return (_crs_from_pickle, ("WKT", self.to_wkt()))
 
     def __setstate__(self, state):
+        # Pickles made by rasterio < 1.6 have WKT state.
         cdef CRS tmp
         tmp = CRS.from_wkt(state)
+        _safe_osr_release(self._osr)
         self._osr = OSRClone(tmp._osr)
         self._wkt = tmp._wkt
         self._data = tmp.data
         self._epsg = tmp._epsg
 
     def __copy__(self):
-        return pickle.loads(pickle.dumps(self))
-
-    def __hash__(self):
-        return hash(self.to_wkt())
+        cdef CRS obj = CRS.__new__(CRS)
+        _safe_osr_release(obj._osr)
+        obj._osr = OSRClone(self._osr)
+        obj._wkt = self._wkt
+        obj._epsg = self._epsg
+        return obj
 
     def __str__(self):
         return self.to_string()
@@ -1034,6 +1183,39 @@ cdef class CRS:
             CPLFree(conv_json)
 
 
+_unpickle_cache = _CRSCache(maxsize=128)
+
+
+def _crs_from_pickle(kind, value):
+    """Make a CRS from its pickled form.
+
+    CRS are interned by their pickled form, so that a process which
+    unpickles many CRS, such as a worker of a process pool, parses each
+    distinct CRS once. Unpickled CRS may therefore be shared and must
+    not be modified.
+
+    Parameters
+    ----------
+    kind : str
+        "EPSG", "PROJJSON", or "WKT".
+    value : int or str
+        An EPSG code, PROJ JSON text, or WKT.
+
+    Returns
+    -------
+    CRS
+
+    """
+    if kind == "EPSG":
+        return _unpickle_cache.get((kind, value), lambda: CRS.from_epsg(value))
+    elif kind == "PROJJSON":
+        return _unpickle_cache.get((kind, value), lambda: CRS._from_string(value))
+    elif value:
+        return _unpickle_cache.get((kind, value), lambda: CRS.from_wkt(value))
+    else:
+        return CRS()
+
+
 def epsg_treats_as_latlong(input_crs):
     """Test if the CRS is in latlon order
 
@@ -52,9 +52,23 @@ class ThreadEnv(threading.local):
         # 'rasterio.env.set_gdal_config()' inside of a 'rasterio.Env()'.
         self._discovered_options = None
 
+        # Number of 'rasterio.Env()' contexts entered in this thread and
+        # the state of this thread's persistent environment, if any. See
+        # 'set_persistent_env()'.
+        self._depth = 0
+        self._persistent = False
+        self._persistent_generation = 0
+
 
 local = ThreadEnv()
 
+# Process-wide persistent environment options. The generation counter
+# is bumped whenever the options change so that each thread can cheaply
+# detect that its persistent environment is stale.
+_persistent_lock = threading.Lock()
+_persistent_options = None
+_persistent_generation = 0
+
 log = logging.getLogger(__name__)
 
 
@@ -289,34 +303,57 @@ class Env:
 
     def __enter__(self):
         log.debug("Entering env context: %r", self)
+        _check_persistent_env()
+        self._reused_env = False
+
         if local._env is None:
             log.debug("Starting outermost env")
             self._has_parent_env = False
 
             # See note directly above where _discovered_options is globally
             # defined.  This MUST happen before calling 'defenv()'.
-            local._discovered_options = {}
-            # Don't want to reinstate the "RASTERIO_ENV" option.
-            probe_env = {k for k in self.options.keys() if k != "RASTERIO_ENV"}
-            for key in probe_env:
-                val = get_gdal_config(key, normalize=False)
-                if val is not None:
-                    local._discovered_options[key] = val
-
+            _discover_options(self.options)
             defenv(**self.options)
             self.context_options = {}
         else:
             self._has_parent_env = True
             self.context_options = getenv()
+
+            # When the parent environment already has all of our options
+            # and there are no credentials to apply, the parent is reused
+            # as is. This makes nested entry, such as that done for every
+            # call of rasterio.open(), close to free.
+            if (
+                isinstance(self.session, DummySession)
+                and self.options.items() <= self.context_options.items()
+            ):
+                log.debug("Reusing parent env")
+                self._reused_env = True
+                local._depth += 1
+                return self
+
             setenv(**self.options)
 
         self.credentialize()
+        local._depth += 1
 
         log.debug("Entered env context: %r", self)
         return self
 
     def __exit__(self, exc_type=None, exc_val=None, exc_tb=None):
         log.debug("Exiting env context: %r", self)
+        local._depth -= 1
+
+        # A reused parent environment needs no teardown unless its
+        # options were changed within the context.
+        if (
+            self._reused_env
+            and local._env is not None
+            and local._env.options == self.context_options
+        ):
+            log.debug("Exited reused env context: %r", self)
+            return
+
         delenv()
         if self._has_parent_env:
             defenv()
@@ -325,13 +362,138 @@ class Env:
             log.debug("Exiting outermost env")
             # See note directly above where _discovered_options is globally
             # defined.
-            while local._discovered_options:
-                key, val = local._discovered_options.popitem()
-                set_gdal_config(key, val, normalize=False)
-            local._discovered_options = None
+            _reinstate_discovered_options()
         log.debug("Exited env context: %r", self)
 
 
+def _discover_options(options):
+    """Record the GDAL config values that options will override."""
+    local._discovered_options = {}
+    # Don't want to reinstate the "RASTERIO_ENV" option.
+    probe_env = {k for k in options.keys() if k != "RASTERIO_ENV"}
+    for key in probe_env:
+        val = get_gdal_config(key, normalize=False)
+        if val is not None:
+            local._discovered_options[key] = val
+
+
+def _reinstate_discovered_options():
+    """Restore the GDAL config values recorded by _discover_options."""
+    while local._discovered_options:
+        key, val = local._discovered_options.popitem()
+        set_gdal_config(key, val, normalize=False)
+    local._discovered_options = None
+
+
+def set_persistent_env(**options):
+    """Configure a persistent, process-wide GDAL environment
+
+    In persistent mode each thread starts an environment with the
+    default and given options the first time it needs one, and keeps it
+    until the mode is cleared. Functions such as rasterio.open() then
+    no longer set up and tear down an environment on every call, and
+    entering an Env whose options are already in effect is a near
+    no-op. This benefits programs that open many datasets in quick
+    succession.
+
+    Parameters
+    ----------
+    **options : optional
+        A mapping of GDAL configuration options. These are overlaid on
+        the values of Env.default_options().
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    EnvError
+        If AWS credentials are given as config options.
+
+    Notes
+    -----
+    Calling this function again replaces the options of every thread's
+    persistent environment. Threads pick up the change the next time
+    they enter an environment outside of any Env context.
+
+    Examples
+    --------
+
+    >>> set_persistent_env(GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR")
+    >>> for path in paths:
+    ...     with rasterio.open(path) as src:
+    ...         ...
+    >>> clear_persistent_env()
+
+    """
+    global _persistent_options, _persistent_generation
+
+    if "AWS_ACCESS_KEY_ID" in options or "AWS_SECRET_ACCESS_KEY" in options:
+        raise EnvError(
+            "GDAL's AWS config options can not be directly set. "
+            "AWS credentials are handled exclusively by boto3."
+        )
+
+    persistent_options = Env.default_options()
+    persistent_options.update(options)
+
+    with _persistent_lock:
+        _persistent_options = persistent_options
+        _persistent_generation += 1
+
+    _check_persistent_env()
+
+
+def clear_persistent_env():
+    """Leave persistent environment mode
+
+    The calling thread's persistent environment is stopped immediately
+    if no Env context is active. Other threads stop theirs the next
+    time they enter an environment outside of any Env context.
+
+    Returns
+    -------
+    None
+
+    """
+    global _persistent_options, _persistent_generation
+
+    with _persistent_lock:
+        _persistent_options = None
+        _persistent_generation += 1
+
+    _check_persistent_env()
+
+
+def _check_persistent_env():
+    """Bring this thread's persistent environment up to date."""
+    if local._persistent_generation != _persistent_generation and not local._depth:
+        _sync_persistent_env()
+
+
+def _sync_persistent_env():
+    """Start, restart, or stop this thread's persistent environment."""
+    with _persistent_lock:
+        generation = _persistent_generation
+        options = _persistent_options
+
+    if local._persistent:
+        log.debug("Stopping persistent env")
+        if local._env is not None:
+            delenv()
+        _reinstate_discovered_options()
+        local._persistent = False
+
+    if options is not None and local._env is None:
+        log.debug("Starting persistent env: options=%r", options)
+        _discover_options(options)
+        defenv(**options)
+        local._persistent = True
+
+    local._persistent_generation = generation
+
+
 def defenv(**options):
     """Create a default environment if necessary."""
     if local._env:
@@ -405,6 +567,7 @@ def env_ctx_if_needed():
     Env or a do-nothing context manager
 
     """
+    _check_persistent_env()
     if local._env:
         return NullContextManager()
     else:
@@ -417,6 +580,7 @@ def ensure_env(f):
 
     @wraps(f)
     def wrapper(*args, **kwds):
+        _check_persistent_env()
         if local._env:
             return f(*args, **kwds)
         else:
@@ -456,6 +620,7 @@ def ensure_env_with_credentials(f):
 
     @wraps(f)
     def wrapper(*args, **kwds):
+        _check_persistent_env()
         if local._env:
             env_ctor = Env
         else:
@@ -469,12 +634,15 @@ def ensure_env_with_credentials(f):
             if local._env and session_cls.hascreds(getenv()):
                 session_cls = DummySession
 
-            session = session_cls()
-
         else:
-            session = DummySession()
+            session_cls = DummySession
+
+        # An existing environment needs nothing more to access data
+        # that requires no credentials.
+        if local._env and session_cls is DummySession:
+            return f(*args, **kwds)
 
-        with env_ctor(session=session):
+        with env_ctor(session=session_cls()):
             return f(*args, **kwds)
 
     return wrapper
@@ -1,5 +1,6 @@
 """Functions for working with features in a raster dataset."""
 
+from collections import defaultdict
 from contextlib import ExitStack
 import logging
 import math
@@ -11,7 +12,19 @@ import numpy as np
 import rasterio
 from rasterio import warp
 from rasterio._base import DatasetBase
-from rasterio._features import _shapes, _sieve, _rasterize, _bounds
+from rasterio._features import (
+    _RaggedWKBWriter,
+    _bounds,
+    _geojson_to_wkb,
+    _label_regions,
+    _rasterize,
+    _shapes,
+    _sieve,
+    _wkb_bounds,
+    _wkb_bounds_array,
+    _wkb_to_geojson,
+)
+from rasterio._tiles import _chunk_plan, _imap_tiles
 from rasterio.dtypes import (
     int8,
     int16,
@@ -27,7 +40,11 @@ from rasterio.dtypes import (
 )
 from rasterio.enums import MergeAlg
 from rasterio.env import ensure_env, _GDAL_AT_LEAST_3_11
-from rasterio.errors import RasterioDeprecationWarning
+from rasterio.errors import (
+    InvalidShapeError,
+    RasterioDeprecationWarning,
+    ShapeSkipWarning,
+)
 from rasterio.io import DatasetWriter
 from rasterio.rio.helpers import coords
 from rasterio.transform import Affine
@@ -46,7 +63,9 @@ def geometry_mask(geometries, out_shape, transform, all_touched=False, invert=Fa
 
     Parameters
     ----------
-    geometries : iterable over geometries (GeoJSON-like objects)
+    geometries : iterable over geometries
+        GeoJSON-like objects, objects with a WKB representation such as
+        Shapely geometries, or WKB bytes.
     out_shape : tuple or list
         Shape of output :class:`numpy.ndarray`.
     transform : Affine transformation object
@@ -86,7 +105,14 @@ def geometry_mask(geometries, out_shape, transform, all_touched=False, invert=Fa
 
 
 @ensure_env
-def shapes(source, mask=None, connectivity=4, transform=IDENTITY):
+def shapes(
+    source,
+    mask=None,
+    connectivity=4,
+    transform=IDENTITY,
+    window_height=None,
+    format="geojson",
+):
     r"""Get shapes and values of connected regions in a dataset or array.
 
     .. warning:: Because the low-level implementation uses either an int64 or float32
@@ -110,13 +136,28 @@ def shapes(source, mask=None, connectivity=4, transform=IDENTITY):
     transform : Affine transformation, optional
         If not provided, feature coordinates will be generated based on
         pixel coordinates
+    window_height : int, optional
+        If `source` is a Band or tuple(dataset, bidx), it may be read
+        and polygonized in windows spanning this many rows instead of
+        all at once. Each window is read once. The pieces of a region
+        crossing window edges are kept until the region is complete and
+        then stitched into one polygon, so memory use is bounded by the
+        size of a window and of the regions still open. The shapes cover
+        the same pixels as when the whole band is polygonized, but their
+        rings may start at other vertices, and values are compared
+        exactly rather than at the precision of the low-level
+        implementation. Not valid for ndarray sources.
+    format : str, optional
+        "geojson" (the default) or "wkb". WKB geometries are exported
+        from OGR without making Python objects of their coordinates.
 
     Yields
     -------
     polygon, value
         A pair of (polygon, value) for each feature found in the image.
-        Polygons are GeoJSON-like dicts and the values are the
-        associated value from the image, in the data type of the image.
+        Polygons are GeoJSON-like dicts, or WKB bytes if format is
+        "wkb", and the values are the associated value from the image,
+        in the data type of the image.
         Note: due to floating point precision issues, values returned
         from a floating point image may not exactly match the original
         values.
@@ -139,12 +180,467 @@ def shapes(source, mask=None, connectivity=4, transform=IDENTITY):
         mask = ~source.mask
         source = source.data
 
+    if format not in ("geojson", "wkb"):
+        raise ValueError("format must be geojson or wkb")
+
     transform = guard_transform(transform)
-    yield from _shapes(source, mask, connectivity, transform)
+
+    if window_height is not None and not isinstance(source, tuple):
+        raise ValueError("window_height requires a Band or tuple(dataset, bidx) source")
+
+    if window_height is not None:
+        dataset = source.ds
+
+        def read(window):
+            image = dataset.read(source.bidx, window=window)
+            if mask is None:
+                window_mask = None
+            elif isinstance(mask, tuple):
+                window_mask = mask.ds.read(mask.bidx, window=window)
+            else:
+                window_mask = mask[window.toslices()]
+            return image, window_mask
+
+        yield from _shapes_windowed(
+            read,
+            dataset.width,
+            dataset.height,
+            dataset.transform,
+            connectivity,
+            window_height,
+            format=format,
+        )
+
+    else:
+        yield from _shapes(source, mask, connectivity, transform, format=format)
 
 
 @ensure_env
-def sieve(source, size, out=None, mask=None, connectivity=4):
+def shapes_columns(source, mask=None, connectivity=4, transform=IDENTITY, format="wkb"):
+    r"""Get shapes and values of connected regions as arrays.
+
+    This is the columnar equivalent of shapes(). Its output can be
+    passed to shapely.from_wkb() or shapely.from_ragged_array() and to
+    GeoParquet or GeoArrow writers without making a Python object for
+    each shape.
+
+    Parameters
+    ----------
+    source : numpy.ndarray, dataset object, Band, or tuple(dataset, bidx)
+        See shapes().
+    mask : numpy.ndarray or rasterio Band object, optional
+        See shapes().
+    connectivity : int, optional
+        Use 4 or 8 pixel connectivity for grouping pixels into features
+    transform : Affine transformation, optional
+        If not provided, feature coordinates will be generated based on
+        pixel coordinates
+    format : str, optional
+        "wkb" (the default) or "ragged".
+
+    Returns
+    -------
+    geometries, values
+        If format is "wkb", geometries is an object array of WKB bytes.
+        If format is "ragged", geometries is a (coords, offsets) pair:
+        an (N, 2) array of coordinates and a tuple of the coordinate
+        offsets of rings and ring offsets of polygons, as used by
+        shapely.from_ragged_array() with shapely.GeometryType.POLYGON.
+        values is an array of the image value of each geometry.
+
+    """
+    if hasattr(source, "mask") and mask is None:
+        mask = ~source.mask
+        source = source.data
+
+    transform = guard_transform(transform)
+
+    if format == "wkb":
+        geometries = []
+        values = []
+        for geom, value in _shapes(source, mask, connectivity, transform, format="wkb"):
+            geometries.append(geom)
+            values.append(value)
+        arr = np.empty(len(geometries), dtype=object)
+        arr[:] = geometries
+        return arr, np.array(values)
+
+    elif format == "ragged":
+        ((coords, offsets, values),) = _shapes(
+            source, mask, connectivity, transform, format="ragged"
+        )
+        return (coords, offsets), values
+
+    else:
+        raise ValueError("format must be wkb or ragged")
+
+
+def _shapes_windowed(
+    read, width, height, transform, connectivity, window_height, format="geojson"
+):
+    """Polygonize a raster in windows of full rows.
+
+    Each window is read and polygonized once. The regions of a window
+    are labeled, and those that neither touch its bottom edge nor
+    continue a region of the previous window are yielded at once.
+    The polygons of other regions are kept as pieces, along with the
+    labels of the pixels along the bottom edge. Regions that meet
+    across an edge with the same value are joined by a union-find pass
+    over the labels on either side. A region without pixels along the
+    bottom edge of a window is complete, and the rings of its pieces
+    are stitched into one polygon.
+
+    Parameters
+    ----------
+    read : callable
+        Returns an (image, mask) pair of arrays for a Window. The mask
+        may be None.
+    width, height : int
+        The dimensions of the raster.
+    transform : Affine
+        The raster's affine transformation.
+    connectivity : int
+        Use 4 or 8 pixel connectivity for grouping pixels into features.
+    window_height : int
+        The number of rows of each window.
+    format : str, optional
+        "geojson" or "wkb".
+
+    Yields
+    ------
+    polygon, value
+    """
+    if window_height < 1:
+        raise ValueError("window_height must be greater than 0")
+
+    # Regions continuing below the previous window: their values,
+    # their pieces, and their numbers, plus 1, along its bottom row.
+    open_values = None
+    open_pieces = []
+    bottom = None
+
+    for start in range(0, height, window_height):
+        stop = min(height, start + window_height)
+        window = windows.Window(0, start, width, stop - start)
+        image, mask = read(window)
+        window_transform = windows.transform(window, transform)
+
+        if start == 0 and stop == height:
+            yield from _shapes(
+                image, mask, connectivity, window_transform, format=format
+            )
+            return
+
+        # Floating point values are replaced by integer codes for
+        # labeling.
+        if image.dtype.kind == "f":
+            codes = np.unique(image, return_inverse=True)[1].reshape(image.shape)
+        else:
+            codes = image
+        labels, count = _label_regions(codes, mask, connectivity)
+        values = np.zeros(count + 1, dtype=image.dtype)
+        values[labels.ravel()] = image.ravel()
+
+        # Open regions are numbered first, then the regions of the
+        # window. Those meeting across the top edge with the same value
+        # are joined.
+        n = len(open_pieces)
+        if bottom is None:
+            node_values = values[1:]
+            joins = np.empty((0, 2), dtype="int64")
+        else:
+            node_values = np.concatenate([open_values, values[1:]])
+            top = np.where(labels[0] > 0, labels[0] + n, 0)
+            pairs, _ = _neighbor_pairs(
+                np.stack([bottom, top]), connectivity, start - 1, 0, width
+            )
+            pairs = pairs[(pairs[:, 0] <= n) & (pairs[:, 1] > n)] - 1
+            a = node_values[pairs[:, 0]]
+            b = node_values[pairs[:, 1]]
+            joins = pairs[(a == b) | ((a != a) & (b != b))]
+        roots = _union_roots(joins, n + count)
+
+        # Regions touching the bottom edge continue below, and regions
+        # continuing from above are complete otherwise.
+        continued = np.zeros(n + count, dtype=bool)
+        continued[roots[:n]] = True
+        continues = np.zeros(n + count, dtype=bool)
+        if stop < height:
+            edge = labels[-1]
+            continues[roots[edge[edge > 0] + n - 1]] = True
+
+        pieces = {}
+        for root, region_pieces in zip(roots[:n], open_pieces):
+            pieces.setdefault(root, []).extend(region_pieces)
+
+        for geom, label in _shapes(
+            labels, labels > 0, connectivity, window_transform, format=format
+        ):
+            root = roots[label + n - 1]
+            if continued[root] or continues[root]:
+                pieces.setdefault(root, []).append(geom)
+            else:
+                yield geom, _shape_value(values[label])
+
+        for root, region_pieces in sorted(pieces.items()):
+            if not continues[root]:
+                geom = _stitch_pieces(region_pieces, transform, connectivity, format)
+                yield geom, _shape_value(node_values[root])
+
+        if stop < height:
+            open_roots = np.flatnonzero(continues)
+            index = np.zeros(n + count, dtype="int64")
+            index[open_roots] = np.arange(1, len(open_roots) + 1)
+            bottom = np.zeros(width, dtype="int64")
+            bottom[edge > 0] = index[roots[edge[edge > 0] + n - 1]]
+            open_values = node_values[open_roots]
+            open_pieces = [pieces[root] for root in open_roots]
+
+            log.debug(
+                "Polygonized rows %d to %d, %d regions continue",
+                start,
+                stop,
+                len(open_roots),
+            )
+
+
+def _shape_value(value):
+    """Get a value of an image as a value of shapes().
+
+    Values of integer types that fit in 32 bits are integers, as in the
+    fields of polygonized features, and other values are floats.
+    """
+    if value.dtype.name in ("int8", "int16", "int32", "uint8", "uint16"):
+        return int(value)
+    return float(value)
+
+
+def _union_roots(joins, count):
+    """Join items in pairs and find the root of each item's set.
+
+    Pairs are joined by hooking the larger of each pair's roots onto
+    the smaller and then following parents to the roots, until every
+    pair has the same root.
+
+    Parameters
+    ----------
+    joins : numpy.ndarray
+        Pairs of items, of shape (N, 2).
+    count : int
+        The number of items.
+
+    Returns
+    -------
+    numpy.ndarray
+        The root of each item, which is the least item of its set.
+    """
+    roots = np.arange(count, dtype="int64")
+    while True:
+        a = roots[joins[:, 0]]
+        b = roots[joins[:, 1]]
+        unjoined = a != b
+        if not unjoined.any():
+            break
+        a = a[unjoined]
+        b = b[unjoined]
+        lowest = np.minimum(a, b)
+        np.minimum.at(roots, a, lowest)
+        np.minimum.at(roots, b, lowest)
+        while True:
+            next_roots = roots[roots]
+            if np.array_equal(next_roots, roots):
+                break
+            roots = next_roots
+    return roots
+
+
+def _stitch_pieces(pieces, transform, connectivity, format):
+    """Stitch the polygons of adjacent pieces of a region into one.
+
+    Parameters
+    ----------
+    pieces : list
+        GeoJSON-like polygons, or WKB polygons if format is "wkb".
+    transform : Affine
+        The raster's affine transformation.
+    connectivity : int
+        4 or 8.
+    format : str
+        "geojson" or "wkb".
+
+    Returns
+    -------
+    GeoJSON-like dict or WKB bytes
+    """
+    if len(pieces) == 1:
+        return pieces[0]
+
+    # Rings are stitched in pixel coordinates, which are integers.
+    a, b, c, d, e, f = (~transform)[:6]
+    rings = []
+    signs = []
+    for piece in pieces:
+        if format == "wkb":
+            piece = _wkb_to_geojson(piece)
+        for i, ring in enumerate(piece["coordinates"]):
+            xs, ys = np.asarray(ring, dtype="float64")[:, :2].T
+            cols = a * xs + b * ys + c
+            rows = d * xs + e * ys + f
+            ring = np.stack([np.rint(cols), np.rint(rows)], axis=1).astype("int64")
+            sign = np.sign(_ring_area(ring))
+            signs.append((i > 0, sign))
+            if sign != (-1 if i else 1):
+                ring = ring[::-1]
+            rings.append(ring)
+
+    # Exteriors and interiors are made to run as they did in the
+    # pieces.
+    exterior = next(sign for interior, sign in signs if not interior)
+    interior = next((sign for interior, sign in signs if interior), -exterior)
+    a, b, c, d, e, f = transform[:6]
+    coordinates = []
+    for i, ring in enumerate(_stitch_rings(rings, connectivity)):
+        if (exterior if i == 0 else -interior) < 0:
+            ring = ring[::-1]
+        xs = a * ring[:, 0] + b * ring[:, 1] + c
+        ys = d * ring[:, 0] + e * ring[:, 1] + f
+        coordinates.append(list(zip(xs.tolist(), ys.tolist())))
+
+    geom = {"type": "Polygon", "coordinates": coordinates}
+    if format == "wkb":
+        geom = _geojson_to_wkb(geom)
+    return geom
+
+
+def _ring_area(ring):
+    """Twice the signed area of a closed ring."""
+    x = ring[:, 0]
+    y = ring[:, 1]
+    return np.sum(x[:-1] * y[1:] - x[1:] * y[:-1])
+
+
+def _stitch_rings(rings, connectivity):
+    """Stitch the rings of adjacent pieces of a region.
+
+    Edges shared by two pieces run in opposite directions and cancel
+    out. Edges along rows of pixel corners are cut at the ends of all
+    others on the same row so that shared edges match. The remaining
+    edges are followed from vertex to vertex into new rings.
+
+    Parameters
+    ----------
+    rings : list of numpy.ndarray
+        Closed rings of integer pixel coordinates, exteriors with a
+        positive area and interiors with a negative one, of pieces
+        that together make a connected region without overlapping.
+    connectivity : int
+        4 or 8. Where two pixels of the region meet only at a corner,
+        its boundary passes from one to the other only with 8
+        connectivity.
+
+    Returns
+    -------
+    list of numpy.ndarray
+        The closed exterior ring of the region, with a positive area,
+        followed by its interior rings.
+    """
+    starts = np.concatenate([ring[:-1] for ring in rings])
+    ends = np.concatenate([ring[1:] for ring in rings])
+    moved = (starts != ends).any(axis=1)
+    starts = starts[moved]
+    ends = ends[moved]
+    horizontal = starts[:, 1] == ends[:, 1]
+
+    # The directions of horizontal edges are summed between the ends of
+    # edges along each row.
+    h_starts = starts[horizontal]
+    h_ends = ends[horizontal]
+    rows = h_starts[:, 1]
+    directions = np.sign(h_ends[:, 0] - h_starts[:, 0])
+    points = np.concatenate(
+        [
+            np.stack([rows, np.minimum(h_starts[:, 0], h_ends[:, 0])], axis=1),
+            np.stack([rows, np.maximum(h_starts[:, 0], h_ends[:, 0])], axis=1),
+        ]
+    )
+    points, inverse = np.unique(points, axis=0, return_inverse=True)
+    sums = np.zeros(len(points), dtype="int64")
+    np.add.at(sums, inverse.ravel(), np.concatenate([directions, -directions]))
+    sums = np.cumsum(sums)[:-1]
+    kept = (points[1:, 0] == points[:-1, 0]) & (sums != 0)
+    rows = points[:-1, 0][kept]
+    lefts = points[:-1, 1][kept]
+    rights = points[1:, 1][kept]
+    forward = sums[kept] > 0
+    starts = np.concatenate(
+        [
+            starts[~horizontal],
+            np.stack([np.where(forward, lefts, rights), rows], axis=1),
+        ]
+    )
+    ends = np.concatenate(
+        [
+            ends[~horizontal],
+            np.stack([np.where(forward, rights, lefts), rows], axis=1),
+        ]
+    )
+
+    # Rings start from their first vertex in row order. Where two edges
+    # leave a vertex, the boundary turns around the same pixel, to the
+    # left, or to the pixel across the corner.
+    turn = 1 if connectivity == 4 else -1
+    outgoing = {}
+    for i, start in enumerate(map(tuple, starts.tolist())):
+        outgoing.setdefault(start, []).append(i)
+    starts_list = starts.tolist()
+    ends_list = ends.tolist()
+    used = np.zeros(len(starts), dtype=bool)
+    rings = []
+    for first in np.lexsort((starts[:, 0], starts[:, 1])).tolist():
+        if used[first]:
+            continue
+        ring = []
+        i = first
+        while True:
+            used[i] = True
+            ring.append(starts_list[i])
+            (x0, y0), (x1, y1) = starts_list[i], ends_list[i]
+            candidates = outgoing[x1, y1]
+            if len(candidates) == 1:
+                i = candidates[0]
+            else:
+                dx, dy = x1 - x0, y1 - y0
+                for j in candidates:
+                    (_, _), (x2, y2) = starts_list[j], ends_list[j]
+                    if (dx * (y2 - y1) - dy * (x2 - x1)) * turn > 0:
+                        i = j
+                        break
+            if i == first:
+                break
+
+        # Vertices between edges of the same direction are dropped.
+        ring = np.array(ring, dtype="int64")
+        before = ring - np.roll(ring, 1, axis=0)
+        after = np.roll(ring, -1, axis=0) - ring
+        ring = ring[before[:, 0] * after[:, 1] != before[:, 1] * after[:, 0]]
+        rings.append(np.concatenate([ring, ring[:1]]))
+
+    exteriors = [ring for ring in rings if _ring_area(ring) > 0]
+    interiors = [ring for ring in rings if _ring_area(ring) < 0]
+    return exteriors + interiors
+
+
+@ensure_env
+def sieve(
+    source,
+    size,
+    out=None,
+    mask=None,
+    connectivity=4,
+    tiled=False,
+    num_threads=1,
+    mem_limit=64,
+):
     r"""Remove small polygon regions from a raster.
 
     Polygons are found for each set of neighboring pixels of the same
@@ -158,18 +654,31 @@ def sieve(source, size, out=None, mask=None, connectivity=4):
         rasterio.int16, rasterio.int32, rasterio.uint8 or rasterio.uint16.
     size : int
         minimum polygon size (number of pixels) to retain.
-    out : numpy ndarray, optional
+    out : numpy ndarray or Band, optional
         Array of same shape and data type as `source` in which to store
-        results.
+        results, or, in tiled mode, a Band of a dataset opened in "w"
+        or "r+" mode.
     mask : numpy ndarray or rasterio Band object, optional
         Values of False or 0 will be excluded from feature generation
-        Must evaluate to bool (rasterio.bool\_ or rasterio.uint8)
+        Must evaluate to bool (rasterio.bool\_ or rasterio.uint8). Must
+        be a single Band in tiled mode.
     connectivity : int, optional
         Use 4 or 8 pixel connectivity for grouping pixels into features
+    tiled : bool, optional
+        If True, a single source Band is sieved into the `out` Band tile
+        by tile. Only the regions touching the edges between tiles are
+        tracked across the raster, so that the whole raster never needs
+        to be in memory. Default: False.
+    num_threads : int, optional
+        Number of threads labeling and sieving tiles concurrently in
+        tiled mode. Default: 1.
+    mem_limit : int, optional
+        Approximate limit in MB of the memory used for tiles in tiled
+        mode. Default: 64.
 
     Returns
     -------
-    out : numpy.ndarray
+    out : numpy.ndarray or Band
         Result
 
     Notes
@@ -187,16 +696,437 @@ def sieve(source, size, out=None, mask=None, connectivity=4):
 
     - :cpp:func:`GDALSieveFilter`
 
+    In tiled mode, GDAL is not used, but the result is the same. Small
+    regions are merged into their largest neighboring region, as by
+    GDALSieveFilter, and ties between neighbors of the same size are
+    broken in favor of the region found first. Tiles are read up to three
+    times. Memory is used for tiles up to `mem_limit` and for a few
+    numbers per region touching the edges between tiles.
+
     """
     if isinstance(source, DatasetBase):
         source = rasterio.band(source, source.indexes)
 
+    if tiled:
+        if not isinstance(source, tuple) or not isinstance(source.bidx, int):
+            raise ValueError("A tiled sieve requires a single source band")
+        if not isinstance(out, tuple) or not isinstance(out.bidx, int):
+            raise ValueError("A tiled sieve requires a single output band")
+        if out.ds.shape != source.ds.shape:
+            raise ValueError("out raster shape must be same as image shape")
+        if np.dtype(source.dtype).name not in (int16, int32, uint8, uint16):
+            raise ValueError(
+                "image dtype must be one of: rasterio.int16, rasterio.int32, "
+                "rasterio.uint8, rasterio.uint16"
+            )
+        if not isinstance(size, int) or size <= 0:
+            raise ValueError("size must be an integer number of pixels greater than 0")
+        if connectivity not in (4, 8):
+            raise ValueError("connectivity must be 4 or 8")
+        if mask is not None:
+            if not isinstance(mask, tuple) or not isinstance(mask.bidx, int):
+                raise ValueError("A tiled sieve requires a single mask band")
+            if mask.ds.shape != source.ds.shape:
+                raise ValueError("Mask must have same shape as image")
+
+        _sieve_tiled(source, size, out, mask, connectivity, num_threads, mem_limit)
+        return out
+
     if out is None:
         out = np.zeros(source.shape, dtype=source.dtype)
 
     return _sieve(source, size, out, mask, connectivity)
 
 
+def _neighbor_pairs(labels, connectivity, row_off, col_off, width):
+    """Get the pairs of different labels of adjacent pixels.
+
+    Pairs are ordered as GDALSieveFilter meets them, scanning the rows
+    of a raster and comparing each pixel with its neighbors above,
+    above left, above right, and to the left.
+
+    Parameters
+    ----------
+    labels : numpy.ndarray
+        2-D array of labels. Pixels labeled 0 are ignored.
+    connectivity : int
+        4 or 8.
+    row_off, col_off : int
+        Offsets of the array in the raster.
+    width : int
+        Width of the raster.
+
+    Returns
+    -------
+    pairs : numpy.ndarray
+        Array of unique (lesser, greater) label pairs, of shape (N, 2).
+    orders : numpy.ndarray
+        The position in the scan of the raster at which each pair is
+        first met.
+    """
+    # Each comparison of a pixel with an earlier one is numbered
+    # within the pixel.
+    shifted = [(0, labels[1:], labels[:-1], 1, 0)]
+    if connectivity == 8:
+        shifted += [
+            (1, labels[1:, 1:], labels[:-1, :-1], 1, 1),
+            (2, labels[1:, :-1], labels[:-1, 1:], 1, 0),
+        ]
+    shifted.append((3, labels[:, 1:], labels[:, :-1], 0, 1))
+
+    pairs = []
+    orders = []
+    for k, later, earlier, row_shift, col_shift in shifted:
+        i, j = np.nonzero((later != earlier) & (later > 0) & (earlier > 0))
+        a = later[i, j].astype("int64")
+        b = earlier[i, j].astype("int64")
+        pairs.append(np.stack([np.minimum(a, b), np.maximum(a, b)], axis=1))
+        orders.append(
+            ((row_off + row_shift + i) * width + col_off + col_shift + j) * 4 + k
+        )
+
+    pairs = np.concatenate(pairs)
+    orders = np.concatenate(orders)
+    ordered = np.lexsort((orders, pairs[:, 1], pairs[:, 0]))
+    pairs = pairs[ordered]
+    orders = orders[ordered]
+    first = np.ones(len(pairs), dtype=bool)
+    first[1:] = (pairs[1:] != pairs[:-1]).any(axis=1)
+    return pairs[first], orders[first]
+
+
+def _largest_neighbors(regions, neighbors, orders, sizes):
+    """Find the largest neighbor of regions.
+
+    Ties between neighbors of the same size are broken in favor of the
+    neighbor met first, as by GDALSieveFilter.
+
+    Parameters
+    ----------
+    regions, neighbors : numpy.ndarray
+        Regions and one of their neighbors.
+    orders : numpy.ndarray
+        The order in which each neighbor is met.
+    sizes : numpy.ndarray
+        The size of every region.
+
+    Returns
+    -------
+    regions, neighbors : numpy.ndarray
+        Each region and its largest neighbor.
+    """
+    ordered = np.lexsort((orders, -sizes[neighbors], regions))
+    regions = regions[ordered]
+    neighbors = neighbors[ordered]
+    first = np.ones(len(regions), dtype=bool)
+    first[1:] = regions[1:] != regions[:-1]
+    return regions[first], neighbors[first]
+
+
+def _both_ways(pairs, orders):
+    """Get the regions of pairs and their neighbors, in both directions."""
+    return (
+        np.concatenate([pairs[:, 0], pairs[:, 1]]),
+        np.concatenate([pairs[:, 1], pairs[:, 0]]),
+        np.concatenate([orders, orders]),
+    )
+
+
+def _chain_ends(targets):
+    """Follow chains of targets to their ends.
+
+    Parameters
+    ----------
+    targets : numpy.ndarray
+        The target of each item. Chains end at items that are their own
+        target.
+
+    Returns
+    -------
+    numpy.ndarray
+        The end of the chain of each item. Chains that run into a cycle
+        end at an item of the cycle.
+    """
+    steps = 1
+    while steps < len(targets):
+        targets = targets[targets]
+        steps *= 2
+    return targets
+
+
+def _sieve_tiled(source, size, out, mask, connectivity, num_threads, mem_limit):
+    """Sieve a band into another band, tile by tile.
+
+    As by GDALSieveFilter, a small region takes the value of the first
+    region of at least `size` pixels that is found by going from it to
+    its largest neighbor, then to that neighbor's largest neighbor, and
+    so on. A small region is kept if no such region is found.
+
+    The regions of each tile are labeled in a first pass. Only the
+    regions touching the edges between tiles, the seams, are numbered
+    across the raster, along with the regions next to them that they
+    might be merged into. Regions of the same value are joined across
+    seams and the largest neighbors of the small ones are found with
+    array operations. Chains of small regions that leave the seams
+    are followed within their tiles in a second pass over only those
+    tiles. The regions of each tile, which are complete within it
+    unless they touch a seam, are labeled again in a third pass and
+    their new values are written.
+
+    Parameters
+    ----------
+    source : Band
+        A single band of a dataset opened in "r" or "r+" mode.
+    size, mask, connectivity, num_threads, mem_limit
+        See sieve().
+    out : Band
+        A single band of a dataset opened in "w" or "r+" mode. May be
+        the source band.
+
+    Returns
+    -------
+    None
+    """
+    src, bidx = source.ds, source.bidx
+    dst, dst_bidx = out.ds, out.bidx
+
+    # Labeling and finding neighbors use up to about 96 bytes per pixel.
+    max_pixels = mem_limit * 1.0e6 / (96 * max(num_threads, 1))
+    tiles = _chunk_plan(
+        windows.Window(0, 0, src.width, src.height),
+        max_pixels,
+        dst.block_shapes[dst_bidx - 1],
+    )
+    tile_height = tiles[0].height
+    tile_width = tiles[0].width
+    index = {(tile.row_off, tile.col_off): i for i, tile in enumerate(tiles)}
+
+    log.debug(
+        "Sieving %d tiles of %d x %d pixels using %d threads",
+        len(tiles),
+        tile_width,
+        tile_height,
+        num_threads,
+    )
+
+    def read(tile):
+        data = src.read(bidx, window=tile)
+        tile_mask = None if mask is None else mask.ds.read(mask.bidx, window=tile)
+        return tile, data, tile_mask
+
+    def label(item):
+        tile, data, tile_mask = item
+        labels, count = _label_regions(data, tile_mask, connectivity)
+        sizes = np.bincount(labels.ravel(), minlength=count + 1)
+        values = np.zeros(count + 1, dtype="int64")
+        values[labels.ravel()] = data.ravel()
+        pairs, orders = _neighbor_pairs(
+            labels, connectivity, tile.row_off, tile.col_off, src.width
+        )
+        return tile, labels, sizes, values, pairs, orders
+
+    def summarize(item):
+        tile, labels, sizes, values, pairs, orders = label(item)
+
+        # Only the sides of a tile that face another tile are seams.
+        sides = (
+            labels[0] if tile.row_off > 0 else None,
+            labels[-1] if tile.row_off + tile.height < src.height else None,
+            labels[:, 0] if tile.col_off > 0 else None,
+            labels[:, -1] if tile.col_off + tile.width < src.width else None,
+        )
+        seam = np.unique(
+            np.concatenate([[0]] + [side for side in sides if side is not None])
+        )[1:]
+        is_seam = np.zeros(len(sizes), dtype=bool)
+        is_seam[seam] = True
+
+        # The neighbors of seam regions that may be small.
+        regions, neighbors, orders = _both_ways(pairs, orders)
+        needed = is_seam[regions] & (sizes[regions] < size)
+        regions = regions[needed]
+        neighbors = neighbors[needed]
+        orders = orders[needed]
+
+        # Seam regions are numbered first, then their neighbors within
+        # the tile.
+        nodes = np.concatenate([seam, np.unique(neighbors[~is_seam[neighbors]])])
+        local = np.zeros(len(sizes), dtype="int64")
+        local[nodes] = np.arange(len(nodes))
+        sides = tuple(
+            None if side is None else np.where(side > 0, local[side] + 1, 0)
+            for side in sides
+        )
+        return (
+            tile,
+            nodes,
+            len(seam),
+            sizes[nodes],
+            values[nodes],
+            sides,
+            (local[regions], local[neighbors], orders),
+        )
+
+    # First pass: label the regions of each tile and keep those along
+    # seams.
+    results = [None] * len(tiles)
+    for tile, *result in _imap_tiles(summarize, map(read, tiles), num_threads):
+        results[index[tile.row_off, tile.col_off]] = result
+
+    bases = np.cumsum([0] + [len(result[0]) for result in results])
+    total = bases[-1]
+    node_sizes = np.concatenate([result[2] for result in results])
+    node_values = np.concatenate([result[3] for result in results])
+    is_seam = np.concatenate(
+        [np.arange(len(result[0])) < result[1] for result in results]
+    )
+
+    def side_ids(row_off, col_off, side):
+        """Numbers, plus 1, of the regions along a side of a tile."""
+        i = index[row_off, col_off]
+        ids = results[i][4][side]
+        return np.where(ids > 0, ids + bases[i], 0)
+
+    # Pixels on either side of the seams. Each pair of rows or columns
+    # spans the raster.
+    seams = [(np.empty((0, 2), dtype="int64"), np.empty(0, dtype="int64"))]
+    for row_off in range(tile_height, src.height, tile_height):
+        seam = np.stack(
+            [
+                np.concatenate(
+                    [
+                        side_ids(row_off - tile_height, col_off, 1)
+                        for col_off in range(0, src.width, tile_width)
+                    ]
+                ),
+                np.concatenate(
+                    [
+                        side_ids(row_off, col_off, 0)
+                        for col_off in range(0, src.width, tile_width)
+                    ]
+                ),
+            ]
+        )
+        seams.append(_neighbor_pairs(seam, connectivity, row_off - 1, 0, src.width))
+    for col_off in range(tile_width, src.width, tile_width):
+        seam = np.stack(
+            [
+                np.concatenate(
+                    [
+                        side_ids(row_off, col_off - tile_width, 3)
+                        for row_off in range(0, src.height, tile_height)
+                    ]
+                ),
+                np.concatenate(
+                    [
+                        side_ids(row_off, col_off, 2)
+                        for row_off in range(0, src.height, tile_height)
+                    ]
+                ),
+            ],
+            axis=1,
+        )
+        seams.append(_neighbor_pairs(seam, connectivity, 0, col_off - 1, src.width))
+
+    pairs = np.concatenate([pairs for pairs, _ in seams]) - 1
+    orders = np.concatenate([orders for _, orders in seams])
+    same = node_values[pairs[:, 0]] == node_values[pairs[:, 1]]
+    joins = pairs[same]
+
+    # Regions of the same value that meet across seams are joined.
+    roots = _union_roots(joins, total)
+    node_sizes = np.bincount(roots, weights=node_sizes, minlength=total)
+    node_sizes = node_sizes.astype("int64")[roots]
+
+    # The largest neighbor of each small seam region, found among its
+    # neighbors across seams and within each of its tiles.
+    regions, neighbors, orders = _both_ways(pairs[~same], orders[~same])
+    regions = [regions]
+    neighbors = [neighbors]
+    orders = [orders]
+    for base, result in zip(bases, results):
+        regions.append(result[5][0] + base)
+        neighbors.append(result[5][1] + base)
+        orders.append(result[5][2])
+    regions = roots[np.concatenate(regions)]
+    neighbors = roots[np.concatenate(neighbors)]
+    orders = np.concatenate(orders)
+    small = node_sizes < size
+    needed = small[regions]
+    regions, neighbors = _largest_neighbors(
+        regions[needed], neighbors[needed], orders[needed], node_sizes
+    )
+
+    # Chains end at large regions, which keep their values, and at
+    # small regions without neighbors, which also keep them.
+    targets = roots.copy()
+    targets[regions] = neighbors
+    found = ~small
+    new_values = node_values.copy()
+
+    def resolve(item):
+        """Find where the chain of each region of a tile ends."""
+        tile, labels, sizes, values, pairs, orders = label(item)
+        i = index[tile.row_off, tile.col_off]
+        nodes = results[i][0]
+        seam = nodes[: results[i][1]]
+        sizes[seam] = node_sizes[bases[i] : bases[i] + len(seam)]
+        small = sizes < size
+        small[seam] = False
+        regions, neighbors, orders = _both_ways(pairs, orders)
+        needed = small[regions]
+        regions, neighbors = _largest_neighbors(
+            regions[needed], neighbors[needed], orders[needed], sizes
+        )
+        targets = np.arange(len(sizes))
+        targets[regions] = neighbors
+        return tile, labels, sizes, values, _chain_ends(targets)
+
+    # Second pass: follow the chains of small regions within the tiles
+    # where the chains of small seam regions lead.
+    inner = np.unique(neighbors[~is_seam[neighbors] & small[neighbors]])
+    tile_ids = np.searchsorted(bases, inner, side="right") - 1
+    wanted = np.unique(tile_ids)
+    log.debug("Following chains of small regions in %d tiles", len(wanted))
+    for tile, _, sizes, values, ends in _imap_tiles(
+        resolve, map(read, [tiles[i] for i in wanted]), num_threads
+    ):
+        i = index[tile.row_off, tile.col_off]
+        ids = inner[tile_ids == i]
+        nodes = results[i][0]
+        seam = nodes[: results[i][1]]
+        ends = ends[nodes[ids - bases[i]]]
+        large = sizes[ends] >= size
+        found[ids[large]] = True
+        new_values[ids[large]] = values[ends[large]]
+        to_seam = ~large & np.isin(ends, seam)
+        targets[ids[to_seam]] = roots[np.searchsorted(seam, ends[to_seam]) + bases[i]]
+
+    ends = _chain_ends(targets)
+    found = found[ends]
+    new_values = new_values[ends]
+
+    def sieve_tile(item):
+        tile, data, _ = item
+        _, labels, sizes, values, ends = resolve(item)
+        i = index[tile.row_off, tile.col_off]
+        seam = results[i][0][: results[i][1]]
+        tile_found = sizes >= size
+        tile_found[seam] = found[bases[i] : bases[i] + len(seam)]
+        tile_values = values.copy()
+        tile_values[seam] = new_values[bases[i] : bases[i] + len(seam)]
+        values = np.where(tile_found[ends], tile_values[ends], values)
+        valid = labels > 0
+        result = data.copy()
+        result[valid] = values[labels[valid]]
+        return tile, result
+
+    # Third pass: label the regions of each tile again and write their
+    # new values.
+    for tile, result in _imap_tiles(sieve_tile, map(read, tiles), num_threads):
+        dst.write(result, dst_bidx, window=tile)
+
+
 @ensure_env
 def rasterize(
     shapes,
@@ -213,6 +1143,9 @@ def rasterize(
     skip_invalid=True,
     dst_path=None,
     dst_kwds=None,
+    tiled=False,
+    num_threads=1,
+    mem_limit=64,
 ):
     """Burn vector shapes into an array.
 
@@ -223,10 +1156,15 @@ def rasterize(
     Parameters
     ----------
     shapes : iterable of shapes or shape, value pairs
-        The `shape` can be an object that implements the geo interface
-        or a GeoJSON-like object. If no `value` is provided the
-        `default_value` will be used. If `value` is `None` the `fill`
-        value will be used.
+        The `shape` can be WKB bytes, an object with a `wkb` attribute
+        such as a Shapely geometry, an object that implements the geo
+        interface, or a GeoJSON-like object. WKB is converted to OGR
+        geometries without making Python objects of coordinates and is
+        much faster for large numbers of shapes. See
+        wkb_from_ragged_array() for a way to rasterize coordinate and
+        offset arrays. If no `value` is provided the `default_value`
+        will be used. If `value` is `None` the `fill` value will be
+        used.
     out_shape : tuple or list with 2 integers
         Shape of output :class:`numpy.ndarray`.
     fill : int or float, optional
@@ -266,12 +1204,25 @@ def rasterize(
     dst_kwds : dict, optional
         Dictionary of creation options and other parameters that will be
         overlaid on the profile of the output dataset.
+    tiled : bool, optional
+        If True, shapes are burned into the output dataset tile by tile.
+        Tiles are aligned to the dataset's blocks and each is burned
+        only with the shapes whose bounds intersect it. Every pixel of
+        every band is written and pixels not covered by shapes are set
+        to `fill`. Requires `dst_path`. Default: False.
+    num_threads : int, optional
+        Number of threads burning tiles concurrently in tiled mode.
+        Default: 1.
+    mem_limit : int, optional
+        Approximate limit in MB of the memory used for tiles in tiled
+        mode. Default: 64.
 
     Returns
     -------
     numpy.ndarray :
         If `out` was not None then `out` is returned, it will have been
         modified in-place. If `out` was None, this will be a new array.
+        Nothing is returned if the output is a dataset.
 
     Notes
     -----
@@ -291,6 +1242,11 @@ def rasterize(
     function of buffer size. For maximum speed, ensure that
     GDAL_CACHEMAX is larger than the size of `out` or `out_shape`.
 
+    In tiled mode, memory use is bounded by `mem_limit` and the shapes
+    list instead of the size of the output dataset. Shapes are indexed
+    by their bounds on a grid of tiles, so the work done for each tile
+    depends only on the shapes that intersect it.
+
     GDAL functions used:
 
     - :cpp:func:`GDALRasterizeGeometries`
@@ -340,7 +1296,7 @@ def rasterize(
             geom = item
             value = default_value
 
-        geom = getattr(geom, "__geo_interface__", None) or geom
+        geom = _geometry_input(geom)
 
         shape_values.append(value)
         valid_shapes.append((geom, value))
@@ -381,7 +1337,22 @@ def rasterize(
 
         transform = guard_transform(transform)
 
-        if valid_shapes:
+        if tiled and isinstance(out, np.ndarray):
+            raise ValueError("Tiled rasterization requires an output dataset")
+
+        if tiled:
+            _rasterize_tiled(
+                valid_shapes,
+                out,
+                fill,
+                all_touched,
+                merge_alg,
+                skip_invalid,
+                num_threads,
+                mem_limit,
+            )
+
+        elif valid_shapes:
             _rasterize(
                 valid_shapes,
                 out,
@@ -397,6 +1368,220 @@ def rasterize(
             return out
 
 
+def _rasterize_tiled(
+    shapes, dst, fill, all_touched, merge_alg, skip_invalid, num_threads, mem_limit
+):
+    """Burn shapes into every band of a dataset, tile by tile.
+
+    Parameters
+    ----------
+    shapes : list of (geometry, value) pairs
+        GeoJSON-like geometries in the dataset's coordinate system.
+    dst : dataset object opened in 'w' or 'r+' mode
+        The output dataset.
+    fill, all_touched, merge_alg, skip_invalid, num_threads, mem_limit
+        See rasterize().
+
+    Returns
+    -------
+    None
+    """
+    dtype = dst.dtypes[0]
+    # _imap_tiles() keeps up to two tiles per thread in flight.
+    max_pixels = (
+        mem_limit * 1.0e6 / (np.dtype(dtype).itemsize * 2 * max(num_threads, 1))
+    )
+    tiles = _chunk_plan(
+        windows.Window(0, 0, dst.width, dst.height), max_pixels, dst.block_shapes[0]
+    )
+    tile_height = tiles[0].height
+    tile_width = tiles[0].width
+    tile_rows = math.ceil(dst.height / tile_height)
+    tile_cols = math.ceil(dst.width / tile_width)
+
+    # Index shapes by the tiles that their pixel bounds intersect.
+    # Bounds are padded by a pixel so that shapes touching a tile's
+    # edge are included when all_touched is True.
+    # The pixel bounds of a shape are those of its transformed envelope,
+    # which are found without visiting the coordinates of WKB shapes.
+    index = defaultdict(list)
+    inverse = ~dst.transform
+    envelopes = bounds_array([geom for geom, _ in shapes])
+    xs = envelopes[:, [0, 0, 2, 2]]
+    ys = envelopes[:, [1, 3, 1, 3]]
+    cols = inverse.a * xs + inverse.b * ys + inverse.c
+    rows = inverse.d * xs + inverse.e * ys + inverse.f
+    row_starts = np.floor((rows.min(axis=1) - 1) / tile_height)
+    row_stops = np.floor((rows.max(axis=1) + 1) / tile_height)
+    col_starts = np.floor((cols.min(axis=1) - 1) / tile_width)
+    col_stops = np.floor((cols.max(axis=1) + 1) / tile_width)
+
+    for i, (geom, value) in enumerate(shapes):
+        if np.isnan(envelopes[i, 0]):
+            try:
+                bounds(geom)
+                error = ValueError("Shape has no bounds")
+            except Exception as exc:
+                error = exc
+            if skip_invalid:
+                warnings.warn(
+                    f"Invalid shape will not be rasterized: {geom=}, index={i}, {value=}, {error=}",
+                    ShapeSkipWarning,
+                )
+                continue
+            raise InvalidShapeError("Invalid shape will not be rasterized") from error
+
+        row_start = max(0, int(row_starts[i]))
+        row_stop = min(tile_rows - 1, int(row_stops[i]))
+        col_start = max(0, int(col_starts[i]))
+        col_stop = min(tile_cols - 1, int(col_stops[i]))
+
+        for tile_row in range(row_start, row_stop + 1):
+            for tile_col in range(col_start, col_stop + 1):
+                index[tile_row, tile_col].append(i)
+
+    log.debug(
+        "Rasterizing %d shapes in %d tiles using %d threads",
+        len(shapes),
+        len(tiles),
+        num_threads,
+    )
+
+    def burn(tile):
+        arr = np.empty((tile.height, tile.width), dtype=dtype)
+        arr.fill(fill)
+        tile_shapes = [
+            shapes[i]
+            for i in index.get(
+                (tile.row_off // tile_height, tile.col_off // tile_width), []
+            )
+        ]
+        if tile_shapes:
+            _rasterize(
+                tile_shapes,
+                arr,
+                windows.transform(tile, dst.transform),
+                all_touched,
+                merge_alg,
+                skip_invalid=skip_invalid,
+            )
+        return tile, arr
+
+    # Each tile is burned once and written to every band, as _rasterize()
+    # burns the same shapes into every band of a dataset.
+    for tile, arr in _imap_tiles(burn, tiles, num_threads):
+        for bidx in dst.indexes:
+            dst.write(arr, bidx, window=tile)
+
+
+def _geometry_input(geom):
+    """Normalize a geometry for rasterization.
+
+    WKB bytes are passed through and objects with a WKB representation,
+    such as Shapely geometries, are converted to WKB. Otherwise, the
+    object's geo interface or the object itself is returned.
+    """
+    if isinstance(geom, (bytes, bytearray, memoryview)):
+        return geom
+
+    wkb = getattr(geom, "wkb", None)
+    if isinstance(wkb, bytes):
+        return wkb
+
+    return getattr(geom, "__geo_interface__", None) or geom
+
+
+# WKB type codes and numbers of offset arrays of geometry types.
+_WKB_GEOMETRY_TYPES = {
+    "POINT": (1, 0),
+    "LINESTRING": (2, 1),
+    "POLYGON": (3, 2),
+    "MULTIPOINT": (4, 1),
+    "MULTILINESTRING": (5, 2),
+    "MULTIPOLYGON": (6, 3),
+}
+
+# Number of WKB geometries made at a time from ragged arrays.
+_RAGGED_BATCH_SIZE = 65536
+
+
+def wkb_from_ragged_array(geometry_type, coords, offsets=()):
+    """Make WKB geometries from coordinate and offset arrays.
+
+    The arrays are those of the GeoArrow "separated" encoding as
+    returned by shapely.to_ragged_array(). The WKB can be passed to
+    rasterize(), geometry_mask(), and mask() without building
+    GeoJSON-like objects.
+
+    Parameters
+    ----------
+    geometry_type : str or enum
+        One of "Point", "LineString", "Polygon", "MultiPoint",
+        "MultiLineString", or "MultiPolygon", or a member of an enum
+        such as shapely.GeometryType with one of these names.
+    coords : array_like
+        An (N, 2) or (N, 3) array of coordinates.
+    offsets : tuple of array_like
+        Offsets into the coordinates and parts. None for points; the
+        coordinate offsets of geometries for line strings and multi
+        points; the coordinate offsets of rings and ring offsets of
+        geometries for polygons; the coordinate offsets of parts and
+        part offsets of geometries for multi line strings; and the
+        coordinate offsets of rings, ring offsets of polygons, and
+        polygon offsets of geometries for multi polygons.
+
+    Yields
+    ------
+    bytes
+        A WKB geometry.
+
+    Examples
+    --------
+
+    >>> geometry_type, coords, offsets = shapely.to_ragged_array(polygons)
+    >>> shapes = zip(wkb_from_ragged_array(geometry_type, coords, offsets), values)
+    >>> image = rasterize(shapes, out_shape=(1024, 1024), transform=transform)
+
+    """
+    name = str(getattr(geometry_type, "name", geometry_type)).upper()
+    if name not in _WKB_GEOMETRY_TYPES:
+        raise ValueError(f"Unsupported geometry type {geometry_type}")
+
+    coords = np.ascontiguousarray(coords, dtype="float64")
+    if coords.ndim != 2 or coords.shape[1] not in (2, 3):
+        raise ValueError("coords must be an array with shape (N, 2) or (N, 3)")
+
+    code, levels = _WKB_GEOMETRY_TYPES[name]
+    offsets = [np.ascontiguousarray(arr, dtype="int64") for arr in (offsets or ())]
+    if not levels:
+        offsets = []
+        count = len(coords)
+    elif len(offsets) != levels:
+        raise ValueError(f"{name.title()} geometries require {levels} offset arrays")
+    else:
+        count = len(offsets[-1]) - 1
+
+    # Offsets are indices into the coordinates or into the parts of
+    # the next inner level, and the writer does not check them.
+    size = len(coords)
+    for arr in offsets:
+        if (
+            arr.ndim != 1
+            or len(arr) == 0
+            or arr[0] < 0
+            or arr[-1] > size
+            or (np.diff(arr) < 0).any()
+        ):
+            raise ValueError(
+                "offsets must be nondecreasing indices of coordinates or parts"
+            )
+        size = len(arr) - 1
+
+    writer = _RaggedWKBWriter(code, coords, offsets)
+    for start in range(0, count, _RAGGED_BATCH_SIZE):
+        yield from writer.build(start, min(start + _RAGGED_BATCH_SIZE, count))
+
+
 def bounds(geometry, north_up=True, transform=None):
     """Get the bounding box (left, bottom, right, top) of the geometry.
 
@@ -406,7 +1591,7 @@ def bounds(geometry, north_up=True, transform=None):
     Parameters
     ----------
     geometry: GeoJSON-like feature (implements __geo_interface__),
-        feature collection, or geometry.
+        feature collection, geometry, or WKB bytes.
     north_up : bool, optional
         Whether the bounding box should be oriented north-up (the
         default), or flipped south-up.
@@ -420,6 +1605,9 @@ def bounds(geometry, north_up=True, transform=None):
         Bounding box: (left, bottom, right, top)
     """
 
+    if isinstance(geometry, (bytes, bytearray, memoryview)):
+        return _wkb_bounds(geometry, north_up=north_up, transform=transform)
+
     geometry = getattr(geometry, "__geo_interface__", None) or geometry
 
     if "bbox" in geometry and north_up and not transform:
@@ -437,6 +1625,126 @@ def bounds(geometry, north_up=True, transform=None):
     return _bounds(geom, north_up=north_up, transform=transform)
 
 
+def bounds_array(geometries=None, transform=None, coords=None, offsets=()):
+    """Get the bounding boxes of many geometries.
+
+    Geometries may be given as a sequence or as coordinate and offset
+    arrays. WKB geometries, objects with a WKB representation such as
+    Shapely geometries, and coordinate arrays are bounded without
+    making Python objects of their coordinates.
+
+    Parameters
+    ----------
+    geometries : sequence, optional
+        GeoJSON-like features or geometries, objects with a geo
+        interface or WKB representation, or WKB bytes.
+    transform : Affine, optional
+        If provided, the geometries' coordinates will be transformed
+        prior to bounding box calculation.
+    coords : array_like, optional
+        An (N, 2) or (N, 3) array of coordinates, instead of
+        geometries.
+    offsets : tuple of array_like, optional
+        The offset arrays of the GeoArrow "separated" encoding of the
+        coordinates, as returned by shapely.to_ragged_array(). If empty,
+        each coordinate is a point geometry.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (n, 4) array of the (left, bottom, right, top) bounds of
+        each geometry, with the least y value in the bottom column.
+        Rows of invalid geometries are NaN.
+
+    """
+    if coords is not None:
+        coords = np.asarray(coords, dtype="float64")[:, :2]
+        xs = coords[:, 0]
+        ys = coords[:, 1]
+        if transform is not None:
+            xs, ys = (
+                transform.a * xs + transform.b * ys + transform.c,
+                transform.d * xs + transform.e * ys + transform.f,
+            )
+
+        if not len(offsets):
+            return np.stack([xs, ys, xs, ys], axis=1)
+
+        # Offsets of each geometry's coordinates.
+        coord_offsets = np.asarray(offsets[0], dtype="int64")
+        for geom_offsets in offsets[1:]:
+            coord_offsets = coord_offsets[np.asarray(geom_offsets, dtype="int64")]
+
+        result = np.full((len(coord_offsets) - 1, 4), np.nan)
+        starts = coord_offsets[:-1]
+        nonempty = coord_offsets[1:] > starts
+        if nonempty.any():
+            starts = starts[nonempty]
+            result[nonempty] = np.stack(
+                [
+                    np.minimum.reduceat(xs, starts),
+                    np.minimum.reduceat(ys, starts),
+                    np.maximum.reduceat(xs, starts),
+                    np.maximum.reduceat(ys, starts),
+                ],
+                axis=1,
+            )
+            # reduceat() reduces to the next start, which is beyond
+            # the end of a geometry followed by empty geometries.
+            stops = coord_offsets[1:][nonempty]
+            gaps = np.append(starts[1:], len(xs)) != stops
+            for i, start, stop in zip(
+                np.flatnonzero(nonempty)[gaps], starts[gaps], stops[gaps]
+            ):
+                result[i] = (
+                    xs[start:stop].min(),
+                    ys[start:stop].min(),
+                    xs[start:stop].max(),
+                    ys[start:stop].max(),
+                )
+        return result
+
+    geometries = [_geometry_input(geom) for geom in geometries]
+    is_wkb = [isinstance(geom, (bytes, bytearray, memoryview)) for geom in geometries]
+    result = np.full((len(geometries), 4), np.nan)
+
+    if any(is_wkb):
+        wkb_rows = np.flatnonzero(is_wkb)
+        result[wkb_rows] = _wkb_bounds_array(
+            [geometries[i] for i in wkb_rows],
+            transform=None
+            if transform is None or transform.is_rectilinear
+            else transform,
+        )
+
+    for i, (geom, wkb) in enumerate(zip(geometries, is_wkb)):
+        if wkb:
+            continue
+        try:
+            if transform is None or transform.is_rectilinear:
+                result[i] = bounds(geom)
+            else:
+                result[i] = bounds(geom, transform=transform)
+        except Exception:
+            continue
+
+    if transform is not None and transform.is_rectilinear:
+        # The transformed envelopes are the envelopes of the
+        # transformed geometries. All four corners are transformed
+        # because transforms rotated by 90 degrees swap the axes.
+        xs = result[:, [0, 0, 2, 2]]
+        ys = result[:, [1, 3, 1, 3]]
+        xs, ys = (
+            transform.a * xs + transform.b * ys + transform.c,
+            transform.d * xs + transform.e * ys + transform.f,
+        )
+        result = np.stack(
+            [xs.min(axis=1), ys.min(axis=1), xs.max(axis=1), ys.max(axis=1)], axis=1
+        )
+
+    return result
+
+
 def geometry_window(
     dataset,
     shapes,
@@ -530,6 +1838,80 @@ def geometry_window(
     return bounding_window
 
 
+def geometry_windows(
+    dataset,
+    geometries=None,
+    pad_x=0,
+    pad_y=0,
+    boundless=False,
+    coords=None,
+    offsets=(),
+):
+    """Calculate the windows within the raster that fit many geometries.
+
+    This is the vectorized equivalent of calling geometry_window() for
+    each geometry.
+
+    Parameters
+    ----------
+    dataset : dataset object opened in 'r' mode
+        Raster for which the windows will be calculated.
+    geometries, coords, offsets
+        See bounds_array(). Must be in same coordinate system as
+        dataset.
+    pad_x : float
+        Amount of padding (as fraction of raster's x pixel size) to add
+        to left and right side of bounds.
+    pad_y : float
+        Amount of padding (as fraction of raster's y pixel size) to add
+        to top and bottom of bounds.
+    boundless : bool, optional
+        Whether to allow boundless windows or not.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (n, 4) int64 array of the (col_off, row_off, width, height)
+        of the window of each geometry, the arguments of
+        rasterio.windows.Window. Windows of geometries that do not
+        overlap the raster, or are invalid, have no width and height.
+
+    """
+    geom_bounds = bounds_array(geometries, coords=coords, offsets=offsets)
+    invalid = np.isnan(geom_bounds).any(axis=1)
+    geom_bounds[invalid] = 0.0
+
+    # Pixel coordinates of the corners of the bounds.
+    xs = geom_bounds[:, [0, 2, 2, 0]]
+    ys = geom_bounds[:, [3, 3, 1, 1]]
+    inverse = ~dataset.transform
+    cols = inverse.a * xs + inverse.b * ys + inverse.c
+    rows = inverse.d * xs + inverse.e * ys + inverse.f
+
+    col_start = np.floor(cols.min(axis=1) - pad_x)
+    row_start = np.floor(rows.min(axis=1) - pad_y)
+    col_stop = np.ceil(cols.max(axis=1) + pad_x)
+    row_stop = np.ceil(rows.max(axis=1) + pad_y)
+
+    if not boundless:
+        col_start = col_start.clip(0, dataset.width)
+        row_start = row_start.clip(0, dataset.height)
+        col_stop = col_stop.clip(0, dataset.width)
+        row_stop = row_stop.clip(0, dataset.height)
+
+    result = np.stack(
+        [
+            col_start,
+            row_start,
+            np.maximum(col_stop - col_start, 0),
+            np.maximum(row_stop - row_start, 0),
+        ],
+        axis=1,
+    ).astype("int64")
+    result[invalid, 2:] = 0
+    return result
+
+
 def is_valid_geom(geom):
     """
     Checks to see if geometry is a valid GeoJSON geometry type or
@@ -627,6 +2009,10 @@ def is_valid_geom(geom):
     return True
 
 
+# Number of pixels read at a time by dataset_features().
+_FEATURES_WINDOW_PIXELS = 1 << 20
+
+
 def dataset_features(
     src,
     bidx=None,
@@ -636,6 +2022,8 @@ def dataset_features(
     with_nodata=False,
     geographic=True,
     precision=-1,
+    format="geojson",
+    window_height=None,
 ):
     """Yield GeoJSON features for the dataset
 
@@ -666,6 +2054,17 @@ def dataset_features(
     precision: int (DEFAULT: -1)
         Decimal precision of coordinates. -1 for full float precision output
 
+    format: str (DEFAULT: "geojson")
+        Make feature geometries GeoJSON-like dicts or, if "wkb", WKB
+        bytes. WKB geometries in the native CRS are exported without
+        making Python objects of their coordinates.
+
+    window_height: int (DEFAULT: None)
+        Read and polygonize the dataset in windows of this many rows,
+        as shapes() does. By default, windows are whole rows of blocks
+        of about a million pixels. Not valid with sampling > 1, in which
+        case the decimated dataset is read at once.
+
     Yields
     ------
     GeoJSON-like Feature dictionaries for shapes found in the given band
@@ -673,8 +2072,13 @@ def dataset_features(
     if bidx is not None and bidx > src.count:
         raise ValueError("bidx is out of range for raster")
 
-    img = None
-    msk = None
+    if window_height is not None and sampling > 1:
+        raise ValueError("window_height is not valid with sampling > 1")
+
+    if window_height is None and sampling == 1:
+        block_height = src.block_shapes[0][0]
+        blocks = _FEATURES_WINDOW_PIXELS // (src.width * block_height)
+        window_height = max(1, blocks) * block_height
 
     # Adjust transforms.
     transform = src.transform
@@ -696,62 +2100,357 @@ def dataset_features(
         # And follow by scaling.
         transform *= Affine.scale(x_sampling, y_sampling)
 
-    # Most of the time, we'll use the valid data mask.
-    # We skip reading it if we're extracting every possible
-    # feature (even invalid data features) from a band.
-    if not band or (band and not as_mask and not with_nodata):
-        if sampling == 1:
-            msk = src.read_masks(bidx)
-        else:
-            msk_shape = shape
+    def read(window=None):
+        """Read an image and mask array for a window of the dataset."""
+        img = None
+        msk = None
+
+        # Most of the time, we'll use the valid data mask.
+        # We skip reading it if we're extracting every possible
+        # feature (even invalid data features) from a band.
+        if not band or (band and not as_mask and not with_nodata):
+            if sampling == 1:
+                msk = src.read_masks(bidx, window=window)
+            else:
+                msk_shape = shape
+                if bidx is None:
+                    msk = np.zeros((src.count,) + msk_shape, dtype=np.uint8)
+                else:
+                    msk = np.zeros(msk_shape, dtype=np.uint8)
+                msk = src.read_masks(bidx, msk)
+
             if bidx is None:
-                msk = np.zeros((src.count,) + msk_shape, dtype=np.uint8)
+                msk = np.logical_or.reduce(msk).astype(np.uint8)
+            # Possibly overridden below.
+            img = msk
+
+        # Read the band data unless the --mask option is given.
+        if band:
+            if sampling == 1:
+                img = src.read(bidx, masked=False, window=window)
             else:
-                msk = np.zeros(msk_shape, dtype=np.uint8)
-            msk = src.read_masks(bidx, msk)
-
-        if bidx is None:
-            msk = np.logical_or.reduce(msk).astype(np.uint8)
-        # Possibly overridden below.
-        img = msk
-
-    # Read the band data unless the --mask option is given.
-    if band:
-        if sampling == 1:
-            img = src.read(bidx, masked=False)
-        else:
-            img = np.zeros(shape, dtype=src.dtypes[src.indexes.index(bidx)])
-            img = src.read(bidx, img, masked=False)
-
-    # If as_mask option was given, convert the image
-    # to a binary image. This reduces the number of shape
-    # categories to 2 and likely reduces the number of
-    # shapes.
-    if as_mask:
-        tmp = np.ones_like(img, np.uint8) * 255
-        tmp[img == 0] = 0
-        img = tmp
-        if not with_nodata:
-            msk = tmp
-
-    # Prepare keyword arguments for shapes().
-    kwargs = {"transform": transform}
-    if not with_nodata:
-        kwargs["mask"] = msk
+                img = np.zeros(shape, dtype=src.dtypes[src.indexes.index(bidx)])
+                img = src.read(bidx, img, masked=False)
+
+        # If as_mask option was given, convert the image
+        # to a binary image. This reduces the number of shape
+        # categories to 2 and likely reduces the number of
+        # shapes.
+        if as_mask:
+            tmp = np.ones_like(img, np.uint8) * 255
+            tmp[img == 0] = 0
+            img = tmp
+            if not with_nodata:
+                msk = tmp
+
+        if with_nodata:
+            msk = None
+
+        return img, msk
+
+    if window_height is not None:
+        results = _shapes_windowed(
+            read,
+            src.width,
+            src.height,
+            transform,
+            4,
+            window_height,
+            format="geojson" if geographic else format,
+        )
+    else:
+        img, msk = read()
+        results = rasterio.features.shapes(
+            img,
+            mask=msk,
+            transform=transform,
+            format="geojson" if geographic else format,
+        )
 
     src_basename = os.path.basename(src.name)
 
     # Yield GeoJSON features.
-    for i, (g, val) in enumerate(rasterio.features.shapes(img, **kwargs)):
+    for i, (g, val) in enumerate(results):
         if geographic:
             g = warp.transform_geom(
                 src.crs, "EPSG:4326", g, antimeridian_cutting=True, precision=precision
             )
-        xs, ys = zip(*coords(g))
+            if format == "wkb":
+                g = _geojson_to_wkb(g)
+
+        if format == "wkb":
+            bbox = list(bounds(g))
+        else:
+            xs, ys = zip(*coords(g))
+            bbox = [min(xs), min(ys), max(xs), max(ys)]
+
         yield {
             "type": "Feature",
             "id": f"{src_basename}:{i}",
             "properties": {"val": val, "filename": src_basename},
-            "bbox": [min(xs), min(ys), max(xs), max(ys)],
+            "bbox": bbox,
             "geometry": g,
         }
+
+
+ZONAL_STATS = ("count", "sum", "min", "max", "mean", "histogram")
+
+
+@ensure_env
+def zonal_stats(
+    dataset,
+    geometries,
+    stats=("count", "min", "max", "mean"),
+    bidx=1,
+    all_touched=False,
+    bins=None,
+    mem_limit=64,
+):
+    """Compute statistics of a band's values within zones.
+
+    The band is read once, chunk by chunk, and only the zones whose
+    bounds intersect a chunk are rasterized into it. Zones that do not
+    overlap are rasterized together, and overlapping zones one at a
+    time, so that a pixel contributes to every zone that covers it.
+    Pixels masked by the dataset are excluded.
+
+    Parameters
+    ----------
+    dataset : dataset object opened in 'r' mode
+        The dataset.
+    geometries : iterable
+        GeoJSON-like geometries, objects with a geo interface or WKB
+        representation, or WKB bytes, in the dataset's coordinate
+        reference system.
+    stats : sequence of str, optional
+        Names of statistics to compute from "count", "sum", "min",
+        "max", "mean", and "histogram". Default: count, min, max, and
+        mean.
+    bidx : int, optional
+        Index of the band. Default: 1.
+    all_touched : bool, optional
+        If True, all pixels touched by a zone are in it. If False
+        (the default), only pixels whose center is within the zone or
+        that are selected by Bresenham's line algorithm are.
+    bins : sequence of float, optional
+        Edges of the bins of histograms, as for numpy.histogram().
+        Required for the "histogram" statistic.
+    mem_limit : int, optional
+        Approximate limit in MB of the memory used for chunks.
+        Default: 64.
+
+    Returns
+    -------
+    dict
+        Arrays of each statistic, with one item per geometry, keyed by
+        the names of the statistics. Histograms are an array of shape
+        (number of geometries, number of bins). The minimum, maximum,
+        and mean of zones without pixels are NaN.
+
+    Raises
+    ------
+    ValueError
+        If a statistic is unknown, or bins are not given for
+        histograms.
+
+    """
+    stats = list(stats)
+    unknown = set(stats) - set(ZONAL_STATS)
+    if unknown:
+        raise ValueError(f"Unknown statistics: {sorted(unknown)}")
+
+    if "histogram" in stats:
+        if bins is None:
+            raise ValueError("bins are required for histograms")
+        bins = np.asarray(bins, dtype="float64")
+        if bins.ndim != 1 or len(bins) < 2:
+            raise ValueError("bins must be a sequence of at least two edges")
+
+    geometries = [_geometry_input(geom) for geom in geometries]
+    num_zones = len(geometries)
+
+    counts = np.zeros(num_zones, dtype="int64")
+    sums = np.zeros(num_zones, dtype="float64")
+    mins = np.full(num_zones, np.nan)
+    maxs = np.full(num_zones, np.nan)
+    histograms = (
+        np.zeros((num_zones, len(bins) - 1), dtype="int64")
+        if "histogram" in stats
+        else None
+    )
+
+    # Bytes per chunk pixel: the data, its mask, and its validity
+    # (itemsize + 2); then either the uint32 coverage, its overlap
+    # flags, and the overlap sums with a temporary (13), or the int32
+    # labels and, in accumulate(), the selected and sorted labels and
+    # data, their int64 sort order, and the int64 bin positions and
+    # keys and boolean temporaries of histograms (2 * itemsize + 50).
+    itemsize = np.dtype(dataset.dtypes[bidx - 1]).itemsize
+    max_pixels = mem_limit * 1.0e6 / (3 * itemsize + 52)
+    chunks = _chunk_plan(
+        windows.Window(0, 0, dataset.width, dataset.height),
+        max_pixels,
+        dataset.block_shapes[bidx - 1],
+    )
+    chunk_height = chunks[0].height
+    chunk_width = chunks[0].width
+    chunk_rows = math.ceil(dataset.height / chunk_height)
+    chunk_cols = math.ceil(dataset.width / chunk_width)
+
+    # Index zones by the chunks that their pixel bounds, padded by a
+    # pixel, intersect.
+    index = defaultdict(list)
+    pixel_bounds = np.zeros((num_zones, 4), dtype="int64")
+    zone_bounds = bounds_array(geometries, transform=~dataset.transform)
+
+    for i, (left, top, right, bottom) in enumerate(zone_bounds.tolist()):
+        if math.isnan(left):
+            warnings.warn(
+                f"Invalid shape will not be used as a zone: index={i}",
+                ShapeSkipWarning,
+            )
+            continue
+
+        row_start = math.floor(top) - 1
+        row_stop = math.ceil(bottom) + 1
+        col_start = math.floor(left) - 1
+        col_stop = math.ceil(right) + 1
+        pixel_bounds[i] = row_start, row_stop, col_start, col_stop
+
+        for chunk_row in range(
+            max(0, row_start // chunk_height),
+            min(chunk_rows - 1, (row_stop - 1) // chunk_height) + 1,
+        ):
+            for chunk_col in range(
+                max(0, col_start // chunk_width),
+                min(chunk_cols - 1, (col_stop - 1) // chunk_width) + 1,
+            ):
+                index[chunk_row, chunk_col].append(i)
+
+    log.debug("Computing statistics of %d zones in %d chunks", num_zones, len(chunks))
+
+    def accumulate(labels, data, valid, zones):
+        """Add the pixels of labeled zones to their statistics."""
+        selected = (labels > 0) & valid
+        labels = labels[selected]
+        if not labels.size:
+            return
+        data = data[selected]
+        order = np.argsort(labels, kind="stable")
+        labels = labels[order]
+        data = data[order]
+        local, starts = np.unique(labels, return_index=True)
+        local_counts = np.diff(np.append(starts, labels.size))
+        ids = zones[local - 1]
+
+        counts[ids] += local_counts
+        if "sum" in stats or "mean" in stats:
+            sums[ids] += np.add.reduceat(data, starts, dtype="float64")
+        if "min" in stats:
+            mins[ids] = np.fmin(mins[ids], np.minimum.reduceat(data, starts))
+        if "max" in stats:
+            maxs[ids] = np.fmax(maxs[ids], np.maximum.reduceat(data, starts))
+        if histograms is not None:
+            num_bins = histograms.shape[1]
+            positions = np.searchsorted(bins, data, side="right") - 1
+            # The last bin includes its right edge.
+            positions[data == bins[-1]] = num_bins - 1
+            keys = np.repeat(np.arange(len(local)), local_counts) * num_bins + positions
+            inside = (positions >= 0) & (positions < num_bins)
+            histograms[ids] += np.bincount(
+                keys[inside], minlength=len(local) * num_bins
+            ).reshape(len(local), num_bins)
+
+    for chunk in chunks:
+        zones = index.get((chunk.row_off // chunk_height, chunk.col_off // chunk_width))
+        if not zones:
+            continue
+
+        zones = np.array(zones)
+        data = dataset.read(bidx, window=chunk)
+        valid = dataset.read_masks(bidx, window=chunk) > 0
+        chunk_transform = windows.transform(chunk, dataset.transform)
+        shape = (chunk.height, chunk.width)
+
+        # Zones are rasterized together unless their bounds contain a
+        # pixel covered by more than one zone.
+        coverage = np.zeros(shape, dtype="uint32")
+        _rasterize(
+            [(geometries[i], 1) for i in zones],
+            coverage,
+            chunk_transform,
+            all_touched,
+            MergeAlg.add,
+        )
+        zone_bounds = pixel_bounds[zones] - (
+            chunk.row_off,
+            chunk.row_off,
+            chunk.col_off,
+            chunk.col_off,
+        )
+        zone_bounds[:, :2] = zone_bounds[:, :2].clip(0, chunk.height)
+        zone_bounds[:, 2:] = zone_bounds[:, 2:].clip(0, chunk.width)
+        # Summed-area table of the pixels covered by more than one zone,
+        # computed in place.
+        sum_dtype = "int32" if coverage.size < 2**31 else "int64"
+        overlaps = np.zeros((shape[0] + 1, shape[1] + 1), dtype=sum_dtype)
+        np.greater(coverage, 1, out=overlaps[1:, 1:])
+        del coverage
+        np.cumsum(overlaps, axis=0, dtype=sum_dtype, out=overlaps)
+        np.cumsum(overlaps, axis=1, dtype=sum_dtype, out=overlaps)
+        row_start, row_stop, col_start, col_stop = zone_bounds.T
+        overlapping = (
+            overlaps[row_stop, col_stop]
+            - overlaps[row_start, col_stop]
+            - overlaps[row_stop, col_start]
+            + overlaps[row_start, col_start]
+        ) > 0
+
+        shared = zones[~overlapping]
+        if shared.size:
+            labels = np.zeros(shape, dtype="int32")
+            _rasterize(
+                [(geometries[i], k) for k, i in enumerate(shared, 1)],
+                labels,
+                chunk_transform,
+                all_touched,
+                MergeAlg.replace,
+            )
+            accumulate(labels, data, valid, shared)
+
+        for i, (row_start, row_stop, col_start, col_stop) in zip(
+            zones[overlapping], zone_bounds[overlapping]
+        ):
+            if row_stop <= row_start or col_stop <= col_start:
+                continue
+            window = windows.Window.from_slices(
+                (row_start, row_stop), (col_start, col_stop)
+            )
+            labels = np.zeros((window.height, window.width), dtype="int32")
+            _rasterize(
+                [(geometries[i], 1)],
+                labels,
+                windows.transform(window, chunk_transform),
+                all_touched,
+                MergeAlg.replace,
+            )
+            slices = window.toslices()
+            accumulate(labels, data[slices], valid[slices], np.array([i]))
+
+    results = {}
+    for stat in stats:
+        if stat == "count":
+            results[stat] = counts
+        elif stat == "sum":
+            results[stat] = sums
+        elif stat == "min":
+            results[stat] = mins
+        elif stat == "max":
+            results[stat] = maxs
+        elif stat == "mean":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                results[stat] = np.where(counts > 0, sums / counts, np.nan)
+        elif stat == "histogram":
+            results[stat] = histograms
+
+    return results
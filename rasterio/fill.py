@@ -1,15 +1,30 @@
 """Fill holes in raster dataset by interpolation from the edges."""
 
+import logging
+import math
+
+import numpy as np
 from numpy.ma import MaskedArray
 
 from rasterio._fill import _fillnodata
+from rasterio._tiles import _imap_tiles
 from rasterio.env import ensure_env
 from rasterio import dtypes
+from rasterio.windows import Window, subdivide
+
+log = logging.getLogger(__name__)
 
 
 @ensure_env
 def fillnodata(
-    image, mask=None, max_search_distance=100.0, smoothing_iterations=0, **filloptions
+    image,
+    mask=None,
+    max_search_distance=100.0,
+    smoothing_iterations=0,
+    out=None,
+    num_threads=1,
+    mem_limit=64,
+    **filloptions,
 ):
     """Fill holes in raster data by interpolation
 
@@ -27,19 +42,26 @@ def fillnodata(
     It is generally not so great for interpolating a raster from sparse
     point data.
 
+    A Band of a dataset may be filled into the Band of another dataset
+    tile by tile. Each tile is read with a margin of pixels as wide as
+    the search distance plus the number of smoothing iterations, so
+    that its interior is filled as it would be if the whole raster were
+    filled at once.
+
     Parameters
     ----------
-    image : numpy.ndarray
+    image : numpy.ndarray or Band
         The source image with holes to be filled. If a MaskedArray, the
         inverse of its mask will define the pixels to be filled --
         unless the ``mask`` argument is not None (see below).`
-    mask : numpy.ndarray, optional
+    mask : numpy.ndarray or Band, optional
         A mask band indicating which pixels to interpolate. Pixels to
         interpolate into are indicated by the value 0. Values
         > 0 indicate areas to use during interpolation. Must be same
         shape as image. This array always takes precedence over the
         image's mask (see above). If None, the inverse of the image's
-        mask will be used if available.
+        mask will be used if available. If the image is a Band, its
+        dataset's mask is used by default.
     max_search_distance : float, optional
         The maximum number of pixels to search in all directions to
         find values to interpolate from. The default is 100.
@@ -51,12 +73,46 @@ def fillnodata(
         https://gdal.org/en/stable/api/gdal_alg.html. Lowercase option
         names and numerical values are allowed. For example:
         nodata=0 is a valid keyword argument.
+    out : Band, optional
+        A Band of a dataset opened in "w" or "r+" mode into which the
+        image Band is filled. Required if the image is a Band, and must
+        not be the same band.
+    num_threads : int, optional
+        Number of threads filling tiles concurrently when the image is
+        a Band. Default: 1.
+    mem_limit : int, optional
+        Approximate limit in MB of the memory used for tiles when the
+        image is a Band. Default: 64.
 
     Returns
     -------
-    numpy.ndarray :
-        The filled raster array.
+    numpy.ndarray or Band :
+        The filled raster array, or the `out` Band.
     """
+    if isinstance(image, tuple):
+        if not isinstance(image.bidx, int):
+            raise ValueError("A single image band is required")
+        if not isinstance(out, tuple) or not isinstance(out.bidx, int):
+            raise ValueError("A single output band is required")
+        if out.ds is image.ds and out.bidx == image.bidx:
+            raise ValueError("The output band must not be the image band")
+        if out.ds.shape != image.ds.shape:
+            raise ValueError("The output band must have the shape of the image")
+        if mask is not None and mask.shape[-2:] != image.ds.shape:
+            raise ValueError("The mask must have the shape of the image")
+
+        _fillnodata_tiled(
+            image,
+            out,
+            mask,
+            float(max_search_distance),
+            int(smoothing_iterations),
+            num_threads,
+            mem_limit,
+            filloptions,
+        )
+        return out
+
     if mask is None and isinstance(image, MaskedArray):
         mask = ~image.mask
     if not dtypes.is_ndarray(mask):
@@ -72,3 +128,141 @@ def fillnodata(
     return _fillnodata(
         image, mask, max_search_distance, smoothing_iterations, **filloptions
     )
+
+
+def _tile_plan(window, halo, max_pixels, block_shape):
+    """Divide a window into square tiles for filling.
+
+    Tiles are sized so that a tile and its halo have no more than
+    max_pixels pixels. They are whole multiples of the destination's
+    blocks when it is tiled. Strips are ignored, because the halos of
+    full-width chunks of a few rows would dominate memory and reads.
+
+    Tiles are never narrower than the halo, because the reads of
+    smaller tiles would be mostly halo. A warning is logged when such
+    tiles and their halos exceed max_pixels.
+
+    Parameters
+    ----------
+    window : Window
+        The full window, with zero offsets.
+    halo : int
+        Width of the halo read around each tile.
+    max_pixels : float
+        Maximum number of pixels in a tile and its halo. A tile always
+        contains at least one block.
+    block_shape : tuple
+        The (height, width) of the destination's blocks.
+
+    Returns
+    -------
+    list of Windows
+    """
+    side = max(1, halo, math.floor(math.sqrt(max_pixels)) - 2 * halo)
+    block_height, block_width = block_shape
+
+    if block_width < window.width:
+        height = max(1, side // block_height) * block_height
+        width = max(1, side // block_width) * block_width
+    else:
+        height = width = side
+
+    tile_pixels = min(height + 2 * halo, window.height) * min(
+        width + 2 * halo, window.width
+    )
+    if tile_pixels > max_pixels:
+        log.warning(
+            "Tiles of %d by %d pixels with halos of %d pixels exceed the "
+            "memory limit by a factor of %.1f",
+            height,
+            width,
+            halo,
+            tile_pixels / max_pixels,
+        )
+
+    return subdivide(window, height, width)
+
+
+def _fillnodata_tiled(
+    image,
+    out,
+    mask,
+    max_search_distance,
+    smoothing_iterations,
+    num_threads,
+    mem_limit,
+    filloptions,
+):
+    """Fill a band into another band, tile by tile.
+
+    Parameters
+    ----------
+    image : Band
+        A single band of a dataset opened in "r" or "r+" mode.
+    out : Band
+        A single band of a dataset opened in "w" or "r+" mode.
+    mask, max_search_distance, smoothing_iterations, num_threads, mem_limit, filloptions
+        See fillnodata().
+
+    Returns
+    -------
+    None
+    """
+    src, bidx = image.ds, image.bidx
+    dst, dst_bidx = out.ds, out.bidx
+
+    # Pixels beyond the search distance do not contribute to a filled
+    # pixel, and each smoothing pass reaches one pixel further.
+    halo = math.ceil(max_search_distance) + smoothing_iterations
+
+    # The image, its mask, and GDAL's working rasters use about 9 bytes
+    # per pixel in addition to the image's data type. _imap_tiles()
+    # keeps up to two tiles per thread in flight.
+    itemsize = np.dtype(image.dtype).itemsize
+    max_pixels = mem_limit * 1.0e6 / ((itemsize + 9) * 2 * max(num_threads, 1))
+    tiles = _tile_plan(
+        Window(0, 0, src.width, src.height),
+        halo,
+        max_pixels,
+        dst.block_shapes[dst_bidx - 1],
+    )
+
+    log.debug(
+        "Filling %d tiles with halos of %d pixels using %d threads",
+        len(tiles),
+        halo,
+        num_threads,
+    )
+
+    def read(tile):
+        row_start = max(0, tile.row_off - halo)
+        row_stop = min(src.height, tile.row_off + tile.height + halo)
+        col_start = max(0, tile.col_off - halo)
+        col_stop = min(src.width, tile.col_off + tile.width + halo)
+        outer = Window.from_slices((row_start, row_stop), (col_start, col_stop))
+
+        data = src.read(bidx, window=outer)
+        if mask is None:
+            tile_mask = src.read_masks(bidx, window=outer)
+        elif isinstance(mask, tuple):
+            tile_mask = mask.ds.read(mask.bidx, window=outer)
+        else:
+            tile_mask = mask[outer.toslices()]
+        return tile, outer, data, tile_mask
+
+    def fill(item):
+        tile, outer, data, tile_mask = item
+        if not tile_mask.all():
+            data = _fillnodata(
+                data,
+                tile_mask,
+                max_search_distance,
+                smoothing_iterations,
+                **filloptions,
+            )
+        row = tile.row_off - outer.row_off
+        col = tile.col_off - outer.col_off
+        return tile, data[row : row + tile.height, col : col + tile.width]
+
+    for tile, arr in _imap_tiles(fill, map(read, tiles), num_threads):
+        dst.write(arr, dst_bidx, window=tile)
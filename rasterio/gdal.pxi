@@ -437,6 +437,12 @@ cdef extern from "gdal.h" nogil:
     int GDALGetRasterColorInterpretation(GDALRasterBandH band)
     int GDALSetRasterColorInterpretation(GDALRasterBandH band, GDALColorInterp)
     int GDALGetMaskFlags(GDALRasterBandH band)
+    const int GDAL_DATA_COVERAGE_STATUS_UNIMPLEMENTED
+    const int GDAL_DATA_COVERAGE_STATUS_DATA
+    const int GDAL_DATA_COVERAGE_STATUS_EMPTY
+    int GDALGetDataCoverageStatus(GDALRasterBandH band, int xoff, int yoff,
+                                  int xsize, int ysize, int mask_flag_stop,
+                                  double *data_pct)
     int GDALCreateDatasetMaskBand(GDALDatasetH hds, int flags)
     void *GDALGetMaskBand(GDALRasterBandH band)
     int GDALCreateMaskBand(GDALDatasetH hds, int flags)
@@ -552,17 +558,21 @@ cdef extern from "ogr_api.h" nogil:
     void OGR_G_AddPoint(OGRGeometryH geometry, double x, double y, double z)
     void OGR_G_AddPoint_2D(OGRGeometryH geometry, double x, double y)
     void OGR_G_CloseRings(OGRGeometryH geometry)
+    OGRErr OGR_G_CreateFromWkbEx(const void *data, OGRSpatialReferenceH srs,
+                                 OGRGeometryH *geometry, size_t nbytes)
     OGRGeometryH OGR_G_CreateGeometry(int wkbtypecode)
     OGRGeometryH OGR_G_CreateGeometryFromJson(const char *json)
     void OGR_G_DestroyGeometry(OGRGeometryH geometry)
     char *OGR_G_ExportToJson(OGRGeometryH geometry)
     void OGR_G_ExportToWkb(OGRGeometryH geometry, int endianness, char *buffer)
     int OGR_G_GetCoordinateDimension(OGRGeometryH geometry)
+    void OGR_G_GetEnvelope(OGRGeometryH geometry, OGREnvelope *envelope)
     int OGR_G_GetGeometryCount(OGRGeometryH geometry)
     const char *OGR_G_GetGeometryName(OGRGeometryH geometry)
     int OGR_G_GetGeometryType(OGRGeometryH geometry)
     OGRGeometryH OGR_G_GetGeometryRef(OGRGeometryH geometry, int n)
     int OGR_G_GetPointCount(OGRGeometryH geometry)
+    int OGR_G_IsEmpty(OGRGeometryH geometry)
     double OGR_G_GetX(OGRGeometryH geometry, int n)
     double OGR_G_GetY(OGRGeometryH geometry, int n)
     double OGR_G_GetZ(OGRGeometryH geometry, int n)
@@ -5,8 +5,11 @@ import warnings
 
 import numpy as np
 
+from rasterio import windows
+from rasterio._tiles import _imap_tiles
 from rasterio.errors import WindowError
-from rasterio.features import geometry_mask, geometry_window
+from rasterio.features import geometry_mask, geometry_window, geometry_windows
+from rasterio.windows import Window
 
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,7 @@ def raster_geometry_mask(
     crop=False,
     pad=False,
     pad_width=0.5,
+    window=None,
 ):
     """Create a mask from shapes, transform, and optional window within original
     raster.
@@ -36,8 +40,9 @@ def raster_geometry_mask(
     dataset : a dataset object opened in 'r' mode
         Raster for which the mask will be created.
     shapes : iterable object
-        The values must be a GeoJSON-like dict or an object that implements
-        the Python geo interface protocol (such as a Shapely Polygon).
+        The values must be a GeoJSON-like dict, an object that implements
+        the Python geo interface protocol (such as a Shapely Polygon), or
+        WKB bytes.
     all_touched : bool (opt)
         Include a pixel in the mask if it touches any of the shapes.
         If False (default), include a pixel only if its center is within one of
@@ -57,6 +62,9 @@ def raster_geometry_mask(
     pad_width : float (opt)
         If pad is set (to maintain back-compatibility), then this will be the
         pixel-size width of the padding around the mask.
+    window : rasterio.windows.Window (opt)
+        Window within the raster to be covered by the mask, instead of the
+        whole raster. Can not be used with crop.
 
     Returns
     -------
@@ -73,9 +81,17 @@ def raster_geometry_mask(
                 coordinate system.
 
             window: rasterio.windows.Window instance
-                Window within original raster covered by shapes.  None if crop
-                is False.
+                Window within original raster covered by shapes, or the given
+                window.  None if crop is False and no window is given.
+
+    Notes
+    -----
+    Shapes are rasterized only within the window of their bounds, and
+    the rest of the mask is filled without rasterization.
     """
+    if crop and window is not None:
+        raise ValueError("A window can not be used with crop.")
+
     if crop and pad:
         pad_x = pad_width
         pad_y = pad_width
@@ -83,8 +99,16 @@ def raster_geometry_mask(
         pad_x = 0
         pad_y = 0
 
+    shapes = list(shapes)
+
+    if window is not None:
+        window = Window(*(int(round(val)) for val in window.flatten()))
+        out_window = window
+    else:
+        out_window = Window(0, 0, dataset.width, dataset.height)
+
     try:
-        window = geometry_window(dataset, shapes, pad_x=pad_x, pad_y=pad_y)
+        shapes_window = geometry_window(dataset, shapes, pad_x=pad_x, pad_y=pad_y)
 
     except WindowError:
         # If shapes do not overlap raster, raise Exception or UserWarning
@@ -98,31 +122,90 @@ def raster_geometry_mask(
             )
 
         # Return an entirely True mask (if invert is False)
-        mask = np.ones(shape=dataset.shape[-2:], dtype=bool)
+        mask = np.ones(
+            shape=(int(out_window.height), int(out_window.width)), dtype=bool
+        )
         if invert:
             mask = ~mask
-        return mask, dataset.transform, None
+        return mask, dataset.window_transform(out_window), window
 
     if crop:
-        transform = dataset.window_transform(window)
-        out_shape = (int(window.height), int(window.width))
-
-    else:
-        window = None
-        transform = dataset.transform
-        out_shape = (int(dataset.height), int(dataset.width))
+        window = out_window = shapes_window
 
-    mask = geometry_mask(
+    transform = dataset.window_transform(out_window)
+    mask = _window_geometry_mask(
+        dataset,
         shapes,
-        transform=transform,
-        invert=invert,
-        out_shape=out_shape,
+        out_window,
+        shapes_window,
         all_touched=all_touched,
+        invert=invert,
     )
 
     return mask, transform, window
 
 
+def _window_geometry_mask(
+    dataset, shapes, out_window, shapes_window, all_touched=False, invert=False
+):
+    """Make a geometry mask of a window of a dataset.
+
+    The shapes are rasterized only where the window intersects the
+    window of their bounds, padded by a pixel so that every touched
+    pixel is included. The rest of the mask is outside the shapes.
+
+    Parameters
+    ----------
+    dataset : a dataset object opened in 'r' mode
+        The raster.
+    shapes : list
+        Shapes in the dataset's coordinate reference system.
+    out_window : rasterio.windows.Window
+        The window of the mask, with integer offsets and lengths.
+    shapes_window : rasterio.windows.Window
+        The window of the shapes' bounds.
+    all_touched, invert : bool
+        See raster_geometry_mask().
+
+    Returns
+    -------
+    np.ndarray of type 'bool'
+    """
+    height = int(out_window.height)
+    width = int(out_window.width)
+    mask = np.ones((height, width), dtype=bool)
+    if invert:
+        mask = ~mask
+
+    row_start = max(int(out_window.row_off), int(shapes_window.row_off) - 1)
+    row_stop = min(
+        int(out_window.row_off) + height,
+        int(shapes_window.row_off + shapes_window.height) + 1,
+    )
+    col_start = max(int(out_window.col_off), int(shapes_window.col_off) - 1)
+    col_stop = min(
+        int(out_window.col_off) + width,
+        int(shapes_window.col_off + shapes_window.width) + 1,
+    )
+
+    if row_stop > row_start and col_stop > col_start:
+        rasterize_window = Window.from_slices(
+            (row_start, row_stop), (col_start, col_stop)
+        )
+        mask[
+            row_start - int(out_window.row_off) : row_stop - int(out_window.row_off),
+            col_start - int(out_window.col_off) : col_stop - int(out_window.col_off),
+        ] = geometry_mask(
+            shapes,
+            transform=dataset.window_transform(rasterize_window),
+            invert=invert,
+            out_shape=(row_stop - row_start, col_stop - col_start),
+            all_touched=all_touched,
+        )
+
+    return mask
+
+
 def mask(
     dataset,
     shapes,
@@ -134,6 +217,7 @@ def mask(
     pad=False,
     pad_width=0.5,
     indexes=None,
+    window=None,
 ):
     """Creates a masked or filled array using input shapes.
     Pixels are masked or set to nodata outside the input shapes, unless
@@ -147,8 +231,9 @@ def mask(
     dataset : a dataset object opened in 'r' mode
         Raster to which the mask will be applied.
     shapes : iterable object
-        The values must be a GeoJSON-like dict or an object that implements
-        the Python geo interface protocol (such as a Shapely Polygon).
+        The values must be a GeoJSON-like dict, an object that implements
+        the Python geo interface protocol (such as a Shapely Polygon), or
+        WKB bytes.
     all_touched : bool (opt)
         Include a pixel in the mask if it touches any of the shapes.
         If False (default), include a pixel only if its center is within one of
@@ -173,6 +258,9 @@ def mask(
     indexes : list of ints or a single int (opt)
         If `indexes` is a list, the result is a 3D array, but is
         a 2D array if it is a band index number.
+    window : rasterio.windows.Window (opt)
+        Window within the raster to be read and masked, instead of the
+        whole raster. Can not be used with crop.
 
     Returns
     -------
@@ -209,6 +297,7 @@ def mask(
         crop=crop,
         pad=pad,
         pad_width=pad_width,
+        window=window,
     )
 
     if indexes is None:
@@ -228,3 +317,174 @@ def mask(
         out_image = out_image.filled(nodata)
 
     return out_image, transform
+
+
+def mask_many(
+    dataset,
+    features,
+    all_touched=False,
+    invert=False,
+    nodata=None,
+    filled=True,
+    pad=False,
+    pad_width=0.5,
+    indexes=None,
+    num_threads=1,
+    mem_limit=64,
+):
+    """Clip a dataset to each of many features.
+
+    This is the equivalent of calling mask() with crop=True for each
+    feature, but the windows of all features are planned first and
+    neighboring windows that share blocks of the dataset are read
+    together, so that no block is read more than once per group. Each
+    feature's mask is made only over its window, and masks may be made
+    concurrently.
+
+    Parameters
+    ----------
+    dataset : a dataset object opened in 'r' mode
+        Raster to be clipped.
+    features : iterable object
+        The values must be GeoJSON-like features or geometries, objects
+        that implement the Python geo interface protocol (such as a
+        Shapely Polygon), or WKB bytes.
+    all_touched, invert, nodata, filled, pad, pad_width, indexes
+        See mask().
+    num_threads : int (opt)
+        Number of threads making masks concurrently. Defaults to 1.
+    mem_limit : int (opt)
+        Approximate limit in MB of the memory used for a group of
+        windows read together. Defaults to 64.
+
+    Yields
+    ------
+    tuple
+
+        Three elements:
+
+            index : int
+                The index of the feature.
+
+            masked : numpy.ndarray or numpy.ma.MaskedArray
+                Data within the feature's window after applying its
+                mask, as returned by mask().
+
+            out_transform : affine.Affine()
+                Information for mapping pixel coordinates in `masked` to another
+                coordinate system.
+
+        Items are yielded in the order in which groups of windows are
+        read, which follows the dataset's blocks. Features that do not
+        overlap the raster are skipped with a warning.
+    """
+    if nodata is None:
+        if dataset.nodata is not None:
+            nodata = dataset.nodata
+        else:
+            nodata = 0
+
+    if pad:
+        pad_x = pad_width
+        pad_y = pad_width
+    else:
+        pad_x = 0
+        pad_y = 0
+
+    block_height, block_width = dataset.block_shapes[0]
+
+    geometries = []
+    for feature in features:
+        geometry = getattr(feature, "__geo_interface__", None) or feature
+        if isinstance(geometry, dict) and "geometry" in geometry:
+            geometry = geometry["geometry"]
+        geometries.append(geometry)
+
+    # Plan the windows of all features.
+    plan = []
+    feature_windows = geometry_windows(dataset, geometries, pad_x=pad_x, pad_y=pad_y)
+    for i, (col_off, row_off, width, height) in enumerate(feature_windows.tolist()):
+        if width == 0 or height == 0:
+            warnings.warn(
+                f"Feature {i} does not overlap the raster and will be skipped."
+            )
+            continue
+        plan.append((i, geometries[i], Window(col_off, row_off, width, height)))
+
+    plan.sort(
+        key=lambda item: (
+            item[2].row_off // block_height,
+            item[2].col_off // block_width,
+            item[2].row_off,
+            item[2].col_off,
+        )
+    )
+
+    if indexes is None:
+        count = dataset.count
+    elif isinstance(indexes, int):
+        count = 1
+    else:
+        count = len(indexes)
+
+    itemsize = max(np.dtype(dt).itemsize for dt in dataset.dtypes)
+    max_pixels = mem_limit * 1.0e6 / ((itemsize + 1) * count)
+
+    def block_window(window):
+        """The window of the blocks that a window intersects."""
+        row_start = (window.row_off // block_height) * block_height
+        col_start = (window.col_off // block_width) * block_width
+        row_stop = min(
+            dataset.height,
+            -(-(window.row_off + window.height) // block_height) * block_height,
+        )
+        col_stop = min(
+            dataset.width,
+            -(-(window.col_off + window.width) // block_width) * block_width,
+        )
+        return Window.from_slices((row_start, row_stop), (col_start, col_stop))
+
+    # Group neighboring windows that share blocks.
+    groups = []
+    blocks = None
+    for item in plan:
+        item_blocks = block_window(item[2])
+        if blocks is not None and windows.intersect(blocks, item_blocks):
+            union = windows.union(blocks, item_blocks)
+            if union.width * union.height <= max_pixels:
+                blocks = union
+                groups[-1].append(item)
+                continue
+        blocks = item_blocks
+        groups.append([item])
+
+    logger.debug("Clipping %d features in %d groups of windows", len(plan), len(groups))
+
+    def clips():
+        for items in groups:
+            group_window = windows.union(*(item[2] for item in items))
+            data = dataset.read(indexes=indexes, window=group_window, masked=True)
+            for i, geometry, window in items:
+                row = window.row_off - group_window.row_off
+                col = window.col_off - group_window.col_off
+                clip = data[
+                    ..., row : row + window.height, col : col + window.width
+                ].copy()
+                yield i, geometry, window, clip
+
+    def clip_mask(item):
+        i, geometry, window, out_image = item
+        transform = dataset.window_transform(window)
+        shape_mask = geometry_mask(
+            [geometry],
+            transform=transform,
+            invert=invert,
+            out_shape=(int(window.height), int(window.width)),
+            all_touched=all_touched,
+        )
+        out_image.mask = out_image.mask | shape_mask
+        if filled:
+            out_image = out_image.filled(nodata)
+        return i, out_image, transform
+
+    yield from _imap_tiles(clip_mask, clips(), num_threads)
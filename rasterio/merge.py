@@ -12,6 +12,7 @@ import numpy as np
 
 import rasterio
 from rasterio import windows
+from rasterio._tiles import _chunk_plan
 from rasterio.enums import Resampling
 from rasterio.errors import (
     MergeError,
@@ -21,7 +22,6 @@ from rasterio.errors import (
 )
 from rasterio.io import DatasetWriter
 from rasterio.transform import Affine
-from rasterio.windows import subdivide
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +85,208 @@ def copy_count(merged_data, new_data, merged_mask, new_mask, **kwargs):
     np.copyto(merged_data, mask, where=mask, casting="unsafe")
 
 
+class CompositeMethod:
+    """Base class of merge methods which reduce all sources at once.
+
+    The copy_* methods above combine new data with merged data one
+    source at a time. Statistics like the mean or median can't be
+    computed that way, so a composite method instead accumulates the
+    valid pixels of every source overlapping an output chunk and
+    reduces them when the chunk is complete.
+
+    Subclasses implement start(), update(), and finish() and report
+    their memory use through bytes_per_pixel() so that merge() can size
+    chunks to respect its mem_limit.
+    """
+
+    def bytes_per_pixel(self, dtype, nsources):
+        """Bytes of working memory needed per output pixel and band.
+
+        Parameters
+        ----------
+        dtype : numpy.dtype
+            Output data type.
+        nsources : int
+            Number of sources overlapping an output chunk.
+
+        Returns
+        -------
+        int
+        """
+        raise NotImplementedError
+
+    def start(self, shape, nsources):
+        """Prepare to accumulate data for an output chunk.
+
+        Parameters
+        ----------
+        shape : tuple
+            The (count, height, width) shape of the output chunk.
+        nsources : int
+            Number of sources overlapping the chunk, an upper bound on
+            the number of update() calls before finish().
+        """
+        raise NotImplementedError
+
+    def update(self, rows, cols, data):
+        """Accumulate the data of one source.
+
+        Parameters
+        ----------
+        rows, cols : slice
+            Region of the output chunk covered by the source.
+        data : numpy.ma.MaskedArray
+            Source data with invalid pixels masked.
+        """
+        raise NotImplementedError
+
+    def finish(self, dest):
+        """Write the reduced values into the output chunk.
+
+        Pixels with no valid data in any source are left unchanged.
+
+        Parameters
+        ----------
+        dest : numpy.ndarray
+            The output chunk, prefilled with nodata.
+        """
+        raise NotImplementedError
+
+
+class MeanMethod(CompositeMethod):
+    """Returns the mean of valid pixel values.
+
+    Uses a running sum and count, so memory use does not depend on the
+    number of sources.
+    """
+
+    def bytes_per_pixel(self, dtype, nsources):
+        return np.dtype(dtype).itemsize + 8 + 4
+
+    def start(self, shape, nsources):
+        self._total = np.zeros(shape, dtype="float64")
+        self._count = np.zeros(shape, dtype="uint32")
+
+    def update(self, rows, cols, data):
+        valid = np.logical_not(np.ma.getmaskarray(data))
+        np.add(
+            self._total[:, rows, cols],
+            np.ma.getdata(data),
+            out=self._total[:, rows, cols],
+            where=valid,
+            casting="unsafe",
+        )
+        np.add(
+            self._count[:, rows, cols],
+            valid,
+            out=self._count[:, rows, cols],
+            casting="unsafe",
+        )
+
+    def finish(self, dest):
+        valid = self._count > 0
+        np.divide(self._total, self._count, out=self._total, where=valid)
+        _round_for(dest, self._total)
+        np.copyto(dest, self._total, where=valid, casting="unsafe")
+        del self._total, self._count
+
+
+class PercentileMethod(CompositeMethod):
+    """Returns the q-th percentile of valid pixel values.
+
+    The valid pixels of all sources overlapping an output chunk are
+    stacked in a single buffer, so memory use grows with the number of
+    sources. merge() takes this into account and uses smaller chunks
+    where many sources overlap.
+    Percentiles are linearly interpolated, as by numpy.nanpercentile().
+
+    Parameters
+    ----------
+    q : float
+        Percentile to compute, between 0 and 100 inclusive.
+    """
+
+    def __init__(self, q):
+        if not 0 <= q <= 100:
+            raise ValueError("Percentile must be between 0 and 100 inclusive")
+        self.q = q
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(q={self.q!r})"
+
+    def bytes_per_pixel(self, dtype, nsources):
+        # The stack of sources, plus the float64 and intp arrays and
+        # boolean temporaries of finish().
+        return np.dtype(dtype).itemsize + 8 * nsources + 8 * 6 + 4
+
+    def start(self, shape, nsources):
+        self._stack = np.empty((nsources,) + tuple(shape), dtype="float64")
+        self._nlayers = 0
+
+    def update(self, rows, cols, data):
+        layer = self._stack[self._nlayers]
+        layer.fill(np.nan)
+        np.copyto(
+            layer[:, rows, cols],
+            np.ma.getdata(data),
+            where=np.logical_not(np.ma.getmaskarray(data)),
+            casting="unsafe",
+        )
+        self._nlayers += 1
+
+    def finish(self, dest):
+        layers = self._stack[: self._nlayers]
+        del self._stack
+
+        if not len(layers):
+            return
+
+        # Sorting puts the NaNs of missing data after the valid values
+        # of each pixel.
+        layers.sort(axis=0)
+        counts = np.zeros(layers.shape[1:], dtype=np.intp)
+        for layer in layers:
+            counts += np.logical_not(np.isnan(layer))
+
+        valid = counts > 0
+        pos = counts - 1.0
+        pos *= self.q / 100.0
+        lower = np.floor(pos).astype(np.intp)
+        np.maximum(lower, 0, out=lower)
+        pos -= lower
+        upper = np.minimum(lower + 1, counts - 1)
+        np.maximum(upper, 0, out=upper)
+        del counts
+
+        result = np.take_along_axis(layers, lower[np.newaxis], axis=0)[0]
+        del lower
+        high = np.take_along_axis(layers, upper[np.newaxis], axis=0)[0]
+        del upper, layers
+        high -= result
+        high *= pos
+        result += high
+        del high, pos
+
+        _round_for(dest, result)
+        np.copyto(dest, result, where=valid, casting="unsafe")
+
+
+def _round_for(dest, values):
+    """Round float values in place if they are bound for integers."""
+    if np.issubdtype(dest.dtype, np.integer):
+        np.rint(values, out=values)
+
+
+class MedianMethod(PercentileMethod):
+    """Returns the median of valid pixel values."""
+
+    def __init__(self):
+        super().__init__(50)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+
 MERGE_METHODS = {
     "first": copy_first,
     "last": copy_last,
@@ -92,6 +294,8 @@ MERGE_METHODS = {
     "max": copy_max,
     "sum": copy_sum,
     "count": copy_count,
+    "mean": MeanMethod,
+    "median": MedianMethod,
 }
 
 
@@ -171,7 +375,10 @@ def merge(
             * max: pixel-wise max of existing and new
             * sum: pixel-wise sum of existing and new
             * count: pixel-wise count of valid pixels
+            * mean: pixel-wise mean of valid pixels
+            * median: pixel-wise median of valid pixels
 
+        or a CompositeMethod instance such as PercentileMethod(90),
         or custom callable with signature:
             merged_data : array_like
                 array to update with new_data
@@ -194,7 +401,10 @@ def merge(
         are integer multiples of pixel size, matching the ``-tap``
         options of GDAL utilities.  Default: False.
     mem_limit : int, optional
-        Process merge output in chunks of mem_limit MB in size.
+        Process merge output in chunks of mem_limit MB in size. Chunks
+        written to a dataset are aligned to its blocks. When
+        the method is a CompositeMethod like mean or median, chunks are
+        also sized to fit its working memory within this limit.
     dst_path : str or PathLike, optional
         Path of output dataset
     dst_kwds : dict, optional
@@ -223,8 +433,12 @@ def merge(
             RasterioDeprecationWarning,
         )
 
-    if method in MERGE_METHODS:
+    if isinstance(method, CompositeMethod):
+        copyto = method
+    elif method in MERGE_METHODS:
         copyto = MERGE_METHODS[method]
+        if isinstance(copyto, type) and issubclass(copyto, CompositeMethod):
+            copyto = copyto()
     elif callable(method):
         copyto = method
     else:
@@ -377,9 +591,20 @@ def merge(
             logger.debug("Set nodataval to 0")
             nodataval = 0
 
+        # Working memory per output pixel and band. The memory of a
+        # composite method is that of a single source here and chunks
+        # are divided further below where more sources overlap.
+        if isinstance(copyto, CompositeMethod):
+            pixel_bytes = copyto.bytes_per_pixel(dt, 1)
+        else:
+            pixel_bytes = np.dtype(dt).itemsize
+
+        max_pixels = mem_limit * 1.0e6 / (pixel_bytes * output_count)
+
         # When dataset output is selected, we might need to create one
         # and will also provide the option of merging by chunks.
         dout_window = windows.Window(0, 0, output_width, output_height)
+        out = None
         if dst_path is not None:
             if isinstance(dst_path, DatasetWriter):
                 dst = dst_path
@@ -396,16 +621,63 @@ def merge(
                 dst = rasterio.open(dst_path, "w", **out_profile)
                 exit_stack.enter_context(dst)
 
-            max_pixels = mem_limit * 1.0e6 / (np.dtype(dt).itemsize * output_count)
-
-            if output_width * output_height < max_pixels:
-                chunks = [dout_window]
-            else:
-                n = math.floor(math.sqrt(max_pixels))
-                chunks = subdivide(dout_window, n, n)
+            chunks = _chunk_plan(dout_window, max_pixels, dst.block_shapes[0])
+        elif (
+            isinstance(copyto, CompositeMethod)
+            and output_width * output_height >= max_pixels
+        ):
+            # The output array is returned whole, but the composite's
+            # working memory is bounded by reducing chunk by chunk.
+            out = np.zeros((output_count, output_height, output_width), dtype=dt)
+            chunks = _chunk_plan(dout_window, max_pixels)
         else:
             chunks = [dout_window]
 
+        if isinstance(copyto, CompositeMethod):
+            # Composite methods accumulate the sources overlapping each
+            # chunk. Chunks are divided until those sources fit.
+            source_bounds = []
+            for dataset in sources:
+                with dataset_opener(dataset) as src:
+                    source_bounds.append(src.bounds)
+            xmins, ymins, xmaxs, ymaxs = (
+                np.array(source_bounds, dtype="float64").reshape(-1, 4).T
+            )
+
+            def overlap_count(chunk):
+                """Number of sources overlapping a chunk, as by _intersect_bounds()."""
+                left, bottom, right, top = windows.bounds(chunk, output_transform)
+                overlaps = (np.maximum(xmins, left) < np.minimum(xmaxs, right)) & (
+                    np.maximum(ymins, bottom) < np.minimum(ymaxs, top)
+                )
+                return int(np.count_nonzero(overlaps))
+
+            block_shape = dst.block_shapes[0] if dst_path is not None else None
+            planned = []
+            for chunk in chunks:
+                chunk_bytes = copyto.bytes_per_pixel(dt, overlap_count(chunk))
+                chunk_max_pixels = mem_limit * 1.0e6 / (chunk_bytes * output_count)
+                if chunk.width * chunk.height < chunk_max_pixels:
+                    planned.append(chunk)
+                    continue
+                for sub in _chunk_plan(
+                    windows.Window(0, 0, chunk.width, chunk.height),
+                    chunk_max_pixels,
+                    block_shape,
+                ):
+                    planned.append(
+                        windows.Window(
+                            chunk.col_off + sub.col_off,
+                            chunk.row_off + sub.row_off,
+                            sub.width,
+                            sub.height,
+                        )
+                    )
+
+            if dst_path is None and out is None and len(planned) > 1:
+                out = np.zeros((output_count, output_height, output_width), dtype=dt)
+            chunks = planned
+
         def _intersect_bounds(bounds1, bounds2, transform):
             """Based on gdal_merge.py."""
             int_w = max(bounds1[0], bounds2[0])
@@ -434,6 +706,9 @@ def merge(
             if inrange:
                 dest.fill(nodataval)
 
+            if isinstance(copyto, CompositeMethod):
+                copyto.start(dest.shape, overlap_count(chunk))
+
             # From gh-2221
             chunk_bounds = windows.bounds(chunk, output_transform)
             chunk_transform = windows.transform(chunk, output_transform)
@@ -493,6 +768,10 @@ def merge(
                         resampling=resampling,
                     )
 
+                    if isinstance(copyto, CompositeMethod):
+                        copyto.update(rows, cols, data)
+                        continue
+
                     copyto(
                         region,
                         data,
@@ -503,12 +782,21 @@ def merge(
                         coff=cw.col_off,
                     )
 
+            if isinstance(copyto, CompositeMethod):
+                copyto.finish(dest)
+
+            if out is not None:
+                rows, cols = chunk.toslices()
+                out[:, rows, cols] = dest
+
             if dst:
                 dw = windows.from_bounds(*chunk_bounds, output_transform)
                 dw = win_align(dw)
                 dst.write(dest, window=dw)
 
         if dst is None:
+            if out is not None:
+                dest = out
             if masked:
                 dest = np.ma.masked_equal(dest, nodataval, copy=False)
             return dest, output_transform
@@ -1,9 +1,14 @@
 """Abstraction for sessions in various clouds."""
 
+from datetime import datetime
+import hashlib
 import logging
 import os
+import threading
+import time
 from types import SimpleNamespace
 
+from rasterio._cache import _LRUCache
 from rasterio._path import _parse_path, _UnparsedPath
 
 
@@ -15,6 +20,113 @@ except ImportError:
     log.debug("Could not import boto3, continuing with reduced functionality.")
     boto3 = None
 
+# Cached credentials are refreshed when they are this many seconds
+# from expiring. This is botocore's advisory refresh window, so that
+# credentials are resolved again when botocore would refresh them.
+CREDENTIAL_REFRESH_MARGIN = 15 * 60
+
+# Environment variables that boto3 consults when resolving credentials.
+# Shared boto3 sessions are keyed by their values.
+_AWS_ENVIRON_KEYS = (
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_SESSION_TOKEN",
+    "AWS_CREDENTIAL_EXPIRATION",
+    "AWS_PROFILE",
+    "AWS_DEFAULT_PROFILE",
+    "AWS_REGION",
+    "AWS_DEFAULT_REGION",
+    "AWS_CONFIG_FILE",
+    "AWS_SHARED_CREDENTIALS_FILE",
+    "AWS_ROLE_ARN",
+    "AWS_WEB_IDENTITY_TOKEN_FILE",
+    "AWS_CONTAINER_CREDENTIALS_RELATIVE_URI",
+    "AWS_CONTAINER_CREDENTIALS_FULL_URI",
+    "AWS_EC2_METADATA_DISABLED",
+)
+
+
+class _CachedCredentials:
+    """Credentials shared between threads, refreshed as they expire.
+
+    The resolved credentials and their expiry are stored together in a
+    single attribute so that they can be read without locking.
+
+    """
+
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = None
+
+    def _fresh(self, value):
+        if value is None:
+            return False
+        expiry = value[1]
+        return expiry is None or time.time() < expiry - CREDENTIAL_REFRESH_MARGIN
+
+    def get(self, resolve):
+        """Get credentials, calling resolve() if they are missing or stale.
+
+        Parameters
+        ----------
+        resolve : callable
+            Returns a credentials dict and an expiry, which is a
+            datetime, a POSIX timestamp, or None for credentials that
+            do not expire.
+
+        Returns
+        -------
+        dict
+
+        """
+        value = self._value
+        if self._fresh(value):
+            return value[0]
+
+        with self._lock:
+            # Another thread may have refreshed while we waited.
+            value = self._value
+            if self._fresh(value):
+                return value[0]
+
+            creds, expiry = resolve()
+            if isinstance(expiry, datetime):
+                expiry = expiry.timestamp()
+            log.debug("Resolved credentials: expiry=%r", expiry)
+            self._value = (dict(creds), expiry)
+            return self._value[0]
+
+    def clear(self):
+        self._value = None
+
+
+_credential_cache = _LRUCache(maxsize=128)
+
+
+def _cached_credentials(key):
+    """Get the shared credentials entry for key, creating it if needed."""
+    return _credential_cache.get(key, _CachedCredentials)
+
+
+def clear_credential_cache():
+    """Forget all cached credentials and shared boto3 sessions.
+
+    Sessions resolve their credentials again the next time they are
+    used. Call this after rotating credentials in files that sessions
+    read, such as AWS shared credentials files.
+
+    Returns
+    -------
+    None
+
+    """
+    for entry in _credential_cache.clear():
+        entry.clear()
+    for _, _, cached_creds in _aws_sessions.clear():
+        cached_creds.clear()
+
 
 class Session:
     """Base for classes that configure access to secured resources.
@@ -241,8 +353,42 @@ class DummySession(Session):
         return {}
 
 
+_aws_sessions = _LRUCache(maxsize=32)
+
+
+def _shared_aws_session(**kwargs):
+    """Get a boto3 session and its credentials shared between threads.
+
+    Sessions are keyed by a hash of the constructor arguments and of
+    the values of the environment variables that boto3 consults so
+    that a change of environment is respected and secrets are not
+    kept in keys.
+
+    """
+    key = hashlib.sha256(
+        repr(
+            tuple(sorted(kwargs.items()))
+            + tuple(os.environ.get(name) for name in _AWS_ENVIRON_KEYS)
+        ).encode("utf-8")
+    ).hexdigest()
+
+    def make():
+        session = boto3.Session(**kwargs)
+        return (session, session.get_credentials(), _CachedCredentials())
+
+    return _aws_sessions.get(key, make)
+
+
 class AWSSession(Session):
-    """Configures access to secured resources stored in AWS S3."""
+    """Configures access to secured resources stored in AWS S3.
+
+    Sessions made without a boto3 session object share a boto3 session
+    and cached credentials with other sessions that have the same
+    arguments and environment. Credentials that expire, such as those
+    of an instance profile or an assumed role, are refreshed when they
+    come within CREDENTIAL_REFRESH_MARGIN seconds of expiring.
+
+    """
 
     def __init__(
         self,
@@ -283,12 +429,20 @@ class AWSSession(Session):
         if aws_unsigned is None:
             aws_unsigned = parse_bool(os.getenv("AWS_NO_SIGN_REQUEST", False))
 
+        self.requester_pays = requester_pays
+        self.unsigned = aws_unsigned
+        self.endpoint_url = endpoint_url
+
         if session:
             self._session = session
+            self._creds = session.get_credentials() if not aws_unsigned else None
+            self._cached_creds = _CachedCredentials()
         elif aws_unsigned:
             self._session = SimpleNamespace(region_name=region_name)
+            self._creds = None
+            self._cached_creds = None
         else:
-            self._session = boto3.Session(
+            self._session, self._creds, self._cached_creds = _shared_aws_session(
                 aws_access_key_id=aws_access_key_id,
                 aws_secret_access_key=aws_secret_access_key,
                 aws_session_token=aws_session_token,
@@ -296,11 +450,6 @@ class AWSSession(Session):
                 profile_name=profile_name,
             )
 
-        self.requester_pays = requester_pays
-        self.unsigned = aws_unsigned
-        self.endpoint_url = endpoint_url
-        self._creds = self._session.get_credentials() if not self.unsigned else None
-
     @classmethod
     def hascreds(cls, config):
         """Determine if the given configuration has proper credentials
@@ -321,18 +470,30 @@ class AWSSession(Session):
             "AWS_ACCESS_KEY_ID" in config and "AWS_SECRET_ACCESS_KEY" in config
         ) or "AWS_NO_SIGN_REQUEST" in config
 
+    def _resolve_credentials(self):
+        """Freeze the boto3 credentials and find when they expire."""
+        res = {}
+        frozen_creds = self._creds.get_frozen_credentials()
+        if frozen_creds.access_key:  # pragma: no branch
+            res["aws_access_key_id"] = frozen_creds.access_key
+        if frozen_creds.secret_key:  # pragma: no branch
+            res["aws_secret_access_key"] = frozen_creds.secret_key
+        if frozen_creds.token:
+            res["aws_session_token"] = frozen_creds.token
+        # Only botocore's refreshable credentials have an expiry time.
+        # If their expiry can't be found, they are resolved again
+        # every time, as if they had expired.
+        expiry = getattr(self._creds, "_expiry_time", None)
+        if expiry is None and hasattr(self._creds, "refresh_needed"):
+            expiry = time.time()
+        return res, expiry
+
     @property
     def credentials(self):
         """The session credentials as a dict"""
         res = {}
         if self._creds:  # pragma: no branch
-            frozen_creds = self._creds.get_frozen_credentials()
-            if frozen_creds.access_key:  # pragma: no branch
-                res["aws_access_key_id"] = frozen_creds.access_key
-            if frozen_creds.secret_key:  # pragma: no branch
-                res["aws_secret_access_key"] = frozen_creds.secret_key
-            if frozen_creds.token:
-                res["aws_session_token"] = frozen_creds.token
+            res.update(self._cached_creds.get(self._resolve_credentials))
         if self._session.region_name:
             res["aws_region"] = self._session.region_name
         if self.requester_pays:
@@ -424,13 +585,19 @@ class OSSSession(Session):
 class GSSession(Session):
     """Configures access to secured resources stored in Google Cloud Storage"""
 
-    def __init__(self, google_application_credentials=None):
+    def __init__(self, google_application_credentials=None, credential_provider=None):
         """Create new Google Cloud Storage session
 
         Parameters
         ----------
         google_application_credentials: string
             Path to the google application credentials JSON file.
+        credential_provider: callable, optional
+            A function that returns a dict of credentials, with
+            lowercase GDAL config option names as keys, and their
+            expiry as a datetime or None. Its results are shared by all
+            sessions and threads using the same provider and are
+            refreshed as they expire.
         """
 
         if google_application_credentials is not None:
@@ -440,6 +607,8 @@ class GSSession(Session):
         else:
             self._creds = {}
 
+        self._credential_provider = credential_provider
+
     @classmethod
     def hascreds(cls, config):
         """Determine if the given configuration has proper credentials
@@ -461,7 +630,7 @@ class GSSession(Session):
     @property
     def credentials(self):
         """The session credentials as a dict"""
-        return self._creds
+        return _provided_credentials(self._creds, self._credential_provider)
 
     def get_credential_options(self):
         """Get credentials as GDAL configuration options
@@ -587,11 +756,13 @@ class AzureSession(Session):
         azure_client_id=None,
         azure_federated_token_file=None,
         azure_authority_host=None,
+        credential_provider=None,
     ):
         """Create new Microsoft Azure Blob Storage session
 
         Authentication defaults to parameters first. If parameters do not
-        result in a valid credentials object, environment variables are used.
+        result in a valid credentials object, environment variables are used,
+        unless a credential provider is given.
 
         Parameters
         ----------
@@ -615,6 +786,13 @@ class AzureSession(Session):
             The path to a token file.
         azure_authority_host: str, optional (default: None)
             The url of an authority host.
+        credential_provider: callable, optional
+            A function that returns a dict of credentials, such as
+            ``{"azure_storage_access_token": token}``, and their expiry
+            as a datetime or None. The provided credentials are merged
+            with those from the other parameters. Results are shared by
+            all sessions and threads using the same provider and are
+            refreshed as they expire.
         """
 
         def _get_credentials(
@@ -677,8 +855,11 @@ class AzureSession(Session):
             "authority_host": os.getenv("AZURE_AUTHORITY_HOST"),
         }
 
+        self._credential_provider = credential_provider
         self._creds = _get_credentials(**passed_args)
-        if not AzureSession.hascreds(self.get_credential_options()):
+        if credential_provider is None and not AzureSession.hascreds(
+            self.get_credential_options()
+        ):
             self._creds = _get_credentials(**env_vars)
 
     @classmethod
@@ -724,7 +905,7 @@ class AzureSession(Session):
     @property
     def credentials(self):
         """The session credentials as a dict"""
-        return self._creds
+        return _provided_credentials(self._creds, self._credential_provider)
 
     def get_credential_options(self):
         """Get credentials as GDAL configuration options
@@ -737,6 +918,15 @@ class AzureSession(Session):
         return {k.upper(): v for k, v in self.credentials.items()}
 
 
+def _provided_credentials(creds, provider):
+    """Overlay the cached credentials of a provider, if any, on creds."""
+    if provider is None:
+        return creds
+    res = dict(creds)
+    res.update(_cached_credentials(provider).get(provider))
+    return res
+
+
 def parse_bool(v):
     """CPLTestBool equivalent"""
     if isinstance(v, bool):
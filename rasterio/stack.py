@@ -12,13 +12,13 @@ import numbers
 import numpy as np
 
 import rasterio
+from rasterio._tiles import _chunk_plan
 from rasterio.coords import disjoint_bounds
 from rasterio.enums import Resampling
 from rasterio.errors import RasterioError, StackError
 from rasterio.io import DatasetWriter
 from rasterio import windows
 from rasterio.transform import Affine
-from rasterio.windows import subdivide
 
 logger = logging.getLogger(__name__)
 
@@ -86,7 +86,8 @@ def stack(
         are integer multiples of pixel size, matching the ``-tap``
         options of GDAL utilities.  Default: False.
     mem_limit : int, optional
-        Process stack output in chunks of mem_limit MB in size.
+        Process stack output in chunks of mem_limit MB in size. Chunks
+        written to a dataset are aligned to its blocks.
     dst_path : str or PathLike, optional
         Path of output dataset.
     dst_kwds : dict, optional
@@ -271,12 +272,7 @@ def stack(
                 exit_stack.enter_context(dst)
 
             max_pixels = mem_limit * 1.0e6 / (np.dtype(dt).itemsize * output_count)
-
-            if output_width * output_height < max_pixels:
-                chunks = [dout_window]
-            else:
-                n = math.floor(math.sqrt(max_pixels))
-                chunks = subdivide(dout_window, n, n)
+            chunks = _chunk_plan(dout_window, max_pixels, dst.block_shapes[0])
         else:
             chunks = [dout_window]
 
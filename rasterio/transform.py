@@ -2,6 +2,7 @@
 
 from contextlib import ExitStack
 from functools import partial
+import math
 import numpy as np
 import warnings
 from numbers import Number
@@ -217,7 +218,7 @@ def array_bounds(height, width, transform):
     return west, south, east, north
 
 
-def xy(transform, rows, cols, zs=None, offset="center", **rpc_options):
+def xy(transform, rows, cols, zs=None, offset="center", out=None, **rpc_options):
     """Get the x and y coordinates of pixels at `rows` and `cols`.
 
     The pixel's center is returned by default, but a corner can be returned
@@ -241,6 +242,9 @@ def xy(transform, rows, cols, zs=None, offset="center", **rpc_options):
     offset : str, optional
         Determines if the returned coordinates are for the center of the
         pixel or for a corner.
+    out : tuple of numpy.ndarray, optional
+        Contiguous arrays, of the size of the coordinates, in which the
+        x and y coordinates are stored and which are returned.
     rpc_options : dict, optional
         Additional arguments passed to GDALCreateRPCTransformer.
 
@@ -254,7 +258,7 @@ def xy(transform, rows, cols, zs=None, offset="center", **rpc_options):
     """
     transformer_cls = get_transformer(transform, **rpc_options)
     with transformer_cls() as transformer:
-        return transformer.xy(rows, cols, zs=zs, offset=offset)
+        return transformer.xy(rows, cols, zs=zs, offset=offset, out=out)
 
 
 def rowcol(
@@ -264,6 +268,8 @@ def rowcol(
     zs=None,
     op=None,
     precision=None,
+    out=None,
+    dtype=None,
     **rpc_options,
 ):
     """Get rows and cols of the pixels containing (x, y).
@@ -287,6 +293,13 @@ def rowcol(
     precision : int or float, optional
         This parameter is unused, deprecated in rasterio 1.3.0, and
         will be removed in version 2.0.0.
+    out : tuple of numpy.ndarray, optional
+        Contiguous arrays, of the size of the coordinates, in which the
+        rows and cols are stored and which are returned.
+    dtype : str or numpy.dtype, optional
+        The data type of rows and cols, such as "int64" for rasters
+        with more than 2**31 rows or columns. By default it is "int32"
+        if op is None and otherwise determined by op.
     rpc_options : dict, optional
         Additional arguments passed to GDALCreateRPCTransformer.
 
@@ -306,7 +319,7 @@ def rowcol(
 
     transformer_cls = get_transformer(transform, **rpc_options)
     with transformer_cls() as transformer:
-        return transformer.rowcol(xs, ys, zs=zs, op=op)
+        return transformer.rowcol(xs, ys, zs=zs, op=op, out=out, dtype=dtype)
 
 
 def from_gcps(gcps):
@@ -325,6 +338,56 @@ def from_gcps(gcps):
     return Affine.from_gdal(*_transform_from_gcps(gcps))
 
 
+# Ops of rowcol() that have a ufunc equivalent, and the data type of
+# their results.
+_ROWCOL_OPS = {
+    float: (np.positive, "float64"),
+    int: (np.trunc, "int64"),
+    round: (np.rint, "int64"),
+    math.floor: (np.floor, "int64"),
+    math.ceil: (np.ceil, "int64"),
+    math.trunc: (np.trunc, "int64"),
+}
+
+
+def _is_axis_aligned(transform, epsilon=1e-12):
+    """Test whether a transform maps columns to x and rows to y only.
+
+    Unlike Affine.is_rectilinear, this is False for transforms rotated
+    by 90 degrees, which swap the axes.
+    """
+    return (
+        abs(transform.b) < epsilon
+        and abs(transform.d) < epsilon
+        and transform.a != 0
+        and transform.e != 0
+    )
+
+
+def _rowcol_op(op):
+    """Get the ufunc equivalent to an op of rowcol() and its data type.
+
+    Returns (None, None) if the op has no equivalent and must be applied
+    to each coordinate.
+    """
+    if op is None:
+        return np.floor, "int32"
+    elif isinstance(op, np.ufunc):
+        return op, None
+    try:
+        return _ROWCOL_OPS.get(op, (None, None))
+    except TypeError:
+        return None, None
+
+
+def _store(result, out):
+    """Copy an array of results into an out array and return it."""
+    if out is None:
+        return result
+    out[...] = result.reshape(out.shape)
+    return out
+
+
 class TransformerBase:
     """Generic GDAL transformer base class
 
@@ -366,7 +429,7 @@ class TransformerBase:
     def __exit__(self, *args):
         pass
 
-    def rowcol(self, xs, ys, zs=None, op=None, precision=None):
+    def rowcol(self, xs, ys, zs=None, op=None, precision=None, out=None, dtype=None):
         """Get rows and cols coordinates given geographic coordinates.
 
         Parameters
@@ -383,6 +446,12 @@ class TransformerBase:
         precision : int, optional (default: None)
             This parameter is unused, deprecated in rasterio 1.3.0, and
             will be removed in version 2.0.0.
+        out : tuple of numpy.ndarray, optional
+            Contiguous arrays, of the size of the coordinates, in which
+            rows and cols are stored and which are returned.
+        dtype : str or numpy.dtype, optional
+            The data type of rows and cols. By default it is "int32" if
+            op is None and otherwise determined by op.
 
         Raises
         ------
@@ -406,31 +475,37 @@ class TransformerBase:
 
         IS_SCALAR = isinstance(xs, Number) and isinstance(ys, Number)
         xs, ys, zs = self._ensure_arr_input(xs, ys, zs=zs)
+        ufunc, op_dtype = _rowcol_op(op)
 
         try:
             new_cols, new_rows = self._transform(
                 xs, ys, zs, transform_direction=TransformDirection.reverse
             )
 
-            if op is None:
-                new_rows = np.floor(new_rows).astype(dtype=np.int32)
-                new_cols = np.floor(new_cols).astype(dtype=np.int32)
-            elif isinstance(op, np.ufunc):
-                op(new_rows, out=new_rows)
-                op(new_cols, out=new_cols)
+            if ufunc is None:
+                new_rows = np.array(list(map(op, new_rows)), dtype=dtype)
+                new_cols = np.array(list(map(op, new_cols)), dtype=dtype)
             else:
-                new_rows = np.array(list(map(op, new_rows)))
-                new_cols = np.array(list(map(op, new_cols)))
+                ufunc(new_rows, out=new_rows)
+                ufunc(new_cols, out=new_cols)
+                dtype = dtype or op_dtype
+                if dtype is not None:
+                    new_rows = new_rows.astype(dtype)
+                    new_cols = new_cols.astype(dtype)
+
+            if out is not None:
+                new_rows = _store(new_rows, out[0])
+                new_cols = _store(new_cols, out[1])
 
             if IS_SCALAR:
-                return new_rows[0], new_cols[0]
+                return new_rows.flat[0], new_cols.flat[0]
             else:
                 return new_rows, new_cols
 
         except TypeError:
             raise TransformError("Invalid inputs")
 
-    def xy(self, rows, cols, zs=None, offset="center"):
+    def xy(self, rows, cols, zs=None, offset="center", out=None):
         """
         Returns geographic coordinates given dataset rows and cols coordinates
 
@@ -446,6 +521,10 @@ class TransformerBase:
             Determines if the returned coordinates are for the center of the
             pixel or for a corner. Available options include center, ul, ur, ll,
             lr.
+        out : tuple of numpy.ndarray, optional
+            Contiguous arrays, of the size of the coordinates, in which x
+            and y coordinates are stored and which are returned.
+
         Raises
         ------
         ValueError
@@ -458,19 +537,7 @@ class TransformerBase:
         """
         IS_SCALAR = isinstance(rows, Number) and isinstance(cols, Number)
         rows, cols, zs = self._ensure_arr_input(rows, cols, zs=zs)
-
-        if offset == "center":
-            coff, roff = (0.5, 0.5)
-        elif offset == "ul":
-            coff, roff = (0, 0)
-        elif offset == "ur":
-            coff, roff = (1, 0)
-        elif offset == "ll":
-            coff, roff = (0, 1)
-        elif offset == "lr":
-            coff, roff = (1, 1)
-        else:
-            raise TransformError("Invalid offset")
+        coff, roff = self._offsets(offset)
 
         try:
             # shift input coordinates according to offset
@@ -486,13 +553,33 @@ class TransformerBase:
                 transform_direction=TransformDirection.forward,
             )
 
+            if out is not None:
+                new_xs = _store(new_xs, out[0])
+                new_ys = _store(new_ys, out[1])
+
             if IS_SCALAR:
-                return new_xs[0], new_ys[0]
+                return new_xs.flat[0], new_ys.flat[0]
             else:
                 return new_xs, new_ys
         except TypeError:
             raise TransformError("Invalid inputs")
 
+    @staticmethod
+    def _offsets(offset):
+        """Get the column and row offsets of a pixel's center or corner."""
+        if offset == "center":
+            return 0.5, 0.5
+        elif offset == "ul":
+            return 0, 0
+        elif offset == "ur":
+            return 1, 0
+        elif offset == "ll":
+            return 0, 1
+        elif offset == "lr":
+            return 1, 1
+        else:
+            raise TransformError("Invalid offset")
+
     def _transform(self, xs, ys, zs, transform_direction):
         raise NotImplementedError
 
@@ -527,6 +614,196 @@ class AffineTransformer(TransformerBase):
             3, 3
         )
 
+    #: The number of coordinates transformed at a time by rowcol() and
+    #: xy(), which bounds their temporary memory.
+    chunk_size = 1 << 20
+
+    def rowcol(self, xs, ys, zs=None, op=None, precision=None, out=None, dtype=None):
+        """Get rows and cols coordinates given geographic coordinates.
+
+        Coordinates are transformed in chunks, in place, and ops with a
+        ufunc equivalent, such as math.floor or round, are applied to
+        whole chunks. The coordinates of transforms without rotation or
+        shear are computed directly, without solving a system of equations.
+
+        See TransformerBase.rowcol() for the parameters.
+        """
+        ufunc, op_dtype = _rowcol_op(op)
+        if ufunc is None:
+            return super().rowcol(
+                xs, ys, zs=zs, op=op, precision=precision, out=out, dtype=dtype
+            )
+
+        if precision is not None:
+            warnings.warn(
+                "The precision parameter is unused, deprecated, and will be removed in 2.0.0.",
+                RasterioDeprecationWarning,
+            )
+
+        IS_SCALAR = isinstance(xs, Number) and isinstance(ys, Number)
+        xs, ys, _ = self._ensure_arr_input(xs, ys)
+
+        try:
+            new_cols, new_rows = self._transform_chunks(
+                xs,
+                ys,
+                TransformDirection.reverse,
+                ufunc=ufunc,
+                dtype=dtype or op_dtype or "float64",
+                out=None if out is None else (out[1], out[0]),
+            )
+        except TypeError:
+            raise TransformError("Invalid inputs")
+
+        if IS_SCALAR:
+            return new_rows.flat[0], new_cols.flat[0]
+        else:
+            return new_rows, new_cols
+
+    def xy(self, rows, cols, zs=None, offset="center", out=None):
+        """Returns geographic coordinates given dataset rows and cols coordinates
+
+        Coordinates are transformed in chunks, in place.
+
+        See TransformerBase.xy() for the parameters.
+        """
+        IS_SCALAR = isinstance(rows, Number) and isinstance(cols, Number)
+        rows, cols, _ = self._ensure_arr_input(rows, cols)
+        coff, roff = self._offsets(offset)
+
+        try:
+            new_xs, new_ys = self._transform_chunks(
+                cols,
+                rows,
+                TransformDirection.forward,
+                offsets=(coff, roff),
+                out=out,
+            )
+        except TypeError:
+            raise TransformError("Invalid inputs")
+
+        if IS_SCALAR:
+            return new_xs.flat[0], new_ys.flat[0]
+        else:
+            return new_xs, new_ys
+
+    def _transform_chunks(
+        self,
+        us,
+        vs,
+        transform_direction,
+        offsets=(0, 0),
+        ufunc=None,
+        dtype="float64",
+        out=None,
+    ):
+        """Transform coordinates chunk by chunk.
+
+        Parameters
+        ----------
+        us, vs : numpy.ndarray
+            x and y, or column and row, coordinates.
+        transform_direction : TransformDirection
+            Forward to transform columns and rows to x and y.
+        offsets : tuple, optional
+            Offsets added to the coordinates before transformation.
+        ufunc : numpy.ufunc, optional
+            Applied to the transformed coordinates.
+        dtype : str or numpy.dtype, optional
+            Data type of the results.
+        out : tuple of numpy.ndarray, optional
+            Arrays for the results.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            1-D arrays, or the out arrays.
+        """
+        shape = np.broadcast_shapes(us.shape, vs.shape)
+        size = math.prod(shape)
+
+        def flat(arr):
+            if arr.size == 1:
+                return arr.reshape(1)
+            elif arr.shape == shape:
+                return arr.reshape(-1)
+            else:
+                return np.broadcast_to(arr, shape).reshape(-1)
+
+        us = flat(us)
+        vs = flat(vs)
+
+        if out is None:
+            out = (np.empty(size, dtype=dtype), np.empty(size, dtype=dtype))
+            flat_out = out
+        else:
+            for arr in out:
+                if arr.size != size or not arr.flags.c_contiguous:
+                    raise ValueError(
+                        "out arrays must be contiguous and have the size of the coordinates"
+                    )
+            flat_out = tuple(arr.reshape(-1) for arr in out)
+
+        a, b, c, d, e, f = tuple(self._transformer)[:6]
+        rectilinear = _is_axis_aligned(self._transformer)
+        uoff, voff = offsets
+
+        chunk_size = min(size, self.chunk_size)
+        ps = np.empty(chunk_size)
+        qs = np.empty(chunk_size)
+        temp = None if rectilinear else np.empty(chunk_size)
+
+        for start in range(0, size, self.chunk_size):
+            stop = min(start + self.chunk_size, size)
+            n = stop - start
+            u = us if us.size == 1 else us[start:stop]
+            v = vs if vs.size == 1 else vs[start:stop]
+            if uoff:
+                u = u + uoff
+            if voff:
+                v = v + voff
+            p = ps[:n]
+            q = qs[:n]
+
+            if transform_direction is TransformDirection.forward:
+                if rectilinear:
+                    np.multiply(u, a, out=p)
+                    p += c
+                    np.multiply(v, e, out=q)
+                    q += f
+                else:
+                    t = temp[:n]
+                    np.multiply(u, a, out=p)
+                    np.multiply(v, b, out=t)
+                    p += t
+                    p += c
+                    np.multiply(u, d, out=q)
+                    np.multiply(v, e, out=t)
+                    q += t
+                    q += f
+            elif rectilinear:
+                np.subtract(u, c, out=p)
+                p /= a
+                np.subtract(v, f, out=q)
+                q /= e
+            else:
+                matrix = np.empty((3, n))
+                matrix[0] = u
+                matrix[1] = v
+                matrix[2] = 1
+                solved = np.linalg.solve(self._transform_arr, matrix)
+                p[:] = solved[0]
+                q[:] = solved[1]
+
+            if ufunc is not None:
+                ufunc(p, out=p)
+                ufunc(q, out=q)
+
+            flat_out[0][start:stop] = p
+            flat_out[1][start:stop] = q
+
+        return out
+
     def _transform(self, xs, ys, zs, transform_direction):
         bi = np.broadcast(xs, ys)
         input_matrix = np.empty((3, bi.size))
@@ -552,14 +829,19 @@ class RPCTransformer(RPCTransformerBase, GDALTransformerBase):
     Uses GDALCreateRPCTransformer and GDALRPCTransform for computations. Options
     for GDALCreateRPCTransformer may be passed using `rpc_options`.
     Ensure that GDAL transformer objects are destroyed by calling `close()`
-    method or using context manager interface.
+    method or using context manager interface. If `max_error` is set,
+    GDAL's approximate transformer is used with that maximum error.
+
+    A transformer may be shared between threads, but it transforms for
+    one thread at a time. Transformers of their own let threads
+    transform concurrently.
 
     """
 
-    def __init__(self, rpcs, **rpc_options):
+    def __init__(self, rpcs, max_error=None, **rpc_options):
         if not isinstance(rpcs, (RPC, dict)):
             raise ValueError("RPCTransformer requires RPC")
-        super().__init__(rpcs, **rpc_options)
+        super().__init__(rpcs, max_error=max_error, **rpc_options)
 
     def __repr__(self):
         return "<{} RPCTransformer>".format(self.closed and "closed" or "open")
@@ -573,14 +855,181 @@ class GCPTransformer(GCPTransformerBase, GDALTransformerBase):
     Uses GDALCreateGCPTransformer and GDALGCPTransform for computations.
     Ensure that GDAL transformer objects are destroyed by calling `close()`
     method or using context manager interface. If `tps` is set to True,
-    uses GDALCreateTPSTransformer and GDALTPSTransform instead.
+    uses GDALCreateTPSTransformer and GDALTPSTransform instead. If
+    `max_error` is set, GDAL's approximate transformer is used with that
+    maximum error.
+
+    A transformer may be shared between threads, but it transforms for
+    one thread at a time. Transformers of their own let threads
+    transform concurrently.
 
     """
 
-    def __init__(self, gcps, tps=False):
+    def __init__(self, gcps, tps=False, max_error=None):
         if len(gcps) and not isinstance(gcps[0], GroundControlPoint):
             raise ValueError("GCPTransformer requires sequence of GroundControlPoint")
-        super().__init__(gcps, tps)
+        super().__init__(gcps, tps, max_error)
 
     def __repr__(self):
         return "<{} GCPTransformer>".format(self.closed and "closed" or "open")
+
+
+class GridTransformer(TransformerBase):
+    """
+    Coordinate transformations interpolated from precomputed grids.
+
+    A grid transformer holds the geographic coordinates of a grid of
+    pixel coordinates spanning a raster, and the pixel coordinates of a
+    grid of geographic coordinates spanning its bounds. Coordinates are
+    transformed by bilinear interpolation between the nodes of these
+    grids, which is much cheaper than evaluating RPC or GCP models.
+    Coordinates outside of the grids are extrapolated from their edges.
+
+    Grids are computed from another transformer with
+    `from_transformer()`, and may be saved with `save()` and reloaded
+    with `load()`.
+
+    """
+
+    def __init__(self, width, height, xs, ys, bounds, rows, cols):
+        """
+        Parameters
+        ----------
+        width, height : int
+            The size of the raster.
+        xs, ys : numpy.ndarray
+            Arrays of shape (m, n), m and n >= 2: the x and y coordinates
+            of evenly spaced pixel coordinates, from the upper left corner
+            of the raster to its lower right corner.
+        bounds : tuple
+            The (left, bottom, right, top) bounds of the geographic grid.
+        rows, cols : numpy.ndarray
+            Arrays of shape (p, q), p and q >= 2: the rows and cols of
+            evenly spaced geographic coordinates, from the upper left
+            corner of bounds to its lower right corner.
+        """
+        super().__init__()
+        xs, ys, rows, cols = (
+            np.asarray(arr, dtype="float64") for arr in (xs, ys, rows, cols)
+        )
+        if xs.shape != ys.shape or rows.shape != cols.shape:
+            raise ValueError("Grid coordinate arrays must have the same shape")
+        if min(xs.shape + rows.shape) < 2 or xs.ndim != 2 or rows.ndim != 2:
+            raise ValueError("Grids must have at least 2 rows and 2 columns")
+        self.width = width
+        self.height = height
+        self.bounds = tuple(bounds)
+        self._pixel_grid = np.stack((xs, ys))
+        self._geo_grid = np.stack((cols, rows))
+
+    @classmethod
+    def from_transformer(cls, transformer, width, height, step=16):
+        """Compute the grids of a raster from another transformer.
+
+        Parameters
+        ----------
+        transformer : TransformerBase
+            A transformer, such as an RPCTransformer or GCPTransformer.
+        width, height : int
+            The size of the raster.
+        step : int, optional
+            The approximate spacing of grid nodes, in pixels.
+
+        Returns
+        -------
+        GridTransformer
+        """
+        nrows = max(2, math.ceil(height / step) + 1)
+        ncols = max(2, math.ceil(width / step) + 1)
+
+        rows, cols = np.meshgrid(
+            np.linspace(0, height, nrows), np.linspace(0, width, ncols), indexing="ij"
+        )
+        xs, ys = transformer.xy(rows, cols, offset="ul")
+        xs = xs.reshape(nrows, ncols)
+        ys = ys.reshape(nrows, ncols)
+
+        bounds = (np.nanmin(xs), np.nanmin(ys), np.nanmax(xs), np.nanmax(ys))
+        left, bottom, right, top = bounds
+        grid_ys, grid_xs = np.meshgrid(
+            np.linspace(top, bottom, nrows),
+            np.linspace(left, right, ncols),
+            indexing="ij",
+        )
+        grid_rows, grid_cols = transformer.rowcol(grid_xs, grid_ys, op=float)
+        return cls(
+            width,
+            height,
+            xs,
+            ys,
+            bounds,
+            grid_rows.reshape(nrows, ncols),
+            grid_cols.reshape(nrows, ncols),
+        )
+
+    def save(self, path):
+        """Save the grids to a .npz file.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+        """
+        np.savez(
+            path,
+            size=np.array([self.width, self.height]),
+            bounds=np.array(self.bounds),
+            pixel_grid=self._pixel_grid,
+            geo_grid=self._geo_grid,
+        )
+
+    @classmethod
+    def load(cls, path):
+        """Load grids saved by save().
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+
+        Returns
+        -------
+        GridTransformer
+        """
+        with np.load(path) as data:
+            width, height = data["size"].tolist()
+            xs, ys = data["pixel_grid"]
+            cols, rows = data["geo_grid"]
+            return cls(width, height, xs, ys, data["bounds"].tolist(), rows, cols)
+
+    @staticmethod
+    def _interpolate(grid, us, vs):
+        """Bilinear interpolation in a grid at fractional node indexes."""
+        nrows, ncols = grid.shape[1:]
+        i = np.clip(np.floor(vs), 0, nrows - 2).astype("intp")
+        j = np.clip(np.floor(us), 0, ncols - 2).astype("intp")
+        t = vs - i
+        s = us - j
+        upper = grid[:, i, j] * (1 - s) + grid[:, i, j + 1] * s
+        lower = grid[:, i + 1, j] * (1 - s) + grid[:, i + 1, j + 1] * s
+        return upper * (1 - t) + lower * t
+
+    def _transform(self, xs, ys, zs, transform_direction):
+        xs, ys = (
+            np.asarray(arr, dtype="float64").reshape(-1)
+            for arr in np.broadcast_arrays(xs, ys)
+        )
+        if transform_direction is TransformDirection.forward:
+            grid = self._pixel_grid
+            nrows, ncols = grid.shape[1:]
+            us = xs * ((ncols - 1) / self.width)
+            vs = ys * ((nrows - 1) / self.height)
+        else:
+            grid = self._geo_grid
+            nrows, ncols = grid.shape[1:]
+            left, bottom, right, top = self.bounds
+            us = (xs - left) * ((ncols - 1) / (right - left))
+            vs = (top - ys) * ((nrows - 1) / (top - bottom))
+        new_xs, new_ys = self._interpolate(grid, us, vs)
+        return new_xs, new_ys
+
+    def __repr__(self):
+        return "<GridTransformer>"
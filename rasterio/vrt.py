@@ -1,12 +1,19 @@
 """rasterio.vrt: a module concerned with GDAL VRTs"""
 
+from contextlib import nullcontext
+import math
+import numbers
+import os
 import xml.etree.ElementTree as ET
 
+import rasterio
 from rasterio._warp import WarpedVRTReaderBase
+from rasterio.coords import disjoint_bounds
 from rasterio.dtypes import _gdal_typename
 from rasterio.enums import MaskFlags, Resampling
+from rasterio.errors import MergeError, RasterioError
 from rasterio._path import _parse_path
-from rasterio.transform import TransformMethodsMixin
+from rasterio.transform import Affine, TransformMethodsMixin
 from rasterio.windows import WindowMethodsMixin
 
 
@@ -273,3 +280,259 @@ def _boundless_vrt_doc(
         dstrect.attrib["ySize"] = str(src_dataset.height)
 
     return ET.tostring(vrtdataset).decode("ascii")
+
+
+def build_mosaic(
+    sources,
+    bounds=None,
+    res=None,
+    nodata=None,
+    indexes=None,
+    resampling=Resampling.nearest,
+    target_aligned_pixels=False,
+    use_highest_res=False,
+):
+    """Make a VRT XML document mosaicking many datasets.
+
+    This is the equivalent of gdalbuildvrt. Only the metadata of the
+    sources is read. No pixels are copied, and reading a window of the
+    mosaic reads only the sources which intersect it.
+
+    All sources must have the same coordinate reference system.
+    Rotated, flipped, or upside-down rasters cannot be mosaicked. Where
+    sources overlap, the first in the sequence is on top, like the
+    default "first" method of rasterio.merge.merge.
+
+    Parameters
+    ----------
+    sources : list
+        A sequence of dataset objects opened in 'r' mode or Path-like
+        objects.
+    bounds: tuple, optional
+        Bounds of the mosaic (left, bottom, right, top). If not set,
+        the union of the bounds of the sources is used.
+    res: tuple, optional
+        Mosaic resolution in units of the coordinate reference system.
+        If not set, a source resolution will be used. If a single
+        value is passed, mosaic pixels will be square.
+    nodata: float, optional
+        nodata value of the mosaic. If not set, the nodata value of the
+        first source is used.
+    indexes : list of ints, optional
+        Bands of the sources to mosaic. Default: all bands.
+    resampling : Resampling, optional
+        Resampling algorithm used when source and mosaic resolutions
+        differ. Default: `Resampling.nearest`.
+    target_aligned_pixels : bool, optional
+        Whether to adjust mosaic bounds so that pixel coordinates are
+        integer multiples of pixel size, matching the ``-tap`` options
+        of GDAL utilities.  Default: False.
+    use_highest_res: bool, optional. Default: False.
+        If True, the highest resolution of all sources will be used. If
+        False, the first source's resolution will be used.
+
+    Returns
+    -------
+    str
+        An XML text string which can be opened by rasterio.open() or
+        written to a .vrt file or a MemoryFile.
+
+    Raises
+    ------
+    ValueError
+        When there are no sources or a source lacks a requested band.
+    MergeError
+        When a source is rotated, flipped, or upside-down.
+    RasterioError
+        When the coordinate reference systems of sources differ.
+
+    Examples
+    --------
+
+    >>> doc = build_mosaic(["tests/data/RGB.byte.tif"])
+    >>> with rasterio.open(doc) as mosaic:
+    ...     data = mosaic.read(1, window=((0, 256), (0, 256)))
+
+    """
+    if not sources:
+        raise ValueError("At least one source is required")
+
+    if isinstance(sources[0], (str, os.PathLike)):
+        dataset_opener = rasterio.open
+    else:
+        dataset_opener = nullcontext
+
+    # Metadata of sources is read in one pass and kept in simple
+    # records so that each source is opened only once.
+    records = []
+    crs = None
+
+    for dataset in sources:
+        with dataset_opener(dataset) as src:
+            transform = src.transform
+
+            if not transform.is_rectilinear:
+                raise MergeError(
+                    "Rotated, non-rectilinear rasters cannot be mosaicked."
+                )
+            if transform.a < 0:
+                raise MergeError(
+                    'Rasters with negative pixel width ("flipped" rasters) cannot be mosaicked.'
+                )
+            if transform.e > 0:
+                raise MergeError(
+                    'Rasters with negative pixel height ("upside down" rasters) cannot be mosaicked.'
+                )
+
+            if not records:
+                first_indexes = indexes or src.indexes
+
+            if not all(1 <= bidx <= src.count for bidx in first_indexes):
+                raise ValueError(
+                    f"Source does not have bands {list(first_indexes)}: {dataset}"
+                )
+
+            if not records:
+                crs = src.crs
+                band_dtypes = [src.dtypes[bidx - 1] for bidx in first_indexes]
+                band_colorinterps = [
+                    src.colorinterp[bidx - 1] for bidx in first_indexes
+                ]
+                if nodata is None:
+                    nodata = src.nodata
+            elif src.crs != crs:
+                raise RasterioError(f"CRS mismatch with source: {dataset}")
+
+            records.append(
+                {
+                    "path": _parse_path(src.name).as_vsi(),
+                    "bounds": src.bounds,
+                    "res": src.res,
+                    "transform": transform,
+                    "width": src.width,
+                    "height": src.height,
+                    "dtypes": src.dtypes,
+                    "block_shapes": src.block_shapes,
+                    "nodata": src.nodata,
+                    "use_mask": all(
+                        MaskFlags.per_dataset in flags for flags in src.mask_flag_enums
+                    ),
+                    "options": src.options,
+                }
+            )
+
+    if bounds:
+        dst_w, dst_s, dst_e, dst_n = bounds
+    else:
+        dst_w = min(rec["bounds"][0] for rec in records)
+        dst_s = min(rec["bounds"][1] for rec in records)
+        dst_e = max(rec["bounds"][2] for rec in records)
+        dst_n = max(rec["bounds"][3] for rec in records)
+
+    if not res:
+        if use_highest_res:
+            res = min(
+                (rec["res"] for rec in records),
+                key=lambda x: math.sqrt(x[0] ** 2 + x[1] ** 2),
+            )
+        else:
+            res = records[0]["res"]
+    elif isinstance(res, numbers.Number):
+        res = (res, res)
+    elif len(res) == 1:
+        res = (res[0], res[0])
+
+    if target_aligned_pixels:
+        dst_w = math.floor(dst_w / res[0]) * res[0]
+        dst_e = math.ceil(dst_e / res[0]) * res[0]
+        dst_s = math.floor(dst_s / res[1]) * res[1]
+        dst_n = math.ceil(dst_n / res[1]) * res[1]
+
+    width = int(round((dst_e - dst_w) / res[0]))
+    height = int(round((dst_n - dst_s) / res[1]))
+    dst_transform = Affine.translation(dst_w, dst_n) * Affine.scale(res[0], -res[1])
+
+    vrtdataset = ET.Element("VRTDataset")
+    vrtdataset.attrib["rasterYSize"] = str(height)
+    vrtdataset.attrib["rasterXSize"] = str(width)
+    srs = ET.SubElement(vrtdataset, "SRS")
+    srs.text = crs.wkt if crs else ""
+    geotransform = ET.SubElement(vrtdataset, "GeoTransform")
+    geotransform.text = ",".join([str(v) for v in dst_transform.to_gdal()])
+
+    # Sources disjoint from the mosaic are left out of the document.
+    records = [
+        rec
+        for rec in records
+        if not disjoint_bounds((dst_w, dst_s, dst_e, dst_n), rec["bounds"])
+    ]
+
+    for dst_bidx, (src_bidx, dtype, ci) in enumerate(
+        zip(first_indexes, band_dtypes, band_colorinterps), start=1
+    ):
+        vrtrasterband = ET.SubElement(vrtdataset, "VRTRasterBand")
+        vrtrasterband.attrib["dataType"] = _gdal_typename(dtype)
+        vrtrasterband.attrib["band"] = str(dst_bidx)
+
+        if nodata is not None:
+            nodatavalue = ET.SubElement(vrtrasterband, "NoDataValue")
+            nodatavalue.text = str(nodata)
+
+        colorinterp = ET.SubElement(vrtrasterband, "ColorInterp")
+        colorinterp.text = ci.name.capitalize()
+
+        # GDAL paints sources in document order, so the first source
+        # is put last to be on top.
+        for rec in reversed(records):
+            src_transform = rec["transform"]
+            block_shape = rec["block_shapes"][src_bidx - 1]
+            complexsource = ET.SubElement(vrtrasterband, "ComplexSource")
+            complexsource.attrib["resampling"] = resampling.name.replace("_", "")
+            sourcefilename = ET.SubElement(complexsource, "SourceFilename")
+            sourcefilename.attrib["relativeToVRT"] = "0"
+            sourcefilename.attrib["shared"] = "0"
+            sourcefilename.text = rec["path"]
+            sourceband = ET.SubElement(complexsource, "SourceBand")
+            sourceband.text = str(src_bidx)
+            sourceproperties = ET.SubElement(complexsource, "SourceProperties")
+            sourceproperties.attrib["RasterXSize"] = str(rec["width"])
+            sourceproperties.attrib["RasterYSize"] = str(rec["height"])
+            sourceproperties.attrib["dataType"] = _gdal_typename(
+                rec["dtypes"][src_bidx - 1]
+            )
+            sourceproperties.attrib["BlockYSize"] = str(block_shape[0])
+            sourceproperties.attrib["BlockXSize"] = str(block_shape[1])
+            srcrect = ET.SubElement(complexsource, "SrcRect")
+            srcrect.attrib["xOff"] = "0"
+            srcrect.attrib["yOff"] = "0"
+            srcrect.attrib["xSize"] = str(rec["width"])
+            srcrect.attrib["ySize"] = str(rec["height"])
+            dstrect = ET.SubElement(complexsource, "DstRect")
+            dstrect.attrib["xOff"] = str(
+                (src_transform.xoff - dst_transform.xoff) / dst_transform.a
+            )
+            dstrect.attrib["yOff"] = str(
+                (src_transform.yoff - dst_transform.yoff) / dst_transform.e
+            )
+            dstrect.attrib["xSize"] = str(
+                rec["width"] * src_transform.a / dst_transform.a
+            )
+            dstrect.attrib["ySize"] = str(
+                rec["height"] * src_transform.e / dst_transform.e
+            )
+
+            if rec["nodata"] is not None:
+                nodata_elem = ET.SubElement(complexsource, "NODATA")
+                nodata_elem.text = str(rec["nodata"])
+            elif rec["use_mask"]:
+                usemaskband = ET.SubElement(complexsource, "UseMaskBand")
+                usemaskband.text = "true"
+
+            if rec["options"] is not None:
+                openoptions = ET.SubElement(complexsource, "OpenOptions")
+                for ookey, oovalue in rec["options"].items():
+                    ooi = ET.SubElement(openoptions, "OOI")
+                    ooi.attrib["key"] = str(ookey)
+                    ooi.text = str(oovalue)
+
+    return ET.tostring(vrtdataset).decode("ascii")
@@ -27,6 +27,7 @@ from affine import Affine
 import attr
 import numpy as np
 
+from rasterio.enums import MaskFlags
 from rasterio.errors import WindowError, RasterioDeprecationWarning
 from rasterio.transform import rowcol, guard_transform
 
@@ -191,6 +192,131 @@ def get_data_window(arr, nodata=None):
     return Window.from_slices(*v)
 
 
+def data_window(dataset, indexes=None, overviews=True):
+    """Window covering a dataset's valid data pixels.
+
+    This is the dataset counterpart of get_data_window(). Pixels are
+    valid where the mask of any of the bands is valid.
+
+    The masks are not read in full. The data window is first located
+    in the masks of the coarsest overview, if any. Then the blocks
+    around that location are read at full resolution, from the edges
+    inwards, until valid pixels are found. Interior blocks are not read
+    and blocks that the format reports as empty, such as sparse GeoTIFF
+    tiles, are skipped.
+
+    Parameters
+    ----------
+    dataset : DatasetReader
+        An opened dataset.
+    indexes : int or list of int, optional
+        Indexes of the bands to consider. All bands by default.
+    overviews : bool, optional
+        Whether to locate the data window in overviews first. Valid
+        pixels lost in the computation of overviews, such as isolated
+        pixels far from others, may be missed. If False, the result is
+        exact but more blocks may be read.
+
+    Returns
+    -------
+    Window
+    """
+    if indexes is None:
+        indexes = dataset.indexes
+    elif isinstance(indexes, int):
+        indexes = [indexes]
+    indexes = list(indexes)
+    height = dataset.height
+    width = dataset.width
+
+    mask_flags = dataset.mask_flag_enums
+    if all(MaskFlags.all_valid in mask_flags[bidx - 1] for bidx in indexes):
+        return Window(0, 0, width, height)
+
+    row_start, row_stop, col_start, col_stop = 0, height, 0, width
+    factors = dataset.overviews(indexes[0]) if overviews else []
+    if factors:
+        factor = max(factors)
+        out_height = max(1, math.ceil(height / factor))
+        out_width = max(1, math.ceil(width / factor))
+        mask = dataset.read_masks(
+            indexes, out_shape=(len(indexes), out_height, out_width)
+        ).any(axis=0)
+        rows = np.flatnonzero(mask.any(axis=1))
+        cols = np.flatnonzero(mask.any(axis=0))
+        if not rows.size:
+            return Window(0, 0, 0, 0)
+        # Pad by a coarse pixel, which resampling may have shifted.
+        scale_y = height / out_height
+        scale_x = width / out_width
+        row_start = max(0, math.floor((rows[0] - 1) * scale_y))
+        row_stop = min(height, math.ceil((rows[-1] + 2) * scale_y))
+        col_start = max(0, math.floor((cols[0] - 1) * scale_x))
+        col_stop = min(width, math.ceil((cols[-1] + 2) * scale_x))
+
+    block_height, block_width = dataset.block_shapes[indexes[0] - 1]
+    block_rows = range(row_start // block_height, -(-row_stop // block_height))
+    block_cols = range(col_start // block_width, -(-col_stop // block_width))
+    extents = {}
+
+    def scan(lines, blocks, item, reduce):
+        """Find the first line of blocks with valid pixels."""
+        for line in lines:
+            found = []
+            for ij in blocks(line):
+                if ij not in extents:
+                    extents[ij] = _block_data_extent(dataset, indexes, *ij)
+                if extents[ij] is not None:
+                    found.append(extents[ij][item])
+            if found:
+                return line, reduce(found)
+        return None, None
+
+    top_row, top = scan(block_rows, lambda i: ((i, j) for j in block_cols), 0, min)
+    if top_row is None:
+        return Window(0, 0, 0, 0)
+    bottom_row, bottom = scan(
+        reversed(range(top_row, block_rows.stop)),
+        lambda i: ((i, j) for j in block_cols),
+        1,
+        max,
+    )
+    valid_rows = range(top_row, bottom_row + 1)
+    left_col, left = scan(block_cols, lambda j: ((i, j) for i in valid_rows), 2, min)
+    _, right = scan(
+        reversed(range(left_col, block_cols.stop)),
+        lambda j: ((i, j) for i in valid_rows),
+        3,
+        max,
+    )
+    return Window.from_slices((top, bottom), (left, right))
+
+
+def _block_data_extent(dataset, indexes, i, j):
+    """Get the extent of a block's valid pixels.
+
+    Returns
+    -------
+    tuple or None
+        Start and stop rows and cols of valid pixels, or None if the
+        block has none.
+    """
+    window = dataset.block_window(indexes[0], i, j)
+    if all(dataset._window_is_empty(bidx, window) for bidx in indexes):
+        return None
+    mask = dataset.read_masks(indexes, window=window).any(axis=0)
+    rows = np.flatnonzero(mask.any(axis=1))
+    if not rows.size:
+        return None
+    cols = np.flatnonzero(mask.any(axis=0))
+    return (
+        window.row_off + int(rows[0]),
+        window.row_off + int(rows[-1]) + 1,
+        window.col_off + int(cols[0]),
+        window.col_off + int(cols[-1]) + 1,
+    )
+
+
 def _compute_union(w1, w2):
     """Compute the union of two windows"""
     col_off = min(w1.col_off, w2.col_off)
@@ -837,3 +963,504 @@ def subdivide(window, height, width):
         row_off += height
         col_off = window.col_off
     return subwindows
+
+
+_WINDOW_FIELDS = ("col_off", "row_off", "width", "height")
+
+
+class WindowArray:
+    """A compact array of windows.
+
+    Windows are stored in a numpy structured array with col_off,
+    row_off, width, and height fields, each of int64 or float64 data
+    type like the int or float values of a Window, and the methods of a WindowArray operate on all of its windows
+    at once. Indexing with an integer and iteration create Window
+    objects lazily.
+
+    Parameters
+    ----------
+    col_off, row_off, width, height : array_like
+        Window offsets and lengths, broadcast to a common 1-D shape.
+
+    Raises
+    ------
+    ValueError
+        If a width or height is negative.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, col_off, row_off, width, height):
+        arrays = [
+            np.ravel(arr)
+            for arr in np.broadcast_arrays(
+                *(np.atleast_1d(val) for val in (col_off, row_off, width, height))
+            )
+        ]
+        dtypes = []
+        for arr in arrays:
+            if arr.dtype.kind in "biu":
+                dtypes.append(np.dtype("int64"))
+            elif arr.dtype.kind == "f":
+                dtypes.append(np.dtype("float64"))
+            else:
+                raise WindowError("Window offsets and lengths must be numbers")
+        if (arrays[2] < 0).any() or (arrays[3] < 0).any():
+            raise ValueError("Number of columns or rows must be non-negative")
+
+        data = np.empty(arrays[0].size, dtype=list(zip(_WINDOW_FIELDS, dtypes)))
+        for name, arr in zip(_WINDOW_FIELDS, arrays):
+            data[name] = arr
+        self._data = data
+
+    @classmethod
+    def _from_data(cls, data):
+        windows = cls.__new__(cls)
+        windows._data = data
+        return windows
+
+    @classmethod
+    def from_windows(cls, windows):
+        """Construct a WindowArray from a sequence of Windows.
+
+        Parameters
+        ----------
+        windows : iterable of Window
+
+        Returns
+        -------
+        WindowArray
+        """
+        flat = np.array([window.flatten() for window in windows]).reshape(-1, 4)
+        return cls(*flat.T)
+
+    @classmethod
+    def from_records(cls, records):
+        """Construct a WindowArray from a structured array.
+
+        Parameters
+        ----------
+        records : numpy.ndarray
+            An array with col_off, row_off, width, and height fields.
+
+        Returns
+        -------
+        WindowArray
+        """
+        return cls(*(records[name] for name in _WINDOW_FIELDS))
+
+    @classmethod
+    def from_bounds(cls, left, bottom, right, top, transform):
+        """Get the windows corresponding to arrays of bounding coordinates.
+
+        This is the vectorized equivalent of from_bounds().
+
+        Parameters
+        ----------
+        left, bottom, right, top : array_like
+            Bounding coordinates.
+        transform : Affine
+            Affine transform matrix.
+
+        Returns
+        -------
+        WindowArray
+
+        Raises
+        ------
+        WindowError
+            If any window can't be calculated.
+        """
+        if not isinstance(transform, Affine):
+            raise WindowError("A transform object is required to calculate the window")
+        left, bottom, right, top = np.broadcast_arrays(
+            *(
+                np.atleast_1d(np.asarray(val, dtype="float64"))
+                for val in (left, bottom, right, top)
+            )
+        )
+        if ((right - left) / transform.a < 0).any():
+            raise WindowError("Bounds and transform are inconsistent")
+        if ((bottom - top) / transform.e < 0).any():
+            raise WindowError("Bounds and transform are inconsistent")
+
+        rows, cols = rowcol(
+            transform,
+            np.concatenate([left, right, right, left], axis=None),
+            np.concatenate([top, top, bottom, bottom], axis=None),
+            op=float,
+        )
+        rows = rows.reshape(4, -1)
+        cols = cols.reshape(4, -1)
+        row_start = rows.min(axis=0)
+        col_start = cols.min(axis=0)
+        return cls(
+            col_start,
+            row_start,
+            np.maximum(cols.max(axis=0) - col_start, 0.0),
+            np.maximum(rows.max(axis=0) - row_start, 0.0),
+        )
+
+    @classmethod
+    def subdivide(cls, window, height, width):
+        """Divide a window into smaller windows.
+
+        This is the vectorized equivalent of subdivide() and gives the
+        same windows in the same, row-major, order.
+
+        Parameters
+        ----------
+        window : Window
+            Source window to subdivide.
+        height, width : int
+            Subwindow height and width.
+
+        Returns
+        -------
+        WindowArray
+        """
+        row_stop = window.row_off + window.height
+        col_stop = window.col_off + window.width
+        row_offs = window.row_off + height * np.arange(
+            math.ceil(window.height / height)
+        )
+        col_offs = window.col_off + width * np.arange(math.ceil(window.width / width))
+        row_offs, col_offs = np.meshgrid(row_offs, col_offs, indexing="ij")
+        return cls(
+            col_offs,
+            row_offs,
+            np.minimum(width, col_stop - col_offs),
+            np.minimum(height, row_stop - row_offs),
+        )
+
+    @property
+    def data(self):
+        """The structured array of windows."""
+        return self._data
+
+    @property
+    def col_off(self):
+        return self._data["col_off"]
+
+    @property
+    def row_off(self):
+        return self._data["row_off"]
+
+    @property
+    def width(self):
+        return self._data["width"]
+
+    @property
+    def height(self):
+        return self._data["height"]
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return Window(*self._data[key].tolist())
+        return self._from_data(np.atleast_1d(self._data[key]))
+
+    def __iter__(self):
+        for start in range(0, len(self._data), 4096):
+            for values in self._data[start : start + 4096].tolist():
+                yield Window(*values)
+
+    def __repr__(self):
+        return "<WindowArray of {} windows>".format(len(self))
+
+    def flatten(self):
+        """A flattened form of the windows.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of shape (n, 4) of window offsets and lengths.
+        """
+        return np.stack([self._data[name] for name in _WINDOW_FIELDS], axis=1)
+
+    def tolist(self):
+        """A list of Windows."""
+        return list(self)
+
+    def intersects(self, other):
+        """Test which windows intersect another.
+
+        Parameters
+        ----------
+        other : Window or WindowArray
+            A window, or an array of windows of the same length.
+
+        Returns
+        -------
+        numpy.ndarray
+            A boolean array.
+        """
+        _, _, width, height = _compute_array_intersection(self, other)
+        return (width > 0) & (height > 0)
+
+    def intersection(self, other):
+        """Intersect windows with another.
+
+        Unlike Window.intersection(), windows that do not intersect do not
+        raise WindowError but result in windows with zero lengths. Use
+        intersects() to find them.
+
+        Parameters
+        ----------
+        other : Window or WindowArray
+            A window, or an array of windows of the same length.
+
+        Returns
+        -------
+        WindowArray
+        """
+        col_off, row_off, width, height = _compute_array_intersection(self, other)
+        return WindowArray(
+            col_off, row_off, np.maximum(width, 0), np.maximum(height, 0)
+        )
+
+    def union(self, other=None):
+        """Union windows with another.
+
+        Parameters
+        ----------
+        other : Window or WindowArray, optional
+            A window, or an array of windows of the same length. If
+            None, the union of all windows in this array is computed.
+
+        Returns
+        -------
+        WindowArray or Window
+            A Window if other is None.
+        """
+        if other is None:
+            col_off = self.col_off.min()
+            row_off = self.row_off.min()
+            width = (self.col_off + self.width).max() - col_off
+            height = (self.row_off + self.height).max() - row_off
+            return Window(*np.array([col_off, row_off, width, height]).tolist())
+        col_off = np.minimum(self.col_off, other.col_off)
+        row_off = np.minimum(self.row_off, other.row_off)
+        width = (
+            np.maximum(self.col_off + self.width, other.col_off + other.width) - col_off
+        )
+        height = (
+            np.maximum(self.row_off + self.height, other.row_off + other.height)
+            - row_off
+        )
+        return WindowArray(col_off, row_off, width, height)
+
+    def crop(self, height, width):
+        """Crop windows to a given height and width.
+
+        Parameters
+        ----------
+        height, width : int
+            The number of rows and cols of the raster.
+
+        Returns
+        -------
+        WindowArray
+        """
+        row_start = np.clip(self.row_off, 0, height)
+        col_start = np.clip(self.col_off, 0, width)
+        row_stop = np.clip(self.row_off + self.height, 0, height)
+        col_stop = np.clip(self.col_off + self.width, 0, width)
+        return WindowArray(
+            col_start, row_start, col_stop - col_start, row_stop - row_start
+        )
+
+    def bounds(self, transform):
+        """Get the spatial bounds of windows.
+
+        Parameters
+        ----------
+        transform : Affine
+            An affine transform matrix.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of shape (n, 4) of left, bottom, right, top bounds.
+        """
+        col_min = self.col_off
+        row_min = self.row_off
+        col_max = col_min + self.width
+        row_max = row_min + self.height
+        a, b, c, d, e, f = tuple(transform)[:6]
+        return np.stack(
+            [
+                a * col_min + b * row_max + c,
+                d * col_min + e * row_max + f,
+                a * col_max + b * row_min + c,
+                d * col_max + e * row_min + f,
+            ],
+            axis=1,
+        )
+
+    def transform(self, transform):
+        """Construct affine transform matrices relative to windows.
+
+        Parameters
+        ----------
+        transform : Affine
+            An affine transform matrix.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of shape (n, 6) of the a, b, c, d, e, f coefficients
+            of the windows' transforms, from which Affine objects can be
+            constructed.
+        """
+        a, b, c, d, e, f = tuple(transform)[:6]
+        coeffs = np.empty((len(self), 6))
+        coeffs[:] = (a, b, c, d, e, f)
+        coeffs[:, 2] += a * self.col_off + b * self.row_off
+        coeffs[:, 5] += d * self.col_off + e * self.row_off
+        return coeffs
+
+    def round_lengths(self):
+        """Return a copy with widths and heights rounded.
+
+        Lengths are rounded to the nearest whole number. The offsets are
+        not changed.
+
+        Returns
+        -------
+        WindowArray
+        """
+        return WindowArray(
+            self.col_off,
+            self.row_off,
+            np.floor(self.width + 0.5).astype("int64"),
+            np.floor(self.height + 0.5).astype("int64"),
+        )
+
+    def round_offsets(self):
+        """Return a copy with column and row offsets rounded.
+
+        Offsets are rounded to the preceding whole number. The lengths
+        are not changed.
+
+        Returns
+        -------
+        WindowArray
+        """
+        return WindowArray(
+            np.floor(self.col_off + 0.1).astype("int64"),
+            np.floor(self.row_off + 0.1).astype("int64"),
+            self.width,
+            self.height,
+        )
+
+    def round(self, ndigits=None):
+        """Round offsets and lengths.
+
+        Parameters
+        ----------
+        ndigits : int, optional
+            Number of decimal places. If None, the default, offsets and
+            lengths are rounded to integers, as by round().
+
+        Returns
+        -------
+        WindowArray
+        """
+        if ndigits is None:
+            return WindowArray(
+                *(np.round(self._data[name]).astype("int64") for name in _WINDOW_FIELDS)
+            )
+        return WindowArray(
+            *(np.round(self._data[name], ndigits) for name in _WINDOW_FIELDS)
+        )
+
+    def round_to_full_blocks(self, block_shape):
+        """Round windows to include the full expanse of intersecting blocks.
+
+        This is the vectorized equivalent of
+        round_window_to_full_blocks().
+
+        Parameters
+        ----------
+        block_shape : tuple
+            The (height, width) of the raster's blocks.
+
+        Returns
+        -------
+        WindowArray
+        """
+        block_height, block_width = block_shape
+        row_min = (self.row_off // block_height) * block_height
+        col_min = (self.col_off // block_width) * block_width
+        row_max = -(-(self.row_off + self.height) // block_height) * block_height
+        col_max = -(-(self.col_off + self.width) // block_width) * block_width
+        return WindowArray(col_min, row_min, col_max - col_min, row_max - row_min)
+
+
+def _block_grid(height, width, block_shape, window=None):
+    """Get the blocks of a raster that intersect a window.
+
+    Parameters
+    ----------
+    height, width : int
+        The size of the raster.
+    block_shape : tuple
+        The (height, width) of its blocks.
+    window : Window, optional
+        Only blocks that intersect this window are returned.
+
+    Returns
+    -------
+    blocks : numpy.ndarray
+        An int64 array of shape (n, 2) of block (row, col) indexes.
+    windows : WindowArray
+        The windows of the blocks.
+    """
+    block_height, block_width = block_shape
+    row_start = col_start = 0
+    row_stop = -(-height // block_height)
+    col_stop = -(-width // block_width)
+
+    if window is not None:
+        if window.width > 0 and window.height > 0:
+            (r0, r1), (c0, c1) = window.toranges()
+            row_start = max(row_start, math.floor(r0 / block_height))
+            row_stop = min(row_stop, math.ceil(r1 / block_height))
+            col_start = max(col_start, math.floor(c0 / block_width))
+            col_stop = min(col_stop, math.ceil(c1 / block_width))
+        else:
+            row_stop = col_stop = 0
+
+    rows, cols = np.meshgrid(
+        np.arange(row_start, max(row_start, row_stop), dtype="int64"),
+        np.arange(col_start, max(col_start, col_stop), dtype="int64"),
+        indexing="ij",
+    )
+    rows = rows.ravel()
+    cols = cols.ravel()
+    row_offs = rows * block_height
+    col_offs = cols * block_width
+    return np.stack([rows, cols], axis=1), WindowArray(
+        col_offs,
+        row_offs,
+        np.minimum(block_width, width - col_offs),
+        np.minimum(block_height, height - row_offs),
+    )
+
+
+def _compute_array_intersection(windows, other):
+    """Compute the intersection of arrays of windows"""
+    col_off = np.maximum(windows.col_off, other.col_off)
+    row_off = np.maximum(windows.row_off, other.row_off)
+    width = (
+        np.minimum(windows.col_off + windows.width, other.col_off + other.width)
+        - col_off
+    )
+    height = (
+        np.minimum(windows.row_off + windows.height, other.row_off + other.height)
+        - row_off
+    )
+    return col_off, row_off, width, height
@@ -161,6 +161,43 @@ def test_block_windows_filtered_none(path_rgb_byte_tif):
             next(itr)
 
 
+def test_block_grid(path_rgb_byte_tif):
+    """Block grids match block windows"""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        blocks, block_windows = src.block_grid()
+        assert [tuple(ij) for ij in blocks.tolist()] == [
+            ij for ij, win in src.block_windows()
+        ]
+        assert block_windows.tolist() == [win for ij, win in src.block_windows()]
+
+
+def test_block_grid_window(path_rgb_byte_tif):
+    """Block grids are limited to blocks intersecting a window"""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        focus_window = windows.Window(10, 4, 20, 5)
+        blocks, block_windows = src.block_grid(window=focus_window)
+        expected = [
+            (ij, win)
+            for ij, win in src.block_windows()
+            if windows.intersect(focus_window, win)
+        ]
+        assert [tuple(ij) for ij in blocks.tolist()] == [ij for ij, win in expected]
+        assert block_windows.tolist() == [win for ij, win in expected]
+
+
+def test_block_grid_bounds(path_rgb_byte_tif):
+    """Block grids are limited to blocks intersecting bounds"""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        w, s, e, n = src.bounds
+        blocks, block_windows = src.block_grid(bounds=(w, n - 1.0, w + 1.0, n))
+        assert blocks.tolist() == [[0, 0]]
+        assert block_windows[0] == windows.Window.from_slices((0, 3), (0, 791))
+        blocks, block_windows = src.block_grid(
+            bounds=(w - 100.0, n + 1.0, w - 1.0, n + 100.0)
+        )
+        assert len(blocks) == len(block_windows) == 0
+
+
 def test_block_size_tiff(path_rgb_byte_tif):
     """Without compression a TIFF's blocks are all the same size"""
     with rasterio.open(path_rgb_byte_tif) as src:
@@ -10,6 +10,7 @@ import pytest
 
 import rasterio
 from rasterio._base import _can_create_osr
+from rasterio import crs as crs_module
 from rasterio.crs import CRS, epsg_treats_as_latlong, epsg_treats_as_northingeasting
 from rasterio.enums import WktVersion
 from rasterio.env import env_ctx_if_needed, Env
@@ -764,3 +765,125 @@ def test_is_epsg_code():
     )
     assert crs.to_epsg() == 2154
     assert crs.is_epsg_code
+
+
+@pytest.fixture
+def crs_cache():
+    """Enable the CRS intern cache for a test."""
+    crs_module.clear_cache()
+    crs_module.set_cache_size(4)
+    yield
+    crs_module.set_cache_size(0)
+    crs_module.clear_cache()
+
+
+def test_crs_cache_disabled():
+    """By default CRS are not interned."""
+    assert crs_module.cache_info().maxsize == 0
+    assert CRS.from_epsg(4326) is not CRS.from_epsg(4326)
+
+
+def test_crs_cache(crs_cache):
+    """Identical inputs give the same CRS."""
+    crs = CRS.from_epsg(4326)
+    assert CRS.from_epsg("4326") is crs
+    assert CRS.from_string("EPSG:4326") is crs
+    assert CRS.from_user_input(4326) is crs
+    assert CRS.from_wkt(crs.wkt) is CRS.from_wkt(crs.wkt)
+    assert CRS.from_string("OGC:CRS84") is CRS.from_string("OGC:CRS84")
+    assert CRS.from_proj4("+proj=longlat") is CRS.from_proj4("+proj=longlat")
+    info = crs_module.cache_info()
+    assert info.hits == 6
+    assert info.misses == 4
+    assert info.currsize == 4
+
+
+def test_crs_cache_bounded(crs_cache):
+    """The least recently used CRS are evicted."""
+    crs = CRS.from_epsg(4326)
+    for code in (3857, 32618, 32619, 32620):
+        CRS.from_epsg(code)
+    assert crs_module.cache_info().currsize == 4
+    assert CRS.from_epsg(4326) is not crs
+
+
+def test_crs_cache_errors(crs_cache):
+    """Invalid inputs are not cached."""
+    with pytest.raises(CRSError):
+        CRS.from_epsg(999999)
+    assert crs_module.cache_info().currsize == 0
+
+
+def test_crs_cache_clear(crs_cache):
+    """Clearing the cache resets its statistics."""
+    CRS.from_epsg(4326)
+    CRS.from_epsg(4326)
+    crs_module.clear_cache()
+    assert crs_module.cache_info() == (0, 0, 4, 0)
+
+
+def test_crs_cache_dataset(crs_cache, path_rgb_byte_tif):
+    """Datasets share interned CRS."""
+    with (
+        rasterio.open(path_rgb_byte_tif) as src1,
+        rasterio.open(path_rgb_byte_tif) as src2,
+    ):
+        assert src1.crs is src2.crs
+
+
+def test_crs_equals_cached():
+    """Equality of CRS is computed once."""
+    wkt = CRS.from_epsg(32618).to_wkt()
+    assert CRS.from_wkt(wkt) == CRS.from_epsg(32618)
+    hits = crs_module._equals_cache.info().hits
+    assert CRS.from_wkt(wkt) == CRS.from_epsg(32618)
+    assert crs_module._equals_cache.info().hits == hits + 1
+    assert CRS.from_wkt(wkt) != CRS.from_epsg(32619)
+
+
+def test_crs_matches_cached():
+    """Authority matches of CRS are searched once."""
+    wkt = CRS.from_epsg(32618).to_wkt()
+    crs = CRS.from_wkt(wkt)
+    assert crs.to_epsg() == 32618
+    hits = crs_module._matches_cache.info().hits
+    assert crs.to_epsg() == 32618
+    assert crs_module._matches_cache.info().hits == hits
+    assert CRS.from_wkt(wkt).to_authority() == ("EPSG", "32618")
+    assert crs_module._matches_cache.info().hits == hits + 1
+
+
+def test_pickle_compact():
+    """CRS made from EPSG codes are pickled as codes."""
+    crs = CRS.from_epsg(32618)
+    assert len(pickle.dumps(crs)) < 100
+    assert pickle.loads(pickle.dumps(crs)).to_epsg() == 32618
+
+
+def test_pickle_projjson():
+    """Other CRS are pickled as PROJ JSON."""
+    crs = CRS.from_proj4("+proj=stere +lat_0=-90 +lat_ts=-70 +ellps=WGS84")
+    assert b"PROJJSON" in pickle.dumps(crs)
+    assert pickle.loads(pickle.dumps(crs)) == crs
+
+
+def test_unpickle_interned():
+    """Unpickling a CRS twice parses it once."""
+    data = pickle.dumps(CRS.from_wkt(CRS.from_epsg(32618).to_wkt()))
+    assert pickle.loads(data) is pickle.loads(data)
+
+
+def test_unpickle_wkt_state():
+    """Pickles with WKT state can still be loaded."""
+    crs = CRS.__new__(CRS)
+    crs.__setstate__(CRS.from_epsg(32618).to_wkt())
+    assert crs.to_epsg() == 32618
+
+
+def test_crs_copy_is_new():
+    """Copies of CRS are new objects."""
+    crs = CRS.from_epsg(32618)
+    crs2 = copy.copy(crs)
+    assert crs2 is not crs
+    assert crs2 == crs
+    assert repr(crs2) == "CRS.from_epsg(32618)"
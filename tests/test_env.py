@@ -1170,3 +1170,121 @@ def test_open_file_expired_aws_credentials(monkeypatch, caplog, path_rgb_byte_ti
         with rasterio.env.Env():
             with rasterio.open(path_rgb_byte_tif) as dataset:
                 assert not dataset.closed
+
+
+@pytest.fixture
+def persistent_env():
+    """Leave persistent environment mode after a test"""
+    yield rasterio.env.set_persistent_env
+    rasterio.env.clear_persistent_env()
+
+
+def test_persistent_env(persistent_env, path_rgb_byte_tif):
+    """A persistent environment outlives rasterio.open() calls"""
+    persistent_env(CPL_DEBUG=True)
+    env = rasterio.env.local._env
+    assert env is not None
+    assert getenv()["CPL_DEBUG"] is True
+    assert getenv()["RASTERIO_ENV"] is True
+
+    with rasterio.open(path_rgb_byte_tif) as dataset:
+        assert rasterio.env.local._env is env
+        assert dataset.count == 3
+
+    assert rasterio.env.local._env is env
+    assert getenv()["CPL_DEBUG"] is True
+
+
+def test_persistent_env_nested_reuse(persistent_env):
+    """Entering an Env with options already in effect reuses the env"""
+    persistent_env(CPL_DEBUG=True)
+    env = rasterio.env.local._env
+
+    with rasterio.Env(CPL_DEBUG=True):
+        assert rasterio.env.local._env is env
+        with rasterio.Env():
+            assert rasterio.env.local._env is env
+
+    assert rasterio.env.local._env is env
+    assert rasterio.env.local._depth == 0
+
+
+def test_persistent_env_nested_options(persistent_env):
+    """Other options are restored when a nested Env exits"""
+    persistent_env(CPL_DEBUG=True)
+
+    with rasterio.Env(CPL_DEBUG=False, CHECK_WITH_INVERT_PROJ=True):
+        assert getenv()["CPL_DEBUG"] is False
+        assert get_gdal_config("CHECK_WITH_INVERT_PROJ") is True
+
+    assert getenv()["CPL_DEBUG"] is True
+    assert "CHECK_WITH_INVERT_PROJ" not in getenv()
+    assert get_gdal_config("CHECK_WITH_INVERT_PROJ") is None
+
+
+def test_reused_env_changed_options(persistent_env):
+    """Options set within a reused Env are undone when it exits"""
+    persistent_env()
+
+    with rasterio.Env():
+        setenv(CPL_DEBUG=True)
+        assert getenv()["CPL_DEBUG"] is True
+
+    assert "CPL_DEBUG" not in getenv()
+    assert get_gdal_config("CPL_DEBUG") is None
+
+
+def test_persistent_env_replace(persistent_env):
+    """Setting persistent options again restarts the env"""
+    persistent_env(CPL_DEBUG=True)
+    persistent_env(CHECK_WITH_INVERT_PROJ=True)
+    assert "CPL_DEBUG" not in getenv()
+    assert get_gdal_config("CPL_DEBUG") is None
+    assert getenv()["CHECK_WITH_INVERT_PROJ"] is True
+
+
+def test_clear_persistent_env():
+    """Clearing the mode stops the env and reinstates discovered options"""
+    try:
+        set_gdal_config("CPL_DEBUG", "ON")
+        rasterio.env.set_persistent_env(CPL_DEBUG=False)
+        assert get_gdal_config("CPL_DEBUG") is False
+        rasterio.env.clear_persistent_env()
+        assert rasterio.env.local._env is None
+        assert get_gdal_config("CPL_DEBUG") is True
+    finally:
+        rasterio.env.clear_persistent_env()
+        del_gdal_config("CPL_DEBUG")
+
+
+def test_clear_persistent_env_in_context(persistent_env):
+    """Clearing within an Env takes effect once the Env exits"""
+    persistent_env()
+
+    with rasterio.Env(CPL_DEBUG=True):
+        rasterio.env.clear_persistent_env()
+        assert getenv()["CPL_DEBUG"] is True
+
+    assert rasterio.env.local._env is not None
+    assert isinstance(rasterio.env.env_ctx_if_needed(), Env)
+    assert rasterio.env.local._env is None
+
+
+def test_persistent_env_threads(persistent_env):
+    """Each thread gets its own persistent environment"""
+    persistent_env(CPL_DEBUG=True)
+
+    def func():
+        with rasterio.Env(CPL_DEBUG=True):
+            return rasterio.env.local._persistent, getenv()["CPL_DEBUG"]
+
+    with futures.ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(lambda _: func(), range(4)))
+
+    assert results == [(True, True)] * 4
+
+
+def test_persistent_env_aws_creds():
+    """AWS credentials can't be persistent config options"""
+    with pytest.raises(EnvError):
+        rasterio.env.set_persistent_env(AWS_ACCESS_KEY_ID="x")
@@ -8,16 +8,22 @@ import pytest
 from numpy.testing import assert_allclose
 
 import rasterio
+from rasterio._features import _geojson_to_wkb
 from rasterio.enums import MergeAlg
 from rasterio.errors import WindowError, ShapeSkipWarning
 from rasterio.features import (
     bounds,
+    bounds_array,
     geometry_mask,
     geometry_window,
+    geometry_windows,
     is_valid_geom,
     rasterize,
     sieve,
     shapes,
+    shapes_columns,
+    wkb_from_ragged_array,
+    zonal_stats,
 )
 
 from .classes import MockGeoInterface
@@ -509,6 +515,282 @@ def test_rasterize_to_file(tmp_path, geojson_point):
     assert np.array_equal(result, expected)
 
 
+@pytest.mark.parametrize("all_touched", [False, True])
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_rasterize_tiled(tmp_path, all_touched, num_threads):
+    """Tiled rasterization matches rasterization of an array"""
+    transform = Affine.translation(0.0, 256.0) * Affine.scale(1.0, -1.0)
+    shapes = [
+        (
+            {
+                "type": "Polygon",
+                "coordinates": [
+                    [(x, y), (x + 37.5, y), (x + 37.5, y + 21.3), (x, y + 21.3), (x, y)]
+                ],
+            },
+            value,
+        )
+        for value, (x, y) in enumerate(
+            [(3.2, 5.1), (40.0, 40.0), (100.5, 7.7), (200.0, 220.0), (10.0, 150.0)],
+            start=1,
+        )
+    ]
+    shapes.append(
+        (
+            {"type": "LineString", "coordinates": [(0.5, 0.5), (255.5, 255.5)]},
+            9,
+        )
+    )
+    expected = rasterize(
+        shapes,
+        out_shape=(256, 256),
+        transform=transform,
+        all_touched=all_touched,
+        dtype="uint8",
+    )
+
+    dst_kwds = dict(
+        driver="GTiff",
+        count=1,
+        width=256,
+        height=256,
+        dtype="uint8",
+        crs="EPSG:4326",
+        transform=transform,
+        tiled=True,
+        blockxsize=32,
+        blockysize=32,
+    )
+    rasterize(
+        shapes,
+        all_touched=all_touched,
+        dst_path=tmp_path / "test.tif",
+        dst_kwds=dst_kwds,
+        tiled=True,
+        num_threads=num_threads,
+        mem_limit=0.005,
+    )
+
+    with rasterio.open(tmp_path / "test.tif") as dst:
+        assert np.array_equal(dst.read(1), expected)
+
+
+def test_rasterize_tiled_wkb_rotated(tmp_path, monkeypatch):
+    """WKB shapes are indexed by their envelopes, without GeoJSON"""
+    transform = (
+        Affine.rotation(20.0) * Affine.translation(0.0, 128.0) * Affine.scale(1.0, -1.0)
+    )
+    shapes = [
+        (
+            _geojson_to_wkb(
+                {
+                    "type": "Polygon",
+                    "coordinates": [
+                        [
+                            (x, y),
+                            (x + 37.5, y),
+                            (x + 37.5, y + 21.3),
+                            (x, y + 21.3),
+                            (x, y),
+                        ]
+                    ],
+                }
+            ),
+            value,
+        )
+        for value, (x, y) in enumerate(
+            [(3.2, 5.1), (40.0, 40.0), (80.5, 90.7)], start=1
+        )
+    ]
+    expected = rasterize(
+        shapes, out_shape=(128, 128), transform=transform, dtype="uint8"
+    )
+
+    def no_geojson(*args, **kwargs):
+        raise AssertionError("WKB was bounded as GeoJSON")
+
+    monkeypatch.setattr(rasterio.features, "_bounds", no_geojson)
+    dst_kwds = dict(
+        driver="GTiff",
+        count=1,
+        width=128,
+        height=128,
+        dtype="uint8",
+        transform=transform,
+        tiled=True,
+        blockxsize=32,
+        blockysize=32,
+    )
+    rasterize(
+        shapes,
+        dst_path=tmp_path / "test.tif",
+        dst_kwds=dst_kwds,
+        tiled=True,
+        num_threads=2,
+        mem_limit=0.005,
+    )
+
+    with rasterio.open(tmp_path / "test.tif") as dst:
+        assert np.array_equal(dst.read(1), expected)
+
+
+def test_rasterize_tiled_bands(tmp_path, basic_geometry):
+    """Shapes are burned into every band in tiled mode"""
+    dst_kwds = dict(
+        driver="GTiff",
+        count=3,
+        width=DEFAULT_SHAPE[1],
+        height=DEFAULT_SHAPE[0],
+        dtype="uint8",
+        transform=Affine.identity(),
+    )
+    rasterize(
+        [basic_geometry],
+        dst_path=tmp_path / "test.tif",
+        dst_kwds=dst_kwds,
+        tiled=True,
+    )
+    expected = rasterize([basic_geometry], out_shape=DEFAULT_SHAPE)
+
+    with rasterio.open(tmp_path / "test.tif") as dst:
+        for bidx in dst.indexes:
+            assert np.array_equal(dst.read(bidx), expected)
+
+
+def test_rasterize_tiled_requires_dataset(basic_geometry):
+    with pytest.raises(ValueError):
+        rasterize([basic_geometry], out_shape=DEFAULT_SHAPE, tiled=True)
+
+
+def test_rasterize_wkb(basic_geometry, basic_image_2x2):
+    """WKB shapes are rasterized like GeoJSON"""
+    coords = basic_geometry["coordinates"][0]
+    (wkb,) = wkb_from_ragged_array("Polygon", coords, ([0, 5], [0, 1]))
+    assert np.array_equal(rasterize([wkb], out_shape=DEFAULT_SHAPE), basic_image_2x2)
+    assert np.array_equal(
+        rasterize([(wkb, 1)], out_shape=DEFAULT_SHAPE), basic_image_2x2
+    )
+    assert np.array_equal(
+        geometry_mask([wkb], DEFAULT_SHAPE, Affine.identity(), invert=True),
+        basic_image_2x2.astype(bool),
+    )
+
+
+def test_rasterize_shapely_wkb(basic_geometry, basic_image_2x2):
+    shapely = pytest.importorskip("shapely", reason="Test requires shapely.")
+    geom = shapely.geometry.shape(basic_geometry)
+    assert np.array_equal(rasterize([geom], out_shape=DEFAULT_SHAPE), basic_image_2x2)
+
+
+def test_rasterize_invalid_wkb():
+    with pytest.warns(ShapeSkipWarning):
+        rasterize([b"not wkb"], out_shape=DEFAULT_SHAPE)
+    with pytest.raises(ValueError):
+        rasterize([b"not wkb"], out_shape=DEFAULT_SHAPE, skip_invalid=False)
+
+
+@pytest.mark.parametrize(
+    "geometry_type,coords,offsets,geojson",
+    [
+        (
+            "Point",
+            [(1.0, 2.0), (3.0, 4.0)],
+            (),
+            {"type": "Point", "coordinates": (3.0, 4.0)},
+        ),
+        (
+            "LineString",
+            [(0.0, 0.0), (1.0, 1.0), (2.0, 0.0)],
+            ([0, 3],),
+            {"type": "LineString", "coordinates": [(0.0, 0.0), (1.0, 1.0), (2.0, 0.0)]},
+        ),
+        (
+            "Polygon",
+            [(0, 0), (0, 4), (4, 4), (0, 0), (1, 2), (1, 3), (2, 3), (1, 2)],
+            ([0, 4, 8], [0, 2]),
+            {
+                "type": "Polygon",
+                "coordinates": [
+                    [(0.0, 0.0), (0.0, 4.0), (4.0, 4.0), (0.0, 0.0)],
+                    [(1.0, 2.0), (1.0, 3.0), (2.0, 3.0), (1.0, 2.0)],
+                ],
+            },
+        ),
+        (
+            "MultiPoint",
+            [(1.0, 2.0, 5.0), (3.0, 4.0, 6.0)],
+            ([0, 2],),
+            {"type": "MultiPoint", "coordinates": [(1.0, 2.0, 5.0), (3.0, 4.0, 6.0)]},
+        ),
+        (
+            "MultiLineString",
+            [(0, 0), (1, 1), (5, 5), (6, 7)],
+            ([0, 2, 4], [0, 0, 2]),
+            {
+                "type": "MultiLineString",
+                "coordinates": [[(0.0, 0.0), (1.0, 1.0)], [(5.0, 5.0), (6.0, 7.0)]],
+            },
+        ),
+        (
+            "MultiPolygon",
+            [(0, 0), (0, 1), (1, 1), (0, 0), (2, 2), (2, 3), (3, 3), (2, 2)],
+            ([0, 4, 8], [0, 1, 2], [0, 2]),
+            {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [[(0.0, 0.0), (0.0, 1.0), (1.0, 1.0), (0.0, 0.0)]],
+                    [[(2.0, 2.0), (2.0, 3.0), (3.0, 3.0), (2.0, 2.0)]],
+                ],
+            },
+        ),
+    ],
+)
+def test_wkb_from_ragged_array(geometry_type, coords, offsets, geojson):
+    """WKB from ragged arrays matches the equivalent GeoJSON"""
+    *_, wkb = wkb_from_ragged_array(geometry_type, coords, offsets)
+    assert bounds(wkb) == bounds(geojson)
+    for transform in (
+        Affine.translation(10, 10) * Affine.scale(2, -2),
+        Affine.rotation(30.0) * Affine.scale(2, -2),
+        Affine(0, 1, 100, -1, 0, 200),
+    ):
+        assert bounds(wkb, transform=transform) == pytest.approx(
+            bounds(geojson, transform=transform)
+        )
+        assert tuple(bounds_array([wkb], transform=transform)[0]) == pytest.approx(
+            bounds(geojson, transform=transform)
+        )
+
+
+def test_wkb_from_ragged_array_shapely():
+    shapely = pytest.importorskip("shapely", reason="Test requires shapely.")
+    geoms = shapely.box(np.arange(5), 0, np.arange(5) + 0.5, 1)
+    wkbs = list(wkb_from_ragged_array(*shapely.to_ragged_array(geoms)))
+    assert len(wkbs) == 5
+    assert all(shapely.from_wkb(wkbs).equals(geoms))
+
+
+def test_wkb_from_ragged_array_invalid_type():
+    with pytest.raises(ValueError):
+        list(wkb_from_ragged_array("Circle", [(0, 0)]))
+
+
+@pytest.mark.parametrize(
+    "geometry_type,offsets",
+    [
+        ("LineString", ()),
+        ("LineString", ([0, 4],)),
+        ("LineString", ([2, 1],)),
+        ("Polygon", ([0, 3], [0, 2])),
+        ("Polygon", ([0, 3], [-1, 1])),
+    ],
+)
+def test_wkb_from_ragged_array_invalid_offsets(geometry_type, offsets):
+    """Offsets beyond the coordinates or parts are rejected"""
+    with pytest.raises(ValueError):
+        list(wkb_from_ragged_array(geometry_type, [(0, 0), (1, 1), (0, 0)], offsets))
+
+
 def test_rasterize_point_dtype_int(geojson_point):
     """Demonstrate fix of #3043."""
     expected = np.zeros(shape=DEFAULT_SHAPE, dtype=int)
@@ -989,6 +1271,149 @@ def test_shapes_band(pixelated_image, pixelated_image_file):
         assert truth[0] == list(shapes(band, mask=band))[0]
 
 
+@pytest.mark.parametrize("connectivity", [4, 8])
+@pytest.mark.parametrize("window_height", [1, 7, 64, 1000])
+def test_shapes_windowed(tmp_path, path_rgb_byte_tif, connectivity, window_height):
+    """Shapes of a band polygonized in windows match shapes of an array."""
+    shapely = pytest.importorskip("shapely", reason="Test requires shapely.")
+
+    with rasterio.open(path_rgb_byte_tif) as src:
+        profile = src.profile
+        data = src.read(1, window=((0, 100), (0, 120))) // 64
+
+    profile.update(count=1, width=120, height=100, nodata=None)
+    with rasterio.open(tmp_path / "classes.tif", "w", **profile) as dst:
+        dst.write(data, 1)
+
+    def normalized(results):
+        return sorted(
+            (value, shapely.geometry.shape(geom).normalize().wkt)
+            for geom, value in results
+        )
+
+    with rasterio.open(tmp_path / "classes.tif") as src:
+        band = rasterio.band(src, 1)
+        truth = normalized(shapes(band, connectivity=connectivity))
+        result = normalized(
+            shapes(band, connectivity=connectivity, window_height=window_height)
+        )
+
+    assert result == truth
+
+
+@pytest.mark.parametrize("connectivity", [4, 8])
+@pytest.mark.parametrize("window_height", [1, 3, 16])
+def test_shapes_windowed_reads(connectivity, window_height):
+    """Each window is read once, even when a region spans all of them."""
+    shapely = pytest.importorskip("shapely", reason="Test requires shapely.")
+    from rasterio.features import _shapes_windowed
+
+    image = np.zeros((40, 30), dtype="uint8")
+    image[:, :2] = 1
+    image[::4] = 1
+    image[2::4, 10:20] = 2
+    image[20:25, 24:29] = 1
+    image[22, 26] = 3
+    transform = Affine(2.0, 0.0, 100.0, 0.0, -2.0, 200.0)
+    reads = []
+
+    def read(window):
+        reads.append(window)
+        return image[window.toslices()], None
+
+    def normalized(results):
+        return sorted(
+            (value, shapely.geometry.shape(geom).normalize().wkt)
+            for geom, value in results
+        )
+
+    truth = normalized(shapes(image, connectivity=connectivity, transform=transform))
+    result = normalized(
+        _shapes_windowed(read, 30, 40, transform, connectivity, window_height)
+    )
+    assert result == truth
+    assert [window.row_off for window in reads] == list(range(0, 40, window_height))
+    assert sum(window.height for window in reads) == 40
+
+
+def test_shapes_windowed_mask(pixelated_image, pixelated_image_file):
+    """A mask is applied to each window."""
+    with rasterio.open(pixelated_image_file) as src:
+        band = rasterio.band(src, 1)
+        truth = sorted(
+            (bounds(geom), value)
+            for geom, value in shapes(band, mask=pixelated_image > 0)
+        )
+        result = sorted(
+            (bounds(geom), value)
+            for geom, value in shapes(band, mask=pixelated_image > 0, window_height=3)
+        )
+        assert len(result) == 3
+        assert result == truth
+
+
+def test_shapes_windowed_ndarray(basic_image):
+    """Arrays can not be polygonized in windows."""
+    with pytest.raises(ValueError):
+        next(shapes(basic_image, window_height=2))
+
+
+def test_shapes_wkb(basic_image):
+    """WKB shapes are the same as GeoJSON shapes."""
+    shapely = pytest.importorskip("shapely", reason="Test requires shapely.")
+    transform = Affine(1.0, 0.0, 10.0, 0.0, -1.0, 20.0)
+    truth = list(shapes(basic_image, transform=transform))
+    result = list(shapes(basic_image, transform=transform, format="wkb"))
+    assert len(result) == len(truth) == 2
+    for (geom, value), (expected, expected_value) in zip(result, truth):
+        assert isinstance(geom, bytes)
+        assert value == expected_value
+        assert shapely.from_wkb(geom).equals(shapely.geometry.shape(expected))
+
+
+def test_shapes_format_invalid(basic_image):
+    """An invalid format raises an exception."""
+    with pytest.raises(ValueError):
+        next(shapes(basic_image, format="wkt"))
+
+
+@pytest.mark.parametrize("format", ["wkb", "ragged"])
+def test_shapes_columns(basic_image, format):
+    """Columnar shapes are the same as GeoJSON shapes."""
+    shapely = pytest.importorskip("shapely", reason="Test requires shapely.")
+    truth = list(shapes(basic_image))
+    geometries, values = shapes_columns(basic_image, format=format)
+    if format == "wkb":
+        geoms = shapely.from_wkb(geometries)
+    else:
+        coords, offsets = geometries
+        geoms = shapely.from_ragged_array(shapely.GeometryType.POLYGON, coords, offsets)
+    assert len(geoms) == len(values) == len(truth)
+    for geom, value, (expected, expected_value) in zip(geoms, values, truth):
+        assert value == expected_value
+        assert geom.equals(shapely.geometry.shape(expected))
+
+
+def test_shapes_columns_values_dtype(basic_image):
+    """Values of integer images are integers."""
+    _, values = shapes_columns(basic_image, format="ragged")
+    assert values.dtype.kind == "i"
+    _, values = shapes_columns(basic_image.astype("float32"), format="ragged")
+    assert values.dtype.kind == "f"
+
+
+def test_shapes_windowed_wkb(pixelated_image, pixelated_image_file):
+    """WKB shapes can be made in windows."""
+    with rasterio.open(pixelated_image_file) as src:
+        band = rasterio.band(src, 1)
+        truth = sorted((bounds(geom), value) for geom, value in shapes(band))
+        result = sorted(
+            (bounds(geom), value)
+            for geom, value in shapes(band, window_height=3, format="wkb")
+        )
+        assert result == truth
+
+
 def test_shapes_connectivity_rook(diagonal_image):
     """
     Diagonals are not connected, so there will be 1 feature per pixel plus
@@ -1334,6 +1759,183 @@ def test_sieve_dataset(pixelated_image, pixelated_image_file):
         )
 
 
+@pytest.fixture
+def tiled_profile():
+    """Profile of a 32 x 32 dataset of 16 x 16 blocks."""
+    return {
+        "driver": "GTiff",
+        "count": 1,
+        "width": 32,
+        "height": 32,
+        "dtype": "uint8",
+        "tiled": True,
+        "blockxsize": 16,
+        "blockysize": 16,
+    }
+
+
+# Tiles of at most 258 pixels are single blocks.
+TILED_SIEVE_MEM_LIMIT = 258 * 96 / 1.0e6
+
+
+@pytest.mark.parametrize("connectivity", [4, 8])
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_sieve_tiled(tmp_path, tiled_profile, connectivity, num_threads):
+    """A tiled sieve matches a sieve of an array."""
+    rng = np.random.default_rng(3)
+    image = np.kron(rng.integers(1, 5, (8, 8)), np.ones((4, 4))).astype("uint8")
+    # Isolated pixels within blocks, some near the edges of tiles.
+    for row, col in [(1, 1), (14, 13), (17, 18), (29, 14), (5, 21)]:
+        image[row, col] = 9
+    truth = sieve(image, 2, connectivity=connectivity)
+
+    with rasterio.open(tmp_path / "image.tif", "w", **tiled_profile) as dst:
+        dst.write(image, 1)
+
+    with (
+        rasterio.open(tmp_path / "image.tif") as src,
+        rasterio.open(tmp_path / "sieved.tif", "w", **tiled_profile) as dst,
+    ):
+        sieve(
+            rasterio.band(src, 1),
+            2,
+            out=rasterio.band(dst, 1),
+            connectivity=connectivity,
+            tiled=True,
+            num_threads=num_threads,
+            mem_limit=TILED_SIEVE_MEM_LIMIT,
+        )
+
+    with rasterio.open(tmp_path / "sieved.tif") as src:
+        assert np.array_equal(src.read(1), truth)
+
+
+def test_sieve_tiled_regions_across_tiles(tmp_path, tiled_profile):
+    """The sizes of regions crossing tile edges are those of the whole region."""
+    image = np.zeros((32, 32), dtype="uint8")
+    image[11:21, 5] = 1  # 10 pixels, kept.
+    image[14:18, 20] = 2  # 4 pixels, removed.
+    image[15:17, 14:18] = 3  # 8 pixels over 4 tiles, kept.
+
+    with rasterio.open(tmp_path / "image.tif", "w", **tiled_profile) as dst:
+        dst.write(image, 1)
+
+    with rasterio.open(tmp_path / "image.tif", "r+") as dst:
+        sieve(
+            rasterio.band(dst, 1),
+            8,
+            out=rasterio.band(dst, 1),
+            tiled=True,
+            mem_limit=TILED_SIEVE_MEM_LIMIT,
+        )
+
+    with rasterio.open(tmp_path / "image.tif") as src:
+        result = src.read(1)
+
+    expected = image.copy()
+    expected[14:18, 20] = 0
+    assert np.array_equal(result, expected)
+    assert np.array_equal(result, sieve(image, 8))
+
+
+def test_sieve_tiled_mask(tmp_path, tiled_profile):
+    """Masked pixels are not sieved in tiled mode."""
+    image = np.zeros((32, 32), dtype="uint8")
+    image[15:17, 15:17] = 1
+    image[3, 3] = 2
+    mask = np.ones((32, 32), dtype="uint8")
+    mask[3, 3] = 0
+
+    with rasterio.open(tmp_path / "image.tif", "w", **tiled_profile) as dst:
+        dst.write(image, 1)
+    with rasterio.open(tmp_path / "mask.tif", "w", **tiled_profile) as dst:
+        dst.write(mask, 1)
+
+    with (
+        rasterio.open(tmp_path / "image.tif") as src,
+        rasterio.open(tmp_path / "mask.tif") as msk,
+        rasterio.open(tmp_path / "sieved.tif", "w", **tiled_profile) as dst,
+    ):
+        sieve(
+            rasterio.band(src, 1),
+            5,
+            out=rasterio.band(dst, 1),
+            mask=rasterio.band(msk, 1),
+            tiled=True,
+            mem_limit=TILED_SIEVE_MEM_LIMIT,
+        )
+
+    with rasterio.open(tmp_path / "sieved.tif") as src:
+        result = src.read(1)
+
+    assert result[3, 3] == 2
+    assert not result[15:17, 15:17].any()
+
+
+def test_sieve_tiled_requires_bands(basic_image):
+    """Tiled mode requires source and output bands."""
+    with pytest.raises(ValueError):
+        sieve(basic_image, 2, tiled=True)
+
+
+def test_sieve_tiled_requires_mask_band(tmp_path, tiled_profile):
+    """Tiled mode does not take a mask array."""
+    with rasterio.open(tmp_path / "image.tif", "w", **tiled_profile) as dst:
+        dst.write(np.zeros((32, 32), dtype="uint8"), 1)
+
+    with rasterio.open(tmp_path / "image.tif", "r+") as dst:
+        with pytest.raises(ValueError):
+            sieve(
+                rasterio.band(dst, 1),
+                2,
+                out=rasterio.band(dst, 1),
+                mask=np.ones((32, 32), dtype=bool),
+                tiled=True,
+            )
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("connectivity", [4, 8])
+@pytest.mark.parametrize("size", [2, 5, 12])
+def test_sieve_tiled_random(tmp_path, tiled_profile, seed, connectivity, size):
+    """A tiled sieve of many small regions of many values matches sieve()."""
+    rng = np.random.default_rng(seed)
+    # Noise over patches, and diagonal stripes of one and two pixels,
+    # whose small regions have small largest neighbors, making chains
+    # that cross tiles.
+    image = np.kron(rng.integers(0, 4, (8, 8)), np.ones((4, 4))).astype("uint8")
+    noise = rng.random((32, 32)) < 0.4
+    image[noise] = rng.integers(0, 6, noise.sum())
+    stripes = np.add.outer(np.arange(32), np.arange(32)) // (1 + seed % 2) % 5
+    image[8:24] = stripes[8:24] + 10
+    mask = (rng.random((32, 32)) > 0.1).astype("uint8")
+    truth = sieve(image, size, mask=mask, connectivity=connectivity)
+
+    with rasterio.open(tmp_path / "image.tif", "w", **tiled_profile) as dst:
+        dst.write(image, 1)
+    with rasterio.open(tmp_path / "mask.tif", "w", **tiled_profile) as dst:
+        dst.write(mask, 1)
+
+    with (
+        rasterio.open(tmp_path / "image.tif") as src,
+        rasterio.open(tmp_path / "mask.tif") as msk,
+        rasterio.open(tmp_path / "sieved.tif", "w", **tiled_profile) as dst,
+    ):
+        sieve(
+            rasterio.band(src, 1),
+            size,
+            out=rasterio.band(dst, 1),
+            mask=rasterio.band(msk, 1),
+            connectivity=connectivity,
+            tiled=True,
+            num_threads=2,
+            mem_limit=TILED_SIEVE_MEM_LIMIT,
+        )
+
+    with rasterio.open(tmp_path / "sieved.tif") as src:
+        assert np.array_equal(src.read(1), truth)
+
+
 @pytest.mark.parametrize("size", [2, 9])
 @pytest.mark.parametrize(
     "image",
@@ -1346,3 +1948,209 @@ def test_sieve_3d_size_guard(size, image):
     """Verify fix for gh-3412."""
     sieved = sieve(image, size)
     assert np.all(sieved == 0)
+
+
+@pytest.mark.parametrize("geographic", [True, False])
+def test_dataset_features_wkb(path_rgb_byte_tif, geographic):
+    """Dataset features can have WKB geometries."""
+    from rasterio.features import dataset_features
+
+    with rasterio.open(path_rgb_byte_tif) as src:
+        truth = list(dataset_features(src, bidx=1, as_mask=True, geographic=geographic))
+        result = list(
+            dataset_features(
+                src, bidx=1, as_mask=True, geographic=geographic, format="wkb"
+            )
+        )
+    assert len(result) == len(truth)
+    for feature, expected in zip(result, truth):
+        assert isinstance(feature["geometry"], bytes)
+        assert feature["properties"] == expected["properties"]
+        assert_allclose(feature["bbox"], expected["bbox"])
+
+
+def test_dataset_features_windowed(path_rgb_byte_tif):
+    """Dataset features can be found in windows."""
+    from rasterio.features import dataset_features
+
+    with rasterio.open(path_rgb_byte_tif) as src:
+        truth = sorted(
+            (feature["properties"]["val"], feature["bbox"])
+            for feature in dataset_features(src, bidx=1, as_mask=True)
+        )
+        result = sorted(
+            (feature["properties"]["val"], feature["bbox"])
+            for feature in dataset_features(
+                src, bidx=1, as_mask=True, window_height=100
+            )
+        )
+    assert len(result) == len(truth)
+    for (value, bbox), (expected_value, expected_bbox) in zip(result, truth):
+        assert value == expected_value
+        assert_allclose(bbox, expected_bbox)
+
+
+def _box(left, bottom, right, top):
+    return {
+        "type": "Polygon",
+        "coordinates": [
+            [(left, bottom), (right, bottom), (right, top), (left, top), (left, bottom)]
+        ],
+    }
+
+
+@pytest.mark.parametrize("all_touched", [False, True])
+def test_zonal_stats(path_rgb_byte_tif, all_touched):
+    """Zonal statistics match those of masked reads of each zone."""
+    from rasterio.mask import mask
+
+    with rasterio.open(path_rgb_byte_tif) as src:
+        left, bottom, right, top = src.bounds
+        dx = (right - left) / 10.0
+        dy = (top - bottom) / 10.0
+        zones = [
+            _box(left + dx, bottom + dy, left + 4 * dx, bottom + 5 * dy),
+            # Overlaps the first zone.
+            _box(
+                left + 3.1 * dx, bottom + 2.2 * dy, left + 7.3 * dx, bottom + 6.6 * dy
+            ),
+            _box(
+                left + 5.05 * dx, bottom + 7.05 * dy, left + 9.5 * dx, bottom + 9.5 * dy
+            ),
+            # Beyond the dataset.
+            _box(right + dx, top + dy, right + 2 * dx, top + 2 * dy),
+        ]
+        result = zonal_stats(
+            src,
+            zones,
+            stats=["count", "sum", "min", "max", "mean", "histogram"],
+            all_touched=all_touched,
+            bins=[0, 64, 128, 192, 256],
+            mem_limit=0.5,
+        )
+
+        for i, zone in enumerate(zones[:3]):
+            arr, _ = mask(
+                src,
+                [zone],
+                crop=True,
+                filled=False,
+                indexes=1,
+                all_touched=all_touched,
+            )
+            values = arr.compressed()
+            assert result["count"][i] == values.size
+            assert result["sum"][i] == values.sum()
+            assert result["min"][i] == values.min()
+            assert result["max"][i] == values.max()
+            assert result["mean"][i] == pytest.approx(values.mean())
+            assert np.array_equal(
+                result["histogram"][i],
+                np.histogram(values, bins=[0, 64, 128, 192, 256])[0],
+            )
+
+    assert result["count"][3] == 0
+    assert np.isnan(result["mean"][3])
+
+
+def test_zonal_stats_invalid_stat(path_rgb_byte_tif):
+    """Unknown statistics raise an exception."""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        with pytest.raises(ValueError):
+            zonal_stats(src, [], stats=["median"])
+
+
+def test_zonal_stats_histogram_requires_bins(path_rgb_byte_tif):
+    """Histograms require bins."""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        with pytest.raises(ValueError):
+            zonal_stats(src, [], stats=["histogram"])
+
+
+@pytest.mark.parametrize(
+    "transform",
+    [
+        None,
+        Affine(0.5, 0, 10, 0, -2, 50),
+        Affine(0, 1, 100, -1, 0, 200),
+        Affine.rotation(30.0),
+    ],
+)
+def test_bounds_array(basic_geometry, basic_feature, transform):
+    """Bounds of many geometries match those of each geometry."""
+    point = {"type": "Point", "coordinates": (3.5, -1.0)}
+    geometries = [basic_geometry, basic_feature, point, {"type": "Polygon"}]
+    result = bounds_array(
+        geometries + [_geojson_to_wkb(basic_geometry)], transform=transform
+    )
+    assert result.shape == (5, 4)
+    for i, geom in enumerate(geometries[:3]):
+        assert_allclose(result[i], bounds(geom, transform=transform))
+    assert np.isnan(result[3]).all()
+    assert_allclose(result[4], result[0])
+
+
+@pytest.mark.parametrize(
+    "transform", [None, Affine(0.5, 0, 10, 0, -2, 50), Affine.rotation(30.0)]
+)
+def test_bounds_empty_wkb(transform):
+    """Empty WKB geometries have no bounds, whatever the transform."""
+    empty = bytes.fromhex("010300000000000000")
+    assert np.isnan(bounds_array([empty], transform=transform)).all()
+    with pytest.raises(ValueError):
+        bounds(empty, transform=transform)
+
+
+def test_bounds_array_swapped_axes(basic_geometry):
+    """Transforms rotated by 90 degrees swap the envelope's axes."""
+    transform = Affine(0, 1, 100, -1, 0, 200)
+    result = bounds_array([basic_geometry], transform=transform)
+    assert_allclose(result, [[102, 195.75, 104.25, 198]])
+
+
+def test_bounds_array_coords():
+    """Bounds of ragged coordinate arrays match those of the geometries."""
+    shapely = pytest.importorskip("shapely", reason="Test requires shapely.")
+    polygons = [
+        shapely.box(0, 0, 1, 2),
+        shapely.Polygon([(5, 5), (7, 5), (6, 9)]),
+        shapely.box(-3, -4, -1, -2),
+    ]
+    geometry_type, coords, offsets = shapely.to_ragged_array(polygons)
+    transform = Affine(2, 0, 1, 0, -2, 3)
+    result = bounds_array(coords=coords, offsets=offsets, transform=transform)
+    expected = bounds_array(polygons, transform=transform)
+    assert_allclose(result, expected)
+    assert_allclose(
+        bounds_array(coords=coords, offsets=offsets), shapely.bounds(polygons)
+    )
+
+
+def test_geometry_windows(path_rgb_byte_tif):
+    """Windows of many geometries match those of each geometry."""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        left, bottom, right, top = src.bounds
+        geometries = [
+            {
+                "type": "Polygon",
+                "coordinates": [
+                    [
+                        (left + i * 1000.5, bottom + i * 2000.25),
+                        (left + i * 3000.5, bottom + i * 2000.25),
+                        (left + i * 3000.5, bottom + i * 5000.75),
+                        (left + i * 1000.5, bottom + i * 2000.25),
+                    ]
+                ],
+            }
+            for i in range(1, 20)
+        ]
+        outside = {
+            "type": "Point",
+            "coordinates": (right + 1000.0, top + 1000.0),
+        }
+        result = geometry_windows(src, geometries + [outside], pad_x=0.5, pad_y=0.5)
+        for row, geom in zip(result, geometries):
+            window = geometry_window(src, [geom], pad_x=0.5, pad_y=0.5)
+            assert tuple(row) == window.flatten()
+
+    assert tuple(result[-1][2:]) == (0, 0)
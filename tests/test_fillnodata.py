@@ -1,9 +1,12 @@
 """Tests of nodata filling"""
 
 import numpy as np
+from numpy.testing import assert_allclose
 import pytest
 
-from rasterio.fill import fillnodata
+import rasterio
+from rasterio.fill import _tile_plan, fillnodata
+from rasterio.windows import Window
 
 
 @pytest.fixture(scope="session")
@@ -41,3 +44,88 @@ def test_fillnodata_mask_ones(hole_in_ones):
     mask = np.ones((5, 5))
     result = fillnodata(hole_in_ones, mask)
     assert (hole_in_ones == result).all()
+
+
+@pytest.mark.parametrize("smoothing_iterations", [0, 2])
+@pytest.mark.parametrize("num_threads", [1, 3])
+@pytest.mark.parametrize("tiled", [True, False])
+def test_fillnodata_band(tmp_path, smoothing_iterations, num_threads, tiled):
+    """Filling a band tile by tile matches filling its array."""
+    rows, cols = np.mgrid[0:64, 0:64]
+    image = (rows * 2.0 + np.sin(cols / 5.0) * 10).astype("float32")
+    mask = np.ones((64, 64), dtype="uint8")
+    mask[10:20, 12:30] = 0
+    mask[14:18, 40:60] = 0
+    mask[30:50, 30:34] = 0
+    image[mask == 0] = -1.0
+    truth = fillnodata(
+        image, mask, max_search_distance=8, smoothing_iterations=smoothing_iterations
+    )
+
+    profile = {
+        "driver": "GTiff",
+        "count": 1,
+        "width": 64,
+        "height": 64,
+        "dtype": "float32",
+        "nodata": -1.0,
+        "tiled": tiled,
+        "blockxsize": 16,
+        "blockysize": 16,
+    }
+    with rasterio.open(tmp_path / "image.tif", "w", **profile) as dst:
+        dst.write(image, 1)
+
+    with (
+        rasterio.open(tmp_path / "image.tif") as src,
+        rasterio.open(tmp_path / "filled.tif", "w", **profile) as dst,
+    ):
+        fillnodata(
+            rasterio.band(src, 1),
+            max_search_distance=8,
+            smoothing_iterations=smoothing_iterations,
+            out=rasterio.band(dst, 1),
+            num_threads=num_threads,
+            mem_limit=0.03,
+        )
+
+    with rasterio.open(tmp_path / "filled.tif") as src:
+        result = src.read(1)
+
+    assert_allclose(result, truth)
+
+
+@pytest.mark.parametrize("block_shape", [(1, 10000), (16, 10000), (256, 256)])
+def test_tile_plan(block_shape):
+    """Tiles and their halos fit the budget, whatever the blocks."""
+    window = Window(0, 0, 10000, 3000)
+    tiles = _tile_plan(window, 20, 250000, block_shape)
+    assert sum(tile.width * tile.height for tile in tiles) == 10000 * 3000
+    for tile in tiles[:1]:
+        assert (tile.width + 40) * (tile.height + 40) <= 250000
+        assert tile.width < 10000
+    if block_shape == (256, 256):
+        assert tiles[0].width % 256 == 0 and tiles[0].height % 256 == 0
+
+
+def test_tile_plan_large_halo(caplog):
+    """Tiles are no narrower than a halo that exceeds the budget."""
+    window = Window(0, 0, 10000, 3000)
+    tiles = _tile_plan(window, 300, 250000, (1, 10000))
+    assert tiles[0].width == tiles[0].height == 300
+    assert "exceed the memory limit" in caplog.text
+
+
+def test_fillnodata_band_same_band(tmp_path):
+    """A band can't be filled into itself."""
+    with rasterio.open(
+        tmp_path / "image.tif",
+        "w",
+        driver="GTiff",
+        count=1,
+        width=8,
+        height=8,
+        dtype="uint8",
+    ) as dst:
+        with pytest.raises(ValueError):
+            fillnodata(rasterio.band(dst, 1), out=rasterio.band(dst, 1))
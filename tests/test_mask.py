@@ -3,7 +3,8 @@ import pytest
 from affine import Affine
 
 import rasterio
-from rasterio.mask import raster_geometry_mask, mask
+from rasterio.mask import raster_geometry_mask, mask, mask_many
+from rasterio.windows import Window
 
 from .classes import MockGeoInterface
 
@@ -64,6 +65,48 @@ def test_raster_geometrymask_all_touched(basic_image, basic_image_file, basic_ge
     assert transform == Affine.identity()
 
 
+@pytest.mark.parametrize("all_touched", [False, True])
+@pytest.mark.parametrize("invert", [False, True])
+@pytest.mark.parametrize(
+    "window", [Window(1, 1, 5, 5), Window(0, 0, 3, 10), Window(6, 6, 4, 4)]
+)
+def test_raster_geometrymask_window(
+    basic_image_file, basic_geometry, all_touched, invert, window
+):
+    """A mask of a window is that window of the mask of the raster."""
+    with rasterio.open(basic_image_file) as src:
+        full_mask, _, _ = raster_geometry_mask(
+            src, [basic_geometry], all_touched=all_touched, invert=invert
+        )
+        geometrymask, transform, out_window = raster_geometry_mask(
+            src, [basic_geometry], all_touched=all_touched, invert=invert, window=window
+        )
+
+    assert np.array_equal(geometrymask, full_mask[window.toslices()])
+    assert transform == Affine.translation(window.col_off, window.row_off)
+    assert out_window == window
+
+
+def test_raster_geometrymask_window_crop(basic_image_file, basic_geometry):
+    """A window can not be used with crop."""
+    with rasterio.open(basic_image_file) as src:
+        with pytest.raises(ValueError):
+            raster_geometry_mask(
+                src, [basic_geometry], crop=True, window=Window(0, 0, 5, 5)
+            )
+
+
+def test_mask_window(basic_image_file, basic_geometry):
+    """A window of the raster can be masked."""
+    window = Window(1, 2, 5, 6)
+    with rasterio.open(basic_image_file) as src:
+        full, _ = mask(src, [basic_geometry])
+        masked, transform = mask(src, [basic_geometry], window=window)
+
+    assert np.array_equal(masked, full[(slice(None),) + window.toslices()])
+    assert transform == Affine.translation(1, 2)
+
+
 def test_raster_geometrymask_crop(basic_image_2x2, basic_image_file, basic_geometry):
     """Mask returned will be cropped to extent of geometry, and transform
     is transposed 2 down and 2 over"""
@@ -317,3 +360,68 @@ def test_mask_filled(basic_image, basic_image_2x2, basic_image_file, basic_geome
     assert type(masked) is np.ma.MaskedArray
     assert np.array_equal(masked[0].mask, image.mask)
     assert np.array_equal(masked[0], image)
+
+
+@pytest.mark.parametrize("filled", [True, False])
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_mask_many(path_rgb_byte_tif, filled, num_threads):
+    """Clips of many features match those of mask()."""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        left, bottom, right, top = src.bounds
+        dx = (right - left) / 20.0
+        dy = (top - bottom) / 20.0
+        features = []
+        for i in range(20):
+            x = left + (i % 5) * 3.5 * dx + dx
+            y = bottom + (i // 5) * 4.5 * dy + dy
+            features.append(
+                {
+                    "type": "Feature",
+                    "properties": {},
+                    "geometry": {
+                        "type": "Polygon",
+                        "coordinates": [
+                            [
+                                (x, y),
+                                (x + 2.3 * dx, y),
+                                (x + 1.1 * dx, y + 3.1 * dy),
+                                (x, y),
+                            ]
+                        ],
+                    },
+                }
+            )
+
+        results = list(
+            mask_many(
+                src,
+                features,
+                filled=filled,
+                indexes=[1, 2],
+                num_threads=num_threads,
+                mem_limit=0.1,
+            )
+        )
+        assert sorted(i for i, _, _ in results) == list(range(20))
+
+        for i, clip, transform in results:
+            expected, expected_transform = mask(
+                src, [features[i]["geometry"]], crop=True, filled=filled, indexes=[1, 2]
+            )
+            assert transform == expected_transform
+            assert np.array_equal(clip, expected)
+            if not filled:
+                assert np.array_equal(clip.mask, expected.mask)
+
+
+def test_mask_many_no_overlap(basic_image_file, basic_geometry):
+    """Features that do not overlap the raster are skipped."""
+    outside = {
+        "type": "Polygon",
+        "coordinates": [[(1000, 1000), (1001, 1000), (1001, 1001), (1000, 1000)]],
+    }
+    with rasterio.open(basic_image_file) as src:
+        with pytest.warns(UserWarning):
+            results = list(mask_many(src, [outside, basic_geometry]))
+
+    assert [i for i, _, _ in results] == [1]
@@ -9,7 +9,13 @@ import warnings
 
 import affine
 import rasterio
-from rasterio.merge import merge
+from rasterio.merge import (
+    MeanMethod,
+    MedianMethod,
+    PercentileMethod,
+    merge,
+)
+from rasterio._tiles import _chunk_plan
 from rasterio.crs import CRS
 from rasterio.errors import MergeError, RasterioError
 from rasterio.vrt import WarpedVRT
@@ -103,7 +109,16 @@ def test_different_crs(test_data_dir_overlapping):
 
 @pytest.mark.parametrize(
     "method,value",
-    [("first", 1), ("last", 2), ("min", 1), ("max", 3), ("sum", 6), ("count", 3)],
+    [
+        ("first", 1),
+        ("last", 2),
+        ("min", 1),
+        ("max", 3),
+        ("sum", 6),
+        ("count", 3),
+        ("mean", 2),
+        ("median", 2),
+    ],
 )
 def test_merge_method(test_data_dir_overlapping, method, value):
     """Merge method produces expected values in intersection"""
@@ -116,6 +131,130 @@ def test_merge_method(test_data_dir_overlapping, method, value):
     numpy.testing.assert_array_equal(arr[:, 5:10, 5:10], value)
 
 
+@pytest.mark.parametrize("q,value", [(0, 1), (50, 2), (100, 3)])
+def test_merge_percentile(test_data_dir_overlapping, q, value):
+    """Percentile composite produces expected values in intersection"""
+    inputs = sorted(list(test_data_dir_overlapping.iterdir()))
+    arr, _ = merge(inputs, method=PercentileMethod(q))
+    numpy.testing.assert_array_equal(arr[:, 5:10, 5:10], value)
+
+
+@pytest.mark.parametrize("method", ["mean", "median"])
+def test_merge_composite_chunked(test_data_dir_overlapping, tmp_path, method):
+    """Composites are the same whether or not they are chunked"""
+    inputs = sorted(list(test_data_dir_overlapping.iterdir()))
+    expected, _ = merge(inputs, method=method)
+    arr, _ = merge(inputs, method=method, mem_limit=0.0001)
+    numpy.testing.assert_array_equal(arr, expected)
+    merge(inputs, method=method, mem_limit=0.0001, dst_path=tmp_path / "out.tif")
+    with rasterio.open(tmp_path / "out.tif") as dst:
+        numpy.testing.assert_array_equal(dst.read(), expected)
+
+
+def test_merge_composite_overlapping_sources(test_data_dir_overlapping):
+    """Composite stacks are sized by the sources overlapping each chunk"""
+
+    class RecordingMethod(MedianMethod):
+        def start(self, shape, nsources):
+            counts.append(nsources)
+            super().start(shape, nsources)
+
+    counts = []
+    inputs = sorted(list(test_data_dir_overlapping.iterdir()))
+    expected, _ = merge(inputs, method="median")
+    arr, _ = merge(inputs, method=RecordingMethod(), mem_limit=0.0001)
+    numpy.testing.assert_array_equal(arr, expected)
+    assert max(counts) == 3
+    assert min(counts) < 3
+
+
+@pytest.mark.parametrize("q", [0, 10, 50, 75, 100])
+def test_percentile_method_matches_numpy(q):
+    """Percentiles match numpy.nanpercentile."""
+    rng = numpy.random.default_rng(q)
+    data = [
+        numpy.ma.masked_array(
+            rng.normal(size=(2, 6, 7)), mask=rng.random((2, 6, 7)) < 0.3
+        )
+        for _ in range(5)
+    ]
+    method = PercentileMethod(q)
+    method.start((2, 6, 7), 8)
+    for arr in data:
+        method.update(slice(None), slice(None), arr)
+    dest = numpy.full((2, 6, 7), -99.0)
+    method.finish(dest)
+
+    stacked = numpy.stack([arr.filled(numpy.nan) for arr in data])
+    valid = ~numpy.all(numpy.isnan(stacked), axis=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        expected = numpy.nanpercentile(stacked, q, axis=0)
+    numpy.testing.assert_allclose(dest[valid], expected[valid])
+    assert (dest[~valid] == -99.0).all()
+
+
+@pytest.mark.parametrize("method", [MeanMethod(), PercentileMethod(50)])
+def test_composite_rounds_integers(method):
+    """Integer composites are rounded, not truncated."""
+    method.start((1, 1, 2), 2)
+    for values in ([1, 2], [2, 3]):
+        method.update(
+            slice(None), slice(None), numpy.ma.masked_array([[values]], dtype="uint8")
+        )
+    dest = numpy.zeros((1, 1, 2), dtype="uint8")
+    method.finish(dest)
+    assert dest.tolist() == [[[2, 2]]]
+
+
+def test_merge_percentile_invalid():
+    with pytest.raises(ValueError):
+        PercentileMethod(101)
+
+
+@pytest.mark.parametrize(
+    "max_pixels,block_shape,chunk_shape",
+    [
+        (2e6, (256, 256), (1000, 1000)),
+        (70000, (256, 256), (256, 256)),
+        (300000, (256, 256), (256, 1000)),
+        (600000, (256, 256), (512, 1000)),
+        (300000, (16, 1000), (288, 1000)),
+        (100, (256, 256), (256, 256)),
+    ],
+)
+def test_chunk_plan_block_aligned(max_pixels, block_shape, chunk_shape):
+    """Chunks are multiples of the destination's blocks"""
+    window = windows.Window(0, 0, 1000, 1000)
+    chunks = _chunk_plan(window, max_pixels, block_shape)
+    assert (chunks[0].height, chunks[0].width) == chunk_shape
+    assert sum(chunk.width * chunk.height for chunk in chunks) == 1000 * 1000
+    for chunk in chunks:
+        assert chunk.row_off % block_shape[0] == 0
+        assert chunk.col_off % block_shape[1] == 0
+
+
+def test_chunk_plan_tiny_limit():
+    """Chunks are at least one pixel when the limit is under one pixel"""
+    window = windows.Window(0, 0, 10, 10)
+    chunks = _chunk_plan(window, 0.5)
+    assert len(chunks) == 100
+
+
+def test_merge_tiled_output(test_data_dir_overlapping, tmp_path):
+    """Chunked merge into a tiled dataset matches an in-memory merge"""
+    inputs = sorted(list(test_data_dir_overlapping.iterdir()))
+    expected, _ = merge(inputs)
+    merge(
+        inputs,
+        mem_limit=0.0001,
+        dst_path=tmp_path / "out.tif",
+        dst_kwds={"tiled": True, "blockxsize": 16, "blockysize": 16},
+    )
+    with rasterio.open(tmp_path / "out.tif") as dst:
+        numpy.testing.assert_array_equal(dst.read(), expected)
+
+
 def test_issue2163():
     """Demonstrate fix for issue 2163"""
     with rasterio.open("tests/data/float_raster_with_nodata.tif") as src:
@@ -365,3 +365,100 @@ def test_opener_multi_range_read():
         # Should emit a multi-range read
         with pytest.warns(UserWarning, match="Using MultiRange Reads"):
             _ = src.read()
+
+
+class CountingFileIO(io.FileIO):
+    """FileIO that counts reads."""
+
+    reads = 0
+
+    def read(self, size=-1):
+        CountingFileIO.reads += 1
+        return super().read(size)
+
+
+def counting_opener(path, mode="rb"):
+    return CountingFileIO(path, mode=mode.replace("b", ""))
+
+
+def open_counting(**options):
+    CountingFileIO.reads = 0
+    with rasterio.Env(**options):
+        with rasterio.open("tests/data/RGB.byte.tif", opener=counting_opener) as src:
+            src.read()
+    return CountingFileIO.reads
+
+
+def test_opener_read_buffering():
+    """Small reads are coalesced."""
+    unbuffered = open_counting(
+        RASTERIO_OPENER_READAHEAD=0, RASTERIO_OPENER_HEADER_CACHE=0
+    )
+    buffered = open_counting()
+    assert buffered < unbuffered
+
+
+def test_opener_read_buffering_data():
+    """Buffered reads return the same data."""
+    with rasterio.open("tests/data/RGB.byte.tif") as src:
+        expected = src.read()
+
+    for readahead in (0, 100, 65536):
+        with rasterio.Env(RASTERIO_OPENER_READAHEAD=readahead):
+            with rasterio.open("tests/data/RGB.byte.tif", opener=io.open) as src:
+                assert (src.read() == expected).all()
+
+
+def test_opener_invalid_readahead():
+    """Invalid sizes are a registration error."""
+    with rasterio.Env(RASTERIO_OPENER_READAHEAD="lots"):
+        with pytest.raises(OpenerRegistrationError):
+            rasterio.open("tests/data/RGB.byte.tif", opener=io.open)
+
+
+def test_buffered_reader():
+    """Reads are served from the header and buffer."""
+    from rasterio._vsiopener import _BufferedReader
+
+    raw = io.BytesIO(bytes(range(256)))
+    header = raw.read(16)
+    raw.seek(0)
+    reader = _BufferedReader(raw, 64, header=header)
+
+    assert reader.read(4) == bytes(range(4))
+    assert raw.tell() == 0
+    reader.seek(100)
+    assert reader.read(8) == bytes(range(100, 108))
+    assert raw.tell() == 164
+    assert reader.read(8) == bytes(range(108, 116))
+    assert raw.tell() == 164
+    assert reader.tell() == 116
+    reader.seek(-6, os.SEEK_CUR)
+    assert reader.read(2) == bytes(range(110, 112))
+    assert reader.read(100) == bytes(range(112, 212))
+    reader.seek(0, os.SEEK_END)
+    assert reader.tell() == 256
+    assert reader.read(4) == b""
+
+
+def test_opener_header_cache():
+    """Headers are read once per file and dropped on write."""
+    from rasterio._vsiopener import _OpenerReadCache
+
+    class NoHeaderBytesIO(io.BytesIO):
+        def read(self, size=-1):
+            assert self.tell() >= 16
+            return super().read(size)
+
+    cache = _OpenerReadCache(64, 16)
+    reader = cache.wrap("a.tif", "rb", io.BytesIO(bytes(range(256))))
+    assert reader.read(16) == bytes(range(16))
+    assert cache.headers["a.tif"] == bytes(range(16))
+
+    reader = cache.wrap("a.tif", "rb", NoHeaderBytesIO(bytes(range(256))))
+    assert reader.read(16) == bytes(range(16))
+    assert reader.read(4) == bytes(range(16, 20))
+
+    raw = io.BytesIO(bytes(range(256)))
+    assert cache.wrap("a.tif", "r+b", raw) is raw
+    assert cache.headers["a.tif"] is None
@@ -1,5 +1,6 @@
 """Tests of session module"""
 
+from datetime import datetime, timedelta, timezone
 import os
 from unittest import mock
 
@@ -13,6 +14,7 @@ from rasterio.session import (
     GSSession,
     SwiftSession,
     AzureSession,
+    clear_credential_cache,
     parse_bool,
 )
 
@@ -492,3 +494,144 @@ def test_azure_session_class_unsigned():
     assert sesh.get_credential_options()["AZURE_NO_SIGN_REQUEST"] == "YES"
     assert sesh.get_credential_options()["AZURE_STORAGE_ACCOUNT"] == "naipblobs"
     assert sesh.hascreds(sesh.get_credential_options())
+
+
+@pytest.fixture
+def credential_cache():
+    """Start and end with an empty credential cache"""
+    clear_credential_cache()
+    yield
+    clear_credential_cache()
+
+
+def test_aws_session_shared(credential_cache):
+    """Sessions with the same arguments share a boto3 session"""
+    sesh1 = AWSSession(aws_access_key_id="foo", aws_secret_access_key="bar")
+    sesh2 = AWSSession(aws_access_key_id="foo", aws_secret_access_key="bar")
+    sesh3 = AWSSession(aws_access_key_id="foo", aws_secret_access_key="baz")
+    assert sesh1._session is sesh2._session
+    assert sesh1._cached_creds is sesh2._cached_creds
+    assert sesh1._session is not sesh3._session
+    assert sesh3.get_credential_options()["AWS_SECRET_ACCESS_KEY"] == "baz"
+
+
+def test_aws_session_shared_environ(credential_cache, monkeypatch):
+    """A change of AWS environment variables is respected"""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "foo")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "bar")
+    assert AWSSession().get_credential_options()["AWS_ACCESS_KEY_ID"] == "foo"
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "lol")
+    assert AWSSession().get_credential_options()["AWS_ACCESS_KEY_ID"] == "lol"
+
+
+def test_aws_session_cached_credentials(credential_cache):
+    """Frozen credentials are resolved once while they are valid"""
+    sesh = AWSSession(aws_access_key_id="foo", aws_secret_access_key="bar")
+    with mock.patch.object(
+        sesh._creds, "get_frozen_credentials", wraps=sesh._creds.get_frozen_credentials
+    ) as frozen:
+        for _ in range(3):
+            assert sesh.get_credential_options()["AWS_ACCESS_KEY_ID"] == "foo"
+        assert frozen.call_count == 1
+
+
+def test_aws_session_cleared(credential_cache):
+    """Existing sessions resolve credentials again after clearing"""
+    sesh = AWSSession(aws_access_key_id="foo", aws_secret_access_key="bar")
+    sesh.get_credential_options()
+    with mock.patch.object(
+        sesh._creds, "get_frozen_credentials", wraps=sesh._creds.get_frozen_credentials
+    ) as frozen:
+        clear_credential_cache()
+        sesh.get_credential_options()
+        assert frozen.call_count == 1
+
+
+def test_aws_session_unknown_expiry(credential_cache):
+    """Refreshable credentials of unknown expiry are not cached"""
+    sesh = AWSSession(aws_access_key_id="foo", aws_secret_access_key="bar")
+    sesh._creds.refresh_needed = lambda: False
+    with mock.patch.object(
+        sesh._creds, "get_frozen_credentials", wraps=sesh._creds.get_frozen_credentials
+    ) as frozen:
+        sesh.get_credential_options()
+        sesh.get_credential_options()
+        assert frozen.call_count == 2
+
+
+def test_aws_session_refresh(credential_cache):
+    """Credentials near their expiry are resolved again"""
+    boto3 = pytest.importorskip("boto3")
+    sesh = AWSSession(
+        session=boto3.Session(aws_access_key_id="foo", aws_secret_access_key="bar")
+    )
+    now = datetime.now(timezone.utc)
+    sesh._creds._expiry_time = now + timedelta(seconds=60)
+    with mock.patch.object(
+        sesh._creds, "get_frozen_credentials", wraps=sesh._creds.get_frozen_credentials
+    ) as frozen:
+        sesh.get_credential_options()
+        sesh.get_credential_options()
+        assert frozen.call_count == 2
+
+        sesh._creds._expiry_time = now + timedelta(hours=1)
+        sesh.get_credential_options()
+        sesh.get_credential_options()
+        assert frozen.call_count == 3
+
+
+def test_credential_provider(credential_cache):
+    """Provided credentials are cached and refreshed as they expire"""
+    tokens = iter(["a", "b", "c"])
+    expiry = [datetime.now(timezone.utc) + timedelta(hours=1)]
+
+    def provider():
+        return {"azure_storage_access_token": next(tokens)}, expiry[0]
+
+    sesh1 = AzureSession(azure_storage_account="foo", credential_provider=provider)
+    sesh2 = AzureSession(azure_storage_account="foo", credential_provider=provider)
+    opts = sesh1.get_credential_options()
+    assert opts["AZURE_STORAGE_ACCOUNT"] == "foo"
+    assert opts["AZURE_STORAGE_ACCESS_TOKEN"] == "a"
+    assert AzureSession.hascreds(opts)
+    assert sesh2.get_credential_options()["AZURE_STORAGE_ACCESS_TOKEN"] == "a"
+
+    clear_credential_cache()
+    expiry[0] = datetime.now(timezone.utc)
+    assert sesh1.get_credential_options()["AZURE_STORAGE_ACCESS_TOKEN"] == "b"
+    assert sesh2.get_credential_options()["AZURE_STORAGE_ACCESS_TOKEN"] == "c"
+
+
+def test_credential_cache_bounded(credential_cache):
+    """A provider per session does not grow the cache without bound"""
+    from rasterio.session import _credential_cache
+
+    for i in range(_credential_cache.maxsize + 10):
+        sesh = AzureSession(
+            azure_storage_account="foo",
+            credential_provider=lambda i=i: ({"azure_storage_access_token": i}, None),
+        )
+        assert sesh.get_credential_options()["AZURE_STORAGE_ACCESS_TOKEN"] == i
+    assert len(_credential_cache._items) == _credential_cache.maxsize
+
+
+def test_aws_session_keys_hashed(credential_cache):
+    """Shared boto3 sessions are not keyed by secrets"""
+    from rasterio.session import _aws_sessions
+
+    AWSSession(aws_access_key_id="foo", aws_secret_access_key="s3cret")
+    assert all("s3cret" not in repr(key) for key in _aws_sessions._items)
+
+
+def test_gs_credential_provider(credential_cache):
+    """GSSession takes a credential provider"""
+    calls = []
+
+    def provider():
+        calls.append(None)
+        return {"gs_oauth2_refresh_token": "tok"}, None
+
+    sesh = GSSession(credential_provider=provider)
+    for _ in range(3):
+        assert sesh.get_credential_options() == {"GS_OAUTH2_REFRESH_TOKEN": "tok"}
+    assert len(calls) == 1
@@ -1,9 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
 from threading import Thread
 import time
 import unittest
 
+import numpy as np
+
 import rasterio as rio
 from rasterio.env import get_gdal_config
+from rasterio.features import rasterize, shapes, sieve
+from rasterio.fill import fillnodata
 
 
 class TestThreading(unittest.TestCase):
@@ -80,5 +85,32 @@ def test_child_thread_isolation():
     t2.join()
 
 
+def test_features_thread_pool(basic_image):
+    """Features and fill functions give the same results in threads."""
+    geom = {
+        "type": "Polygon",
+        "coordinates": [[(2, 2), (2, 4.25), (4.25, 4.25), (4.25, 2), (2, 2)]],
+    }
+    holed = basic_image.astype("float32")
+    holed[3, 3] = 0
+
+    def func(_):
+        return (
+            rasterize([geom], out_shape=basic_image.shape),
+            list(shapes(basic_image)),
+            sieve(basic_image, 2),
+            fillnodata(holed, mask=holed > 0),
+        )
+
+    expected = func(None)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for result in pool.map(func, range(16)):
+            np.testing.assert_array_equal(result[0], expected[0])
+            assert result[1] == expected[1]
+            np.testing.assert_array_equal(result[2], expected[2])
+            np.testing.assert_array_equal(result[3], expected[3])
+
+
 if __name__ == "__main__":
     unittest.main()
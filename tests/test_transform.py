@@ -15,6 +15,7 @@ from rasterio import transform
 from rasterio.transform import (
     AffineTransformer,
     GCPTransformer,
+    GridTransformer,
     RPCTransformer,
     get_transformer,
     rowcol,
@@ -577,3 +578,130 @@ def test_transform_rowcol_grid():
         left, bottom, right, top = src.bounds
         xs, ys = numpy.mgrid[left:right:3j, bottom:top:3j]
         rows, cols = AffineTransformer(src.transform).rowcol(xs, ys)
+
+
+@pytest.mark.parametrize(
+    "aff",
+    [
+        Affine(300.0, 0.0, 101985.0, 0.0, -300.0, 2826915.0),
+        Affine.rotation(30.0) * Affine.scale(2.0),
+    ],
+)
+@pytest.mark.parametrize("op", [None, math.floor, math.ceil, round, float, int])
+def test_affine_rowcol_chunks(monkeypatch, aff, op):
+    """Chunked rowcol matches the per coordinate result."""
+    monkeypatch.setattr(AffineTransformer, "chunk_size", 7)
+    xs = 102096.1 + numpy.arange(50) * 1234.5
+    ys = 2826803.9 - numpy.arange(50) * 1234.5
+    rows, cols = AffineTransformer(aff).rowcol(xs, ys, op=op)
+    expected = [~aff * (x, y) for x, y in zip(xs, ys)]
+    op = op or math.floor
+    if op is float:
+        assert list(rows) == pytest.approx([row for _, row in expected])
+        assert list(cols) == pytest.approx([col for col, _ in expected])
+    else:
+        assert list(rows) == [op(row) for _, row in expected]
+        assert list(cols) == [op(col) for col, _ in expected]
+
+
+def test_affine_rowcol_dtype_out():
+    """rowcol stores results of a given dtype in out arrays."""
+    aff = Affine(300.0, 0.0, 101985.0, 0.0, -300.0, 2826915.0)
+    xs = numpy.array([[101985.0, 102285.0], [191985.0, 102585.0]])
+    ys = numpy.array([[2826915.0, 2826615.0], [2736915.0, 2826315.0]])
+    out = (numpy.zeros((2, 2), dtype="int64"), numpy.zeros((2, 2), dtype="int64"))
+    rows, cols = rowcol(aff, xs, ys, out=out, dtype="int64")
+    assert rows is out[0] and cols is out[1]
+    assert rows.tolist() == [[0, 1], [300, 2]]
+    assert cols.tolist() == [[0, 1], [300, 2]]
+    rows, cols = rowcol(aff, xs, ys, dtype="int64")
+    assert rows.dtype == cols.dtype == numpy.dtype("int64")
+    rows, cols = rowcol(aff, xs, ys)
+    assert rows.dtype == cols.dtype == numpy.dtype("int32")
+
+
+def test_affine_xy_chunks_out(monkeypatch):
+    """Chunked xy matches the per coordinate result."""
+    monkeypatch.setattr(AffineTransformer, "chunk_size", 3)
+    aff = Affine.rotation(30.0) * Affine(300.0, 0.0, 101985.0, 0.0, -300.0, 2826915.0)
+    rows = numpy.arange(10)
+    out = (numpy.empty(10), numpy.empty(10))
+    xs, ys = xy(aff, rows, 5, offset="ul", out=out)
+    assert xs is out[0] and ys is out[1]
+    for row, x, y in zip(rows, xs, ys):
+        assert (x, y) == pytest.approx(aff * (5, row))
+
+
+def test_affine_swapped_axes():
+    """Transforms rotated by 90 degrees are not axis aligned."""
+    aff = Affine(0, 1, 100, -1, 0, 200)
+    xs, ys = xy(aff, [0, 3], [0, 2])
+    assert list(xs) == pytest.approx([100.5, 103.5])
+    assert list(ys) == pytest.approx([199.5, 197.5])
+    rows, cols = rowcol(aff, [100.5, 103.5], [199.5, 197.5])
+    assert list(rows) == [0, 3]
+    assert list(cols) == [0, 2]
+
+
+def test_affine_out_size():
+    """out arrays must have the size of the coordinates."""
+    with pytest.raises(ValueError):
+        xy(Affine.identity(), [0, 1], [0, 1], out=(numpy.empty(3), numpy.empty(3)))
+
+
+@pytest.mark.parametrize("tps", [False, True])
+def test_gcp_transformer_max_error(tps):
+    """The approximate transformer stays within its maximum error."""
+    rows, cols = numpy.mgrid[0:11521:1000, 0:7448:500]
+    with GCPTransformer(gcps(), tps=tps) as exact:
+        expected = exact.xy(rows, cols)
+    with GCPTransformer(gcps(), tps=tps, max_error=1e-6) as approx:
+        xs, ys = approx.xy(rows, cols)
+    assert numpy.allclose(xs, expected[0], rtol=0, atol=1e-6)
+    assert numpy.allclose(ys, expected[1], rtol=0, atol=1e-6)
+
+
+def test_rpc_transformer_max_error():
+    """The approximate transformer stays within its maximum error."""
+    rows, cols = numpy.mgrid[0:718:50, 0:791:50]
+    with RPCTransformer(rpcs()) as exact:
+        expected = exact.xy(rows, cols)
+    with RPCTransformer(rpcs(), max_error=1e-7) as approx:
+        xs, ys = approx.xy(rows, cols)
+    assert numpy.allclose(xs, expected[0], rtol=0, atol=1e-7)
+    assert numpy.allclose(ys, expected[1], rtol=0, atol=1e-7)
+
+
+@pytest.mark.parametrize("max_error", [None, 1e-7])
+def test_rpc_transformer_shared_threads(max_error):
+    """A transformer shared between threads gives the same results."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    rows, cols = numpy.mgrid[0:718:10, 0:791:10]
+    with RPCTransformer(rpcs(), max_error=max_error) as transformer:
+        expected = transformer.xy(rows, cols)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: transformer.xy(rows, cols), range(16)))
+    for xs, ys in results:
+        assert numpy.array_equal(xs, expected[0])
+        assert numpy.array_equal(ys, expected[1])
+
+
+def test_grid_transformer(tmp_path):
+    """Grid transformations approximate their source and can be reloaded."""
+    with RPCTransformer(rpcs()) as exact:
+        grid = GridTransformer.from_transformer(exact, 791, 718, step=8)
+        rows, cols = numpy.mgrid[1:718:37, 1:791:41]
+        expected_xs, expected_ys = exact.xy(rows, cols)
+
+    xs, ys = grid.xy(rows, cols)
+    assert numpy.allclose(xs, expected_xs, rtol=0, atol=1e-6)
+    assert numpy.allclose(ys, expected_ys, rtol=0, atol=1e-6)
+    new_rows, new_cols = grid.rowcol(xs, ys, op=float)
+    assert numpy.allclose(new_rows, rows.ravel() + 0.5, rtol=0, atol=0.01)
+    assert numpy.allclose(new_cols, cols.ravel() + 0.5, rtol=0, atol=0.01)
+
+    grid.save(tmp_path / "grid.npz")
+    loaded = GridTransformer.load(tmp_path / "grid.npz")
+    assert loaded.bounds == grid.bounds
+    assert numpy.array_equal(loaded.xy(rows, cols), (xs, ys))
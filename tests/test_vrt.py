@@ -1,7 +1,13 @@
 """Tests of the rasterio.vrt module"""
 
+import affine
+import numpy
+import pytest
+
 import rasterio
 import rasterio.vrt
+from rasterio.errors import RasterioError
+from rasterio.merge import merge
 
 
 def test_boundless_vrt(path_rgb_byte_tif):
@@ -32,3 +38,82 @@ def test_boundless_vrt_fill_value(path_rgb_msk_byte_tif):
             assert vrt.nodata == 0
             assert rgb.count == vrt.count
             assert rgb.dtypes == vrt.dtypes
+
+
+def test_build_mosaic_single(path_rgb_byte_tif):
+    with rasterio.open(path_rgb_byte_tif) as rgb:
+        doc = rasterio.vrt.build_mosaic([rgb])
+        with rasterio.open(doc) as vrt:
+            assert vrt.count == rgb.count
+            assert vrt.dtypes == rgb.dtypes
+            assert vrt.crs == rgb.crs
+            assert vrt.transform.almost_equals(rgb.transform)
+            assert (vrt.read() == rgb.read()).all()
+
+
+def test_build_mosaic_matches_merge(tmp_path):
+    """A mosaic has the same pixels as merge() with its default method"""
+    kwargs = {
+        "crs": "EPSG:4326",
+        "transform": affine.Affine(0.2, 0, -114, 0, -0.2, 46),
+        "count": 1,
+        "dtype": "uint8",
+        "driver": "GTiff",
+        "width": 10,
+        "height": 10,
+        "nodata": 0,
+    }
+    paths = [tmp_path.joinpath(name) for name in ("a.tif", "b.tif", "c.tif")]
+    for value, path in enumerate(paths, start=1):
+        if value == 3:
+            kwargs["transform"] = affine.Affine(0.2, 0, -113, 0, -0.2, 45)
+        with rasterio.open(path, "w", **kwargs) as dst:
+            dst.write(numpy.full((1, 10, 10), value, dtype="uint8"))
+
+    expected, transform = merge(paths)
+    with rasterio.open(rasterio.vrt.build_mosaic(paths)) as vrt:
+        assert vrt.nodata == 0
+        assert vrt.transform.almost_equals(transform)
+        assert (vrt.read() == expected).all()
+        assert (vrt.read(1, window=((5, 10), (5, 10))) == 1).all()
+
+
+def test_build_mosaic_bounds_res(path_rgb_byte_tif):
+    with rasterio.open(path_rgb_byte_tif) as rgb:
+        left, bottom, right, top = rgb.bounds
+        bounds = (left, top - 300 * 60.0, left + 300 * 60.0, top)
+        doc = rasterio.vrt.build_mosaic([rgb], bounds=bounds, res=60.0, indexes=[1])
+        with rasterio.open(doc) as vrt:
+            assert vrt.count == 1
+            assert vrt.shape == (300, 300)
+            assert vrt.res == (60.0, 60.0)
+
+
+def test_build_mosaic_crs_mismatch(path_rgb_byte_tif, tmp_path):
+    with rasterio.open(path_rgb_byte_tif) as rgb:
+        profile = rgb.profile
+        profile["crs"] = "EPSG:3857"
+        with rasterio.open(tmp_path.joinpath("other.tif"), "w", **profile) as dst:
+            dst.write(rgb.read())
+    with pytest.raises(RasterioError):
+        rasterio.vrt.build_mosaic([path_rgb_byte_tif, tmp_path.joinpath("other.tif")])
+
+
+def test_build_mosaic_no_sources():
+    with pytest.raises(ValueError):
+        rasterio.vrt.build_mosaic([])
+
+
+def test_build_mosaic_missing_band(path_rgb_byte_tif, tmp_path):
+    """Every source must have the requested bands"""
+    with rasterio.open(path_rgb_byte_tif) as rgb:
+        profile = rgb.profile
+        profile["count"] = 1
+        with rasterio.open(tmp_path.joinpath("single.tif"), "w", **profile) as dst:
+            dst.write(rgb.read(1), 1)
+    with pytest.raises(ValueError):
+        rasterio.vrt.build_mosaic(
+            [path_rgb_byte_tif, tmp_path.joinpath("single.tif")], indexes=[1, 3]
+        )
+    with pytest.raises(ValueError):
+        rasterio.vrt.build_mosaic([path_rgb_byte_tif], indexes=[4])
@@ -23,9 +23,11 @@ from rasterio.windows import (
     intersect,
     intersection,
     get_data_window,
+    data_window,
     union,
     round_window_to_full_blocks,
     subdivide,
+    WindowArray,
 )
 
 EPS = 1.0e-8
@@ -736,3 +738,182 @@ def test_subdivide():
         Window(col_off=2, row_off=2, width=2, height=2),
     }
     assert set(subs) == expected
+
+
+WINDOWS = [
+    Window(0, 0, 10, 10),
+    Window(-5.5, 3.25, 20.5, 4),
+    Window(790, 710, 20, 20),
+    Window(12.3, 4.6, 0.4, 7.9),
+]
+
+
+def test_window_array_windows():
+    """Windows round trip through a WindowArray."""
+    windows = WindowArray.from_windows(WINDOWS)
+    assert len(windows) == 4
+    assert windows[1] == WINDOWS[1]
+    assert list(windows) == WINDOWS
+    assert windows[1:3].tolist() == WINDOWS[1:3]
+    assert WindowArray.from_records(windows.data).tolist() == WINDOWS
+    assert windows.flatten().tolist() == [list(w.flatten()) for w in WINDOWS]
+
+
+def test_window_array_int():
+    """Integer offsets and lengths are kept as integers."""
+    windows = WindowArray([0, 10], 0, 10, 5)
+    assert windows.data.dtype["col_off"] == np.dtype("int64")
+    assert windows.tolist() == [Window(0, 0, 10, 5), Window(10, 0, 10, 5)]
+    assert isinstance(windows[0].col_off, int)
+
+
+def test_window_array_invalid():
+    """Negative lengths are invalid."""
+    with pytest.raises(ValueError):
+        WindowArray(0, 0, [1, -1], 1)
+
+
+def test_window_array_intersection():
+    """Intersections match those of Windows."""
+    windows = WindowArray.from_windows(WINDOWS)
+    other = Window(2, 2, 800, 800)
+    result = windows.intersection(other)
+    assert windows.intersects(other).tolist() == [intersect(w, other) for w in WINDOWS]
+    for window, expected in zip(result, WINDOWS):
+        assert window == intersection(expected, other)
+    assert not WindowArray(0, 0, 1, 1).intersects(Window(5, 5, 1, 1))[0]
+    assert WindowArray(0, 0, 1, 1).intersection(Window(5, 5, 1, 1))[0].width == 0
+
+
+def test_window_array_union():
+    """Unions match those of Windows."""
+    windows = WindowArray.from_windows(WINDOWS)
+    other = Window(2, 2, 5, 5)
+    for window, expected in zip(windows.union(other), WINDOWS):
+        assert window == union(expected, other)
+    assert_window_almost_equals(windows.union(), union(WINDOWS))
+
+
+def test_window_array_crop():
+    """Cropped windows match those of Windows."""
+    windows = WindowArray.from_windows(WINDOWS)
+    assert windows.crop(718, 791).tolist() == [crop(w, 718, 791) for w in WINDOWS]
+
+
+def test_window_array_bounds_transform():
+    """Bounds and transforms match those of Windows."""
+    aff = Affine.rotation(10.0) * Affine(300.0, 0.0, 101985.0, 0.0, -300.0, 2826915.0)
+    windows = WindowArray.from_windows(WINDOWS)
+    for window_bounds, window in zip(windows.bounds(aff), WINDOWS):
+        assert tuple(window_bounds) == pytest.approx(bounds(window, aff))
+    for coeffs, window in zip(windows.transform(aff), WINDOWS):
+        assert Affine(*coeffs).almost_equals(transform(window, aff))
+
+
+def test_window_array_from_bounds():
+    """Windows from bounds match those of from_bounds()."""
+    aff = Affine(300.0, 0.0, 101985.0, 0.0, -300.0, 2826915.0)
+    lefts = [101985.0, 102585.0]
+    bottoms = [2816915.0, 2796915.0]
+    rights = [111985.0, 112585.0]
+    tops = [2826915.0, 2806915.0]
+    windows = WindowArray.from_bounds(lefts, bottoms, rights, tops, aff)
+    for window, args in zip(windows, zip(lefts, bottoms, rights, tops)):
+        assert_window_almost_equals(window, from_bounds(*args, transform=aff))
+    with pytest.raises(WindowError):
+        WindowArray.from_bounds(rights, bottoms, lefts, tops, aff)
+
+
+def test_window_array_rounding():
+    """Rounding matches that of Windows."""
+    windows = WindowArray.from_windows(WINDOWS)
+    assert windows.round_lengths().tolist() == [w.round_lengths() for w in WINDOWS]
+    assert windows.round_offsets().tolist() == [w.round_offsets() for w in WINDOWS]
+    assert windows.round(1).tolist() == [w.round(1) for w in WINDOWS]
+    assert windows.round().tolist() == [w.round() for w in WINDOWS]
+    for window in windows.round_lengths():
+        assert isinstance(window.width, int) and isinstance(window.height, int)
+    for window in windows.round_offsets():
+        assert isinstance(window.col_off, int) and isinstance(window.row_off, int)
+    for window in windows.round():
+        assert all(isinstance(value, int) for value in window.flatten())
+    assert windows.round_to_full_blocks((16, 32)).tolist() == [
+        round_window_to_full_blocks(w, [(16, 32)]) for w in WINDOWS
+    ]
+
+
+@pytest.mark.parametrize("window", [Window(10, 12, 3, 5), Window(0, 0, 4, 4)])
+def test_window_array_subdivide(window):
+    """Subdivision matches subdivide()."""
+    assert WindowArray.subdivide(window, 3, 2).tolist() == subdivide(window, 3, 2)
+
+
+def test_data_window(path_rgb_byte_tif):
+    """The data window of a dataset matches that of its array."""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        expected = get_data_window(src.read(masked=True))
+        assert data_window(src) == expected
+        assert data_window(src, indexes=1) == get_data_window(src.read(1, masked=True))
+
+
+def test_data_window_overviews(tmp_path, path_rgb_byte_tif):
+    """The data window is located in overviews first."""
+    with rasterio.open(path_rgb_byte_tif) as src:
+        profile = src.profile
+        data = src.read()
+    profile.update(tiled=True, blockxsize=64, blockysize=64)
+    path = tmp_path / "ovr.tif"
+    with rasterio.open(path, "w", **profile) as dst:
+        dst.write(data)
+    with rasterio.open(path, "r+") as dst:
+        dst.build_overviews([2, 4, 8])
+    with rasterio.open(path) as src:
+        expected = get_data_window(src.read(masked=True))
+        assert data_window(src) == expected
+        assert data_window(src, overviews=False) == expected
+
+
+def test_data_window_sparse(tmp_path):
+    """Empty tiles of sparse datasets are skipped."""
+    path = tmp_path / "sparse.tif"
+    with rasterio.open(
+        path,
+        "w",
+        driver="GTiff",
+        width=1024,
+        height=1024,
+        count=1,
+        dtype="uint8",
+        nodata=0,
+        tiled=True,
+        blockxsize=128,
+        blockysize=128,
+        sparse_ok=True,
+    ) as dst:
+        dst.write(np.ones((20, 50), dtype="uint8"), 1, window=Window(300, 500, 50, 20))
+    with rasterio.open(path) as src:
+        assert src._window_is_empty(1, Window(0, 0, 128, 128))
+        assert not src._window_is_empty(1, Window(256, 384, 128, 128))
+        assert data_window(src) == Window(300, 500, 50, 20)
+
+
+def test_data_window_all_valid(tmp_path):
+    """Datasets without masks are all data."""
+    path = tmp_path / "valid.tif"
+    with rasterio.open(
+        path, "w", driver="GTiff", width=20, height=10, count=1, dtype="uint8"
+    ) as dst:
+        dst.write(np.zeros((1, 10, 20), dtype="uint8"))
+    with rasterio.open(path) as src:
+        assert data_window(src) == Window(0, 0, 20, 10)
+
+
+def test_data_window_empty(tmp_path):
+    """Datasets without valid pixels have an empty data window."""
+    path = tmp_path / "empty.tif"
+    with rasterio.open(
+        path, "w", driver="GTiff", width=20, height=10, count=1, dtype="uint8", nodata=0
+    ) as dst:
+        dst.write(np.zeros((1, 10, 20), dtype="uint8"))
+    with rasterio.open(path) as src:
+        assert data_window(src) == Window(0, 0, 0, 0)